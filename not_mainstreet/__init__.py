@@ -1,30 +1,58 @@
 """Executable integration primitives for Not MainStreet."""
 
+from .api_transport import FeigenbuamApiPublisher, HTTPConnectionPool, KantianApiPublisher
 from .canonicalization import canonicalize_cdm, cdm_hash
 from .cdm import CDMRecord, CDMRegistry
 from .coordination import ContinuityConstraint, validate_continuity
 from .database import EngineDatabases, initialize_databases, run_query
-from .docx_ingest import IngestedDocx, extract_docx_text, ingest_docx
+from .docx_ingest import (
+    IngestedDocx,
+    extract_docx_text,
+    extract_docx_text_path,
+    extract_docx_text_zip,
+    ingest_docx,
+    ingest_docx_path,
+    open_docx_mmap,
+)
+from .docx_media import MediaExtraction, attach_assets, extract_docx_media
+from .docx_parser import PARSER_VERSION, parse_docx, parse_docx_path, parse_docx_zip
+from .docx_upload import DocxUpload, ingest_docx_upload
 from .edge_proposal import EdgeProposal, GateResults, IntakeEvaluation, What, When, Where, Who, Why, build_edge_proposal
 from .empathy_engine import EmpathyResponse, empathy_reflection
 from .event_spine import EventSpine
 from .governance import SovereigntyContext, sovereignty_weight
+from .git_publisher import GitCommit, GitPublisher
 from .graphs import LaplacianDiagnostics, l_diag
-from .location_privacy import DensityCertificate, GridCell, build_density_certificate, cell_commitment, quantize_location
+from .location_privacy import (
+    DensityCertificate,
+    DensityIndex,
+    DensityIndexes,
+    GridCell,
+    build_density_certificate,
+    build_density_certificates,
+    cell_commitment,
+    quantize_location,
+)
+from .matching import MatchCandidate, ProposalMatcher
 from .nodes import NodeRecord, NodeState, TRANSITIONS
 from .openclaw_bridge import LocalPurpleMechanism, OpenClawBridge, RefinementProposal, UserContext
-from .orchestrator import Orchestrator, PublishResult
+from .orchestrator import BatchPublishStats, Orchestrator, PublishResult, TargetStatus
 from .portal import (
     Submission,
     list_edge_intake,
+    list_proposals_by_status,
     list_unprocessed,
+    proposal_history,
     render_portal_html,
     submit_edge_intake,
     submit_to_portal,
     sync_submission_to_engine,
+    transition_proposal_status,
 )
 from .portal_server import PortalServerConfig, run_portal_server
+from .publish_queue import PublishJob, PublishQueue, PublishWorkerPool
 from .philosophy_runtime import CycleOutcome, Proposal, run_cycle
+from .search import SearchHit, SearchIndex
 
 __all__ = [
     "canonicalize_cdm",
@@ -38,7 +66,20 @@ __all__ = [
     "run_query",
     "IngestedDocx",
     "extract_docx_text",
+    "extract_docx_text_path",
+    "extract_docx_text_zip",
     "ingest_docx",
+    "ingest_docx_path",
+    "open_docx_mmap",
+    "MediaExtraction",
+    "attach_assets",
+    "extract_docx_media",
+    "PARSER_VERSION",
+    "parse_docx",
+    "parse_docx_path",
+    "parse_docx_zip",
+    "DocxUpload",
+    "ingest_docx_upload",
     "Who",
     "Why",
     "What",
@@ -53,13 +94,20 @@ __all__ = [
     "EventSpine",
     "SovereigntyContext",
     "sovereignty_weight",
+    "GitCommit",
+    "GitPublisher",
     "LaplacianDiagnostics",
     "l_diag",
     "DensityCertificate",
     "GridCell",
     "build_density_certificate",
+    "build_density_certificates",
+    "DensityIndex",
+    "DensityIndexes",
     "cell_commitment",
     "quantize_location",
+    "MatchCandidate",
+    "ProposalMatcher",
     "NodeRecord",
     "NodeState",
     "TRANSITIONS",
@@ -67,8 +115,18 @@ __all__ = [
     "RefinementProposal",
     "LocalPurpleMechanism",
     "OpenClawBridge",
+    "FeigenbuamApiPublisher",
+    "HTTPConnectionPool",
+    "KantianApiPublisher",
+    "BatchPublishStats",
     "Orchestrator",
     "PublishResult",
+    "TargetStatus",
+    "PublishJob",
+    "PublishQueue",
+    "PublishWorkerPool",
+    "SearchHit",
+    "SearchIndex",
     "Submission",
     "list_unprocessed",
     "render_portal_html",
@@ -76,6 +134,9 @@ __all__ = [
     "submit_edge_intake",
     "list_edge_intake",
     "sync_submission_to_engine",
+    "list_proposals_by_status",
+    "proposal_history",
+    "transition_proposal_status",
     "PortalServerConfig",
     "run_portal_server",
     "CycleOutcome",
@@ -1,3 +1,4 @@
 from . import feigenbuam, kantian_ivi
+from ._writer import ArtifactWriter
 
-__all__ = ["feigenbuam", "kantian_ivi"]
+__all__ = ["ArtifactWriter", "feigenbuam", "kantian_ivi"]
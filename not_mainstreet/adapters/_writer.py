@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+import os
+import secrets
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+
+def _open_temp(target: Path) -> tuple[int, str]:
+    """Create a unique temp file next to ``target`` with the mode a plain ``open()`` would give it."""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_CLOEXEC", 0)
+    while True:
+        tmp = os.path.join(target.parent, f".{target.name}.{secrets.token_hex(6)}.tmp")
+        try:
+            return os.open(tmp, flags, 0o666), tmp
+        except FileExistsError:
+            continue
+
+
+class ArtifactWriter:
+    """Writes adapter JSON artifacts compactly and atomically.
+
+    Each artifact is encoded into a temp file next to its destination, fsynced
+    and renamed over it, so readers see either the previous artifact or the new
+    one, never a truncated file. The writer remembers the ``cdm_hash`` last
+    written to each path together with the file's size and mtime; publishing the
+    same hash to the same path again costs one ``stat`` and is skipped only while
+    the file on disk is still the one it wrote.
+    """
+
+    def __init__(self, *, indent: int | None = None) -> None:
+        self.indent = indent
+        separators = (",", ":") if indent is None else (",", ": ")
+        self._encoder = json.JSONEncoder(indent=indent, separators=separators, ensure_ascii=False)
+        self._written: dict[str, tuple[str, int, int]] = {}  # path -> (cdm_hash, size, mtime_ns)
+        self._lock = threading.Lock()
+        self.writes = 0
+        self.skipped = 0
+
+    def is_current(self, path: str | os.PathLike[str], cdm_hash: str) -> bool:
+        key = os.fspath(path)
+        with self._lock:
+            written = self._written.get(key)
+        if written is None or written[0] != cdm_hash:
+            return False
+        try:
+            stat = os.stat(key)
+        except FileNotFoundError:
+            return False
+        return (stat.st_size, stat.st_mtime_ns) == written[1:]
+
+    def write(
+        self,
+        path: str | os.PathLike[str],
+        document: dict[str, Any] | Callable[[], dict[str, Any]],
+        cdm_hash: str,
+    ) -> bool:
+        """Write ``document`` to ``path`` unless ``cdm_hash`` is already there; returns whether it wrote.
+
+        ``document`` may be a zero-argument callable so a skipped write never builds it.
+        """
+        key = os.fspath(path)
+        if self.is_current(key, cdm_hash):
+            with self._lock:
+                self.skipped += 1
+            return False
+
+        target = Path(key)
+        # The C encoder only runs for one-shot encodes, which beats iterencode's
+        # pure-Python path by a wide margin even though the text is built in memory.
+        data = self._encoder.encode(document() if callable(document) else document).encode("utf-8")
+        try:
+            fd, tmp = _open_temp(target)
+        except FileNotFoundError:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = _open_temp(target)
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+                fh.flush()
+                os.fsync(fh.fileno())
+            os.replace(tmp, target)
+            stat = os.stat(target)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+        with self._lock:
+            self._written[key] = (cdm_hash, stat.st_size, stat.st_mtime_ns)
+            self.writes += 1
+        return True
+
+    def forget(self, path: str | os.PathLike[str] | None = None) -> None:
+        """Drop remembered hashes (all, or for one path) after artifacts change out of band."""
+        with self._lock:
+            if path is None:
+                self._written.clear()
+            else:
+                self._written.pop(os.fspath(path), None)
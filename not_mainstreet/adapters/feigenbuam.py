@@ -1,21 +1,184 @@
 from __future__ import annotations
 
-import json
+import hashlib
+from functools import partial
 from pathlib import Path
+from typing import Any, Iterable, Iterator, MutableMapping
 
-from ..cdm import CDMRecord
+from ..cdm import CDMRecord, CDMRegistry
+from ._writer import ArtifactWriter
 
 
-def publish_git(record: CDMRecord, root: str = "index/documents") -> str:
-    Path(root).mkdir(parents=True, exist_ok=True)
-    path = Path(root) / f"{record.document_id}-{record.version}.json"
-    path.write_text(json.dumps({
+# Approximate token budget per chunk; tokens are whitespace-separated words.
+MAX_CHUNK_TOKENS = 256
+
+
+def _block_text(block: dict[str, Any]) -> str:
+    kind = block.get("type")
+    if kind == "list":
+        return "\n".join(block.get("items", []))
+    if kind == "table":
+        return "\n".join(" | ".join(row) for row in block.get("table", {}).get("rows", []))
+    if kind == "image":
+        return block.get("image", {}).get("alt", "")
+    return block.get("text", "")
+
+
+def _block_links(block: dict[str, Any]) -> list[str]:
+    return [run["href"] for run in block.get("runs", []) if run.get("href")]
+
+
+def _split_words(words: list[str], limit: int) -> Iterator[list[str]]:
+    for offset in range(0, len(words), limit):
+        yield words[offset:offset + limit]
+
+
+def chunk_cdm(payload: dict[str, Any], max_tokens: int = MAX_CHUNK_TOKENS) -> list[dict[str, Any]]:
+    """Split CDM blocks into heading-aligned chunks of at most ``max_tokens`` words.
+
+    Every heading starts a new chunk, and a chunk never spans two sections.
+    ``chunk_id`` is a hash of the heading path and chunk text, so it survives
+    edits elsewhere in the document; identical chunks get an ordinal suffix.
+    """
+
+    chunks: list[dict[str, Any]] = []
+    path: list[tuple[int, str]] = []
+    anchor: str | None = None
+    pending: dict[str, Any] = {"words": [], "blocks": [], "links": []}
+    seen: dict[str, int] = {}
+
+    def flush() -> None:
+        if not pending["words"]:
+            pending["blocks"], pending["links"] = [], []
+            return
+        heading_path = [text for _, text in path]
+        text = " ".join(pending["words"])
+        digest = hashlib.sha256("\x1f".join([*heading_path, text]).encode("utf-8")).hexdigest()[:24]
+        seen[digest] = seen.get(digest, 0) + 1
+        chunk = {
+            "chunk_id": digest if seen[digest] == 1 else f"{digest}-{seen[digest]}",
+            "heading_path": heading_path,
+            "anchor": anchor,
+            "block_ids": pending["blocks"],
+            "text": text,
+            "tokens": len(pending["words"]),
+        }
+        if pending["links"]:
+            chunk["links"] = pending["links"]
+        chunks.append(chunk)
+        pending["words"], pending["blocks"], pending["links"] = [], [], []
+
+    for block in payload.get("content", {}).get("blocks", []):
+        if block.get("type") == "heading":
+            flush()
+            level = int(block.get("heading_level") or 1)
+            while path and path[-1][0] >= level:
+                path.pop()
+            path.append((level, block.get("text", "")))
+            anchor = block.get("anchor")
+            continue
+
+        words = _block_text(block).split()
+        if not words:
+            continue
+        if len(pending["words"]) + len(words) > max_tokens:
+            flush()
+        for i, piece in enumerate(_split_words(words, max_tokens)):
+            if i:
+                flush()
+            pending["words"].extend(piece)
+            if block.get("block_id"):
+                pending["blocks"].append(block["block_id"])
+        pending["links"].extend(_block_links(block))
+    flush()
+    return chunks
+
+
+def artifact(record: CDMRecord, previous: CDMRecord | None = None) -> dict[str, Any]:
+    """Search payload; with ``previous``, only chunks that changed since it are carried."""
+    metadata = record.payload.get("metadata", {})
+    chunks = chunk_cdm(record.payload)
+    manifest = [chunk["chunk_id"] for chunk in chunks]
+    search: dict[str, Any] = {
+        "title": metadata.get("title", ""),
+        "tags": metadata.get("tags", []),
+        "manifest": manifest,
+    }
+    if metadata.get("summary"):
+        search["summary"] = metadata["summary"]
+
+    if previous is None:
+        search["chunks"] = chunks
+        search["removed"] = []
+    else:
+        before = {chunk["chunk_id"] for chunk in chunk_cdm(previous.payload)}
+        current = set(manifest)
+        search["base_version"] = previous.version
+        search["chunks"] = [chunk for chunk in chunks if chunk["chunk_id"] not in before]
+        search["removed"] = sorted(before - current)
+
+    return {
         "document_id": record.document_id,
         "version": record.version,
         "cdm_hash": record.cdm_hash,
-        "search": {
-            "title": record.payload.get("metadata", {}).get("title", ""),
-            "tags": record.payload.get("metadata", {}).get("tags", []),
-        },
-    }, indent=2, ensure_ascii=False))
-    return str(path)
+        "search": search,
+    }
+
+
+def previous_version(
+    record: CDMRecord, history: CDMRegistry | None, published: MutableMapping[str, int] | None = None
+) -> CDMRecord | None:
+    """Delta base for ``record``: the newest earlier version confirmed published to this target.
+
+    ``published`` maps document id to that version. When it is unknown (no map,
+    nothing confirmed yet, or the version is gone from ``history``) there is no
+    base and the artifact carries the full chunk set.
+    """
+    if history is None or published is None:
+        return None
+    version = published.get(record.document_id)
+    if version is None or version >= record.version:
+        return None
+    return history.get(record.document_id, version)
+
+
+def confirm(published: MutableMapping[str, int] | None, records: Iterable[CDMRecord]) -> None:
+    """Record ``records`` as published so later versions can be sent as deltas against them."""
+    if published is None:
+        return
+    for record in records:
+        if record.version > published.get(record.document_id, 0):
+            published[record.document_id] = record.version
+
+
+def artifact_path(record: CDMRecord, root: str = "index/documents") -> Path:
+    return Path(root) / f"{record.document_id}-{record.version}.json"
+
+
+def publish_git(
+    record: CDMRecord,
+    root: str = "index/documents",
+    *,
+    writer: ArtifactWriter | None = None,
+    history: CDMRegistry | None = None,
+    published: MutableMapping[str, int] | None = None,
+) -> str:
+    return publish_git_many([record], root, writer=writer, history=history, published=published)[0]
+
+
+def publish_git_many(
+    records: Iterable[CDMRecord],
+    root: str = "index/documents",
+    *,
+    writer: ArtifactWriter | None = None,
+    history: CDMRegistry | None = None,
+    published: MutableMapping[str, int] | None = None,
+) -> list[str]:
+    writer = writer or ArtifactWriter()
+    paths = []
+    for record in records:
+        path = artifact_path(record, root)
+        writer.write(path, partial(artifact, record, previous_version(record, history, published)), record.cdm_hash)
+        confirm(published, [record])
+        paths.append(str(path))
+    return paths
@@ -1,18 +1,39 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
+from typing import Any, Iterable
 
 from ..cdm import CDMRecord
+from ._writer import ArtifactWriter
 
 
-def publish_git(record: CDMRecord, root: str = "content/docs") -> str:
-    Path(root).mkdir(parents=True, exist_ok=True)
-    path = Path(root) / f"{record.document_id}.json"
-    path.write_text(json.dumps({
+def artifact(record: CDMRecord) -> dict[str, Any]:
+    return {
         "document_id": record.document_id,
         "version": record.version,
         "cdm_hash": record.cdm_hash,
         "payload": record.payload,
-    }, indent=2, ensure_ascii=False))
-    return str(path)
+    }
+
+
+def artifact_path(record: CDMRecord, root: str = "content/docs") -> Path:
+    return Path(root) / f"{record.document_id}.json"
+
+
+def publish_git(record: CDMRecord, root: str = "content/docs", *, writer: ArtifactWriter | None = None) -> str:
+    return publish_git_many([record], root, writer=writer)[0]
+
+
+def publish_git_many(
+    records: Iterable[CDMRecord],
+    root: str = "content/docs",
+    *,
+    writer: ArtifactWriter | None = None,
+) -> list[str]:
+    writer = writer or ArtifactWriter()
+    paths = []
+    for record in records:
+        path = artifact_path(record, root)
+        writer.write(path, artifact(record), record.cdm_hash)
+        paths.append(str(path))
+    return paths
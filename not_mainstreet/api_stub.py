@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import json
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import unquote, urlparse
+
+
+class ApiStubState:
+    """In-memory stand-in for the ``kantian-ivi`` and ``feigenbuam`` APIs."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.documents: dict[str, dict[str, Any]] = {}
+        self.index: dict[str, dict[str, Any]] = {}
+        self.responses: dict[str, tuple[int, dict[str, Any]]] = {}  # Idempotency-Key -> replayed response
+        self.requests = 0
+        self.connections = 0
+        self._failures: list[int] = []
+
+    def fail_next(self, count: int = 1, status: int = 503) -> None:
+        with self.lock:
+            self._failures.extend([status] * count)
+
+    def next_failure(self) -> int | None:
+        with self.lock:
+            return self._failures.pop(0) if self._failures else None
+
+
+class ApiStubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive unless the client asks to close
+    # Headers and body go out in separate writes; without TCP_NODELAY the second
+    # one waits on the client's delayed ACK (~40 ms) on every kept-alive request.
+    disable_nagle_algorithm = True
+    state: ApiStubState
+
+    def setup(self) -> None:
+        super().setup()
+        with self.state.lock:
+            self.state.connections += 1
+
+    def _send_json(self, payload: dict, code: int = 200) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self) -> dict | None:
+        length = int(self.headers.get("Content-Length", "0"))
+        data = self.rfile.read(length) if length else b""
+        try:
+            body = json.loads(data.decode("utf-8")) if data else None
+        except ValueError:
+            return None
+        return body if isinstance(body, dict) else None
+
+    def _dispatch(self, method: str) -> None:
+        state = self.state
+        with state.lock:
+            state.requests += 1
+        body = self._read_json() if method in ("POST", "PUT") else None
+        failure = state.next_failure()
+        if failure is not None:
+            self._send_json({"error": "injected_failure"}, code=failure)
+            return
+
+        key = self.headers.get("Idempotency-Key")
+        if key:
+            with state.lock:
+                replay = state.responses.get(key)
+            if replay is not None:
+                self._send_json(replay[1], code=replay[0])
+                return
+
+        code, payload = self._handle(method, urlparse(self.path).path, body)
+        if key and code < 500:
+            with state.lock:
+                state.responses[key] = (code, payload)
+        self._send_json(payload, code=code)
+
+    def _handle(self, method: str, path: str, body: dict | None) -> tuple[int, dict[str, Any]]:
+        state = self.state
+        if method in ("POST", "PUT") and body is None:
+            return HTTPStatus.BAD_REQUEST, {"error": "invalid_json"}
+
+        if path == "/documents" and method == "POST":
+            document_id = body.get("document_id")
+            if not document_id or "payload" not in body:
+                return HTTPStatus.UNPROCESSABLE_ENTITY, {"error": "document_id and payload required"}
+            with state.lock:
+                if document_id in state.documents:
+                    return HTTPStatus.CONFLICT, {"error": "exists", "document_id": document_id}
+                state.documents[document_id] = body
+            return HTTPStatus.CREATED, {"document_id": document_id, "version": body.get("version")}
+
+        if path.startswith("/documents/"):
+            document_id = unquote(path[len("/documents/"):])
+            if method == "PUT":
+                if body.get("document_id") != document_id:
+                    return HTTPStatus.UNPROCESSABLE_ENTITY, {"error": "document_id mismatch"}
+                with state.lock:
+                    state.documents[document_id] = body
+                return HTTPStatus.OK, {"document_id": document_id, "version": body.get("version")}
+            if method == "GET":
+                with state.lock:
+                    doc = state.documents.get(document_id)
+                return (HTTPStatus.OK, doc) if doc else (HTTPStatus.NOT_FOUND, {"error": "not_found"})
+
+        if path == "/index/_bulk" and method == "POST":
+            results = []
+            with state.lock:
+                for item in body.get("items", []):
+                    if not item.get("document_id") or "version" not in item:
+                        results.append({"status": "rejected", "error": "document_id and version required"})
+                        continue
+                    doc_key = f"{item['document_id']}-{item['version']}"
+                    status = "noop" if state.index.get(doc_key, {}).get("cdm_hash") == item.get("cdm_hash") else "upserted"
+                    state.index[doc_key] = item
+                    results.append({"id": doc_key, "status": status})
+            return HTTPStatus.OK, {"items": results}
+
+        return HTTPStatus.NOT_FOUND, {"error": "not_found"}
+
+    def do_GET(self) -> None:  # noqa: N802
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:  # noqa: N802
+        self._dispatch("POST")
+
+    def do_PUT(self) -> None:  # noqa: N802
+        self._dispatch("PUT")
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A003
+        return
+
+
+def run_api_stub(host: str = "127.0.0.1", port: int = 0) -> tuple[ThreadingHTTPServer, ApiStubState]:
+    """Serve the stub in a daemon thread; the base URL is ``http://host:server.server_port``."""
+    state = ApiStubState()
+    handler = type("ConfiguredApiStubHandler", (ApiStubHandler,), {"state": state})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, name="api-stub", daemon=True).start()
+    return server, state
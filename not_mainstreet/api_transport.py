@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import hashlib
+import http.client
+import json
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+from typing import Any, Iterable, MutableMapping
+from urllib.parse import quote, urlsplit
+
+from .adapters import feigenbuam, kantian_ivi
+from .cdm import CDMRecord, CDMRegistry
+from .errors import ContractError, TransportError
+
+
+# Errors raised when a pooled keep-alive connection was closed by the server
+# between requests; the request is re-sent once on a fresh connection.
+_STALE = (http.client.RemoteDisconnected, http.client.CannotSendRequest, BrokenPipeError, ConnectionResetError)
+# Client-side statuses that mean "not now" rather than "never": retried like 5xx.
+_RETRYABLE_4XX = frozenset({HTTPStatus.REQUEST_TIMEOUT, HTTPStatus.TOO_MANY_REQUESTS})
+
+
+def retry_after_s(value: str | None, *, now: float | None = None) -> float | None:
+    """Parse a ``Retry-After`` header (delta-seconds or HTTP-date) into seconds from now."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when - (time.time() if now is None else now))
+
+
+@dataclass(frozen=True)
+class ApiResponse:
+    status: int
+    body: dict[str, Any]
+
+
+class HTTPConnectionPool:
+    """Keep-alive HTTP/1.1 connections to one target, reused across threads."""
+
+    def __init__(self, base_url: str, *, size: int = 4, timeout: float = 10.0, keep_alive: bool = True) -> None:
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"unsupported target url {base_url!r}")
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port
+        self.prefix = parts.path.rstrip("/")
+        self.timeout = timeout
+        self.keep_alive = keep_alive
+        self._idle: queue.LifoQueue[http.client.HTTPConnection] = queue.LifoQueue(maxsize=size)
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+        self.requests_sent = 0
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        cls = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+        with self._lock:
+            self.connections_opened += 1
+        return cls(self.host, self.port, timeout=self.timeout)
+
+    def _checkout(self) -> tuple[http.client.HTTPConnection, bool]:
+        try:
+            return self._idle.get_nowait(), True
+        except queue.Empty:
+            return self._new_connection(), False
+
+    def _checkin(self, conn: http.client.HTTPConnection) -> None:
+        if not self.keep_alive:
+            conn.close()
+            return
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        payload: Any = None,
+        headers: dict[str, str] | None = None,
+        *,
+        accept: Iterable[int] = (),
+    ) -> ApiResponse:
+        """Send one request; 4xx/5xx raise unless listed in ``accept``."""
+        body = None if payload is None else json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        send_headers = {"Accept": "application/json", **(headers or {})}
+        if body is not None:
+            send_headers["Content-Type"] = "application/json"
+        if not self.keep_alive:
+            send_headers["Connection"] = "close"
+
+        conn, reused = self._checkout()
+        while True:
+            try:
+                conn.request(method, self.prefix + path, body=body, headers=send_headers)
+                response = conn.getresponse()
+                data = response.read()
+                break
+            except _STALE as exc:
+                conn.close()
+                if not reused:
+                    raise TransportError(f"{method} {path}: {exc}") from exc
+                conn, reused = self._new_connection(), False
+            except (OSError, http.client.HTTPException) as exc:
+                conn.close()
+                raise TransportError(f"{method} {path}: {exc}") from exc
+
+        with self._lock:
+            self.requests_sent += 1
+        if response.will_close:
+            conn.close()
+        else:
+            self._checkin(conn)
+
+        try:
+            parsed = json.loads(data) if data else {}
+        except ValueError:
+            parsed = {"raw": data.decode("utf-8", errors="replace")}
+        if response.status in accept:
+            return ApiResponse(status=response.status, body=parsed)
+        if response.status >= 500 or response.status in _RETRYABLE_4XX:
+            raise TransportError(
+                f"{method} {path}: HTTP {response.status} {parsed}",
+                retry_after_s=retry_after_s(response.getheader("Retry-After")),
+            )
+        if response.status >= 400:
+            raise ContractError(f"{method} {path}: HTTP {response.status} {parsed}")
+        return ApiResponse(status=response.status, body=parsed)
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+def idempotency_key(record: CDMRecord) -> str:
+    return f"{record.document_id}:{record.version}:{record.cdm_hash}"
+
+
+class KantianApiPublisher:
+    """``POST /documents`` for first versions, ``PUT /documents/{id}`` afterwards (spec 9.3).
+
+    A 409 on the first-version POST means an earlier attempt whose response was
+    lost already created the document, so a replayed create counts as published.
+    """
+
+    def __init__(self, pool: HTTPConnectionPool) -> None:
+        self.pool = pool
+
+    def __call__(self, record: CDMRecord) -> str:
+        headers = {"Idempotency-Key": idempotency_key(record)}
+        location = f"/documents/{quote(record.document_id, safe='')}"
+        if record.version == 1:
+            self.pool.request("POST", "/documents", kantian_ivi.artifact(record), headers, accept=(HTTPStatus.CONFLICT,))
+        else:
+            self.pool.request("PUT", location, kantian_ivi.artifact(record), headers)
+        return location
+
+    def publish_many(self, records: Iterable[CDMRecord]) -> list[str]:
+        return [self(record) for record in records]
+
+
+class FeigenbuamApiPublisher:
+    """Bulk upsert into the search index, ``bulk_size`` documents per request (spec 10.3).
+
+    Every item carries its own idempotency key and each request carries a key
+    derived from its items, so a retried request is recognised server-side.
+    Items are chunk deltas against the last version confirmed in ``published``
+    (updated once a request succeeds), or full chunk sets when there is none.
+    """
+
+    def __init__(
+        self,
+        pool: HTTPConnectionPool,
+        *,
+        bulk_size: int = 500,
+        history: CDMRegistry | None = None,
+        published: MutableMapping[str, int] | None = None,
+    ) -> None:
+        self.pool = pool
+        self.bulk_size = max(1, bulk_size)
+        self.history = history
+        self.published = published
+
+    def __call__(self, record: CDMRecord) -> str:
+        return self.publish_many([record])[0]
+
+    def _artifact(self, record: CDMRecord) -> dict[str, Any]:
+        return feigenbuam.artifact(record, feigenbuam.previous_version(record, self.history, self.published))
+
+    def publish_many(self, records: Iterable[CDMRecord]) -> list[str]:
+        records = list(records)
+        paths = []
+        for offset in range(0, len(records), self.bulk_size):
+            chunk = records[offset:offset + self.bulk_size]
+            keys = [idempotency_key(r) for r in chunk]
+            request_key = hashlib.sha256("\n".join(keys).encode("utf-8")).hexdigest()
+            response = self.pool.request(
+                "POST",
+                "/index/_bulk",
+                {"items": [{"idempotency_key": k, **self._artifact(r)} for k, r in zip(keys, chunk)]},
+                {"Idempotency-Key": request_key},
+            )
+            rejected = [item for item in response.body.get("items", []) if item.get("status") == "rejected"]
+            if rejected:
+                raise ContractError(f"bulk upsert rejected {len(rejected)} item(s): {rejected[0]}")
+            feigenbuam.confirm(self.published, chunk)
+            paths.extend(f"/index/{quote(r.document_id, safe='')}-{r.version}" for r in chunk)
+        return paths
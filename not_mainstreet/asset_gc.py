@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import os
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+from .assets import AssetStore
+from .cdm import CDMRegistry
+from .database import run_many
+
+
+DEFAULT_GRACE_SECONDS = 24 * 60 * 60
+# Cursor key for objects still in the flat layout (``root/<digest>``); sorts before every shard.
+FLAT_LAYOUT_KEY = "."
+_DIGEST = re.compile(r"[0-9a-f]{64}")
+
+
+@dataclass
+class GCReport:
+    scanned: int = 0
+    deleted: int = 0
+    reclaimed_bytes: int = 0
+    retained_live: int = 0
+    retained_in_grace: int = 0
+    spool_files_removed: int = 0
+    cursor: str | None = None
+    complete: bool = False
+
+
+def live_asset_ids(registry: CDMRegistry) -> set[str]:
+    """Mark phase: every asset referenced by any retained CDM version, including its source upload."""
+    live: set[str] = set()
+    for record in registry.records():
+        payload: dict[str, Any] = record.payload
+        source = (payload.get("provenance") or {}).get("source_asset_id")
+        if source:
+            live.add(source)
+        for asset in payload.get("assets", []) or []:
+            if asset.get("asset_id"):
+                live.add(asset["asset_id"])
+        for block in payload.get("content", {}).get("blocks", []) or []:
+            asset_id = (block.get("image") or {}).get("asset_id")
+            if asset_id:
+                live.add(asset_id)
+    return live
+
+
+def _leaf_dirs(store: AssetStore, after: str | None) -> Iterable[tuple[str, str]]:
+    if after is None:
+        yield FLAT_LAYOUT_KEY, str(store.root)
+    for top in sorted(e.name for e in os.scandir(store.root) if e.is_dir() and len(e.name) == 2):
+        for leaf in sorted(e.name for e in os.scandir(store.root / top) if e.is_dir()):
+            key = f"{top}/{leaf}"
+            if after is None or key > after:
+                yield key, str(store.root / top / leaf)
+
+
+def _unlink_if_stale(store: AssetStore, path: str, name: str, cutoff: float) -> bool:
+    store.spool_dir.mkdir(exist_ok=True)
+    doomed = str(store.spool_dir / f"gc-{name}")
+    os.rename(path, doomed)
+    if os.stat(doomed).st_mtime > cutoff:  # touched between the scan and the rename
+        os.rename(doomed, path)
+        return False
+    os.unlink(doomed)
+    return True
+
+
+def collect_garbage(
+    store: AssetStore,
+    registry: CDMRegistry,
+    *,
+    retain: Iterable[str] = (),
+    grace_seconds: float = DEFAULT_GRACE_SECONDS,
+    batch_size: int = 10_000,
+    resume_from: str | None = None,
+    now: float | None = None,
+) -> GCReport:
+    """Sweep unreferenced objects out of ``store`` one shard directory at a time.
+
+    The live set is built from ``registry`` (asset references and each
+    version's ``provenance.source_asset_id``) plus ``retain``. Objects still in
+    the flat pre-sharding layout are swept first. The sweep stops after
+    roughly ``batch_size`` objects and returns a ``cursor`` to pass back as
+    ``resume_from``; only one shard listing is held in memory at a time.
+
+    Objects modified within ``grace_seconds`` are never deleted. ``put``/``adopt``
+    refresh the mtime of deduplicated objects, so a digest being re-referenced by
+    a concurrent upload survives the sweep that races it. A candidate is first
+    renamed into the spool directory and its mtime checked again: a refresh that
+    landed before the rename puts it back, and one after it finds no object, so
+    the uploader writes it again.
+    """
+
+    live = live_asset_ids(registry) | set(retain)
+    cutoff = (time.time() if now is None else now) - grace_seconds
+    report = GCReport(cursor=resume_from)
+    deleted: list[str] = []
+
+    for key, leaf in _leaf_dirs(store, resume_from):
+        if report.scanned >= batch_size:
+            break
+        with os.scandir(leaf) as entries:
+            for entry in entries:
+                if not entry.is_file() or (key == FLAT_LAYOUT_KEY and not _DIGEST.fullmatch(entry.name)):
+                    continue
+                report.scanned += 1
+                if entry.name in live:
+                    report.retained_live += 1
+                    continue
+                stat = entry.stat()
+                if stat.st_mtime > cutoff:
+                    report.retained_in_grace += 1
+                    continue
+                try:
+                    swept = _unlink_if_stale(store, entry.path, entry.name, cutoff)
+                except FileNotFoundError:
+                    continue  # another sweeper got there first
+                if not swept:
+                    report.retained_in_grace += 1
+                    continue
+                store.evict(entry.name)
+                deleted.append(entry.name)
+                report.deleted += 1
+                report.reclaimed_bytes += stat.st_size
+        report.cursor = key
+    else:
+        report.complete = True
+
+    if report.complete and store.spool_dir.exists():
+        # Spool files left behind by crashed writers.
+        for entry in os.scandir(store.spool_dir):
+            stat = entry.stat()
+            if entry.is_file() and stat.st_mtime <= cutoff:
+                os.unlink(entry.path)
+                report.spool_files_removed += 1
+                report.reclaimed_bytes += stat.st_size
+
+    if deleted:
+        run_many(store.index_path, "DELETE FROM asset_metadata WHERE asset_id = ?", ((d,) for d in deleted))
+    return report
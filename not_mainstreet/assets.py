@@ -1,19 +1,237 @@
 from __future__ import annotations
 
 import hashlib
+import mmap
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
+from typing import IO, Iterable
+
+from .database import run_many, run_query
+
+
+@dataclass(frozen=True)
+class AssetRecord:
+    """Spec 6.2 metadata for one stored asset occurrence."""
+
+    asset_id: str
+    mime: str
+    size_bytes: int
+    source_location: str
+    extraction_status: str = "stored"
+
+
+_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS asset_metadata (
+    asset_id TEXT NOT NULL,
+    source_location TEXT NOT NULL,
+    mime TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    extraction_status TEXT NOT NULL,
+    PRIMARY KEY (asset_id, source_location)
+)
+"""
 
 
 class AssetStore:
-    """Filesystem-backed content-addressable asset store for local development."""
+    """Filesystem-backed content-addressable asset store for local development.
+
+    Objects live under a two-level fan-out (``ab/cd/abcd...``) so no directory
+    grows past a few thousand entries. Every write lands in ``tmp/`` first and is
+    renamed into place, so readers never observe a partially written object.
+    Small objects are served from a byte-bounded in-process LRU cache.
+    """
 
-    def __init__(self, root: str = "assets") -> None:
+    def __init__(
+        self,
+        root: str = "assets",
+        *,
+        cache_bytes: int = 32 * 1024 * 1024,
+        cache_item_bytes: int = 256 * 1024,
+    ) -> None:
         self.root = Path(root)
         self.root.mkdir(parents=True, exist_ok=True)
+        self.spool_dir = self.root / "tmp"
+        self.index_path = str(self.root / "index.db")
+        self.cache_bytes = cache_bytes
+        self.cache_item_bytes = min(cache_item_bytes, cache_bytes)
+        self._known: set[str] = set()
+        self._cache: OrderedDict[str, bytes] = OrderedDict()
+        self._cache_size = 0
+        self._cache_lock = threading.Lock()
+        self._mime: dict[str, str] = {}
+        run_query(self.index_path, _INDEX_SCHEMA)
+
+    def path_for(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest[2:4] / digest
+
+    def _locate(self, digest: str) -> Path | None:
+        path = self.path_for(digest)
+        if path.exists():
+            return path
+        legacy = self.root / digest  # flat layout used before sharding
+        return legacy if legacy.is_file() else None
+
+    def has(self, digest: str) -> bool:
+        if digest in self._known:
+            return True
+        if self._locate(digest) is None:
+            return False
+        self._known.add(digest)
+        return True
+
+    def touch(self, digest: str) -> bool:
+        """Refresh an object's mtime so a concurrent GC treats it as recently written.
+
+        Returns ``False`` when the object is gone (another process's GC may have
+        swept it since ``has`` last saw it), so the caller writes it again.
+        """
+        for path in (self.path_for(digest), self.root / digest):
+            try:
+                os.utime(path)
+                return True
+            except FileNotFoundError:
+                continue
+        self._known.discard(digest)
+        return False
 
     def put(self, content: bytes) -> str:
         digest = hashlib.sha256(content).hexdigest()
-        path = self.root / digest
-        if not path.exists():
-            path.write_bytes(content)
+        if not (self.has(digest) and self.touch(digest)):
+            with self.spool() as spool:
+                spool.write(content)
+            self.adopt(spool.name, digest)
         return digest
+
+    def put_stream(self, fileobj: IO[bytes], chunk_size: int = 1024 * 1024) -> str:
+        """Hash ``fileobj`` while spooling it, then rename it into place atomically."""
+        digest = hashlib.sha256()
+        spool = self.spool()
+        try:
+            with spool:
+                while chunk := fileobj.read(chunk_size):
+                    digest.update(chunk)
+                    spool.write(chunk)
+            return self.adopt(spool.name, digest.hexdigest())
+        except BaseException:
+            if os.path.exists(spool.name):
+                os.unlink(spool.name)
+            raise
+
+    def _cached(self, digest: str) -> bytes | None:
+        with self._cache_lock:
+            data = self._cache.get(digest)
+            if data is not None:
+                self._cache.move_to_end(digest)
+            return data
+
+    def _remember(self, digest: str, data: bytes) -> None:
+        with self._cache_lock:
+            if digest in self._cache:
+                return
+            self._cache[digest] = data
+            self._cache_size += len(data)
+            while self._cache_size > self.cache_bytes:
+                _, evicted = self._cache.popitem(last=False)
+                self._cache_size -= len(evicted)
+
+    def evict(self, digest: str) -> None:
+        """Forget cached state for ``digest`` (used when an object is deleted)."""
+        with self._cache_lock:
+            data = self._cache.pop(digest, None)
+            if data is not None:
+                self._cache_size -= len(data)
+        self._known.discard(digest)
+
+    def size(self, digest: str) -> int:
+        data = self._cached(digest)
+        if data is not None:
+            return len(data)
+        path = self._locate(digest)
+        if path is None:
+            raise KeyError(digest)
+        return path.stat().st_size
+
+    def get(self, digest: str) -> mmap.mmap | bytes:
+        """Return object bytes: cached ``bytes`` for small objects, else a read-only mmap."""
+        data = self._cached(digest)
+        if data is not None:
+            return data
+        path = self._locate(digest)
+        if path is None:
+            raise KeyError(digest)
+        with open(path, "rb") as fh:
+            size = os.fstat(fh.fileno()).st_size
+            if size <= self.cache_item_bytes:
+                data = fh.read()
+                self._remember(digest, data)
+                return data
+            return mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def open_range(self, digest: str, start: int, end: int | None = None) -> bytes:
+        """Read bytes ``[start, end)`` of an object without loading the rest."""
+        if start < 0 or (end is not None and end < start):
+            raise ValueError("invalid byte range")
+        data = self._cached(digest)
+        if data is not None:
+            return data[start:end]
+        path = self._locate(digest)
+        if path is None:
+            raise KeyError(digest)
+        with open(path, "rb") as fh:
+            fh.seek(start)
+            return fh.read(-1 if end is None else end - start)
+
+    def spool(self) -> IO[bytes]:
+        """Open a temp file on the store's filesystem for callers that hash while writing."""
+        self.spool_dir.mkdir(exist_ok=True)
+        return tempfile.NamedTemporaryFile(dir=self.spool_dir, prefix="spool-", delete=False)
+
+    def adopt(self, spool_path: str | os.PathLike[str], digest: str) -> str:
+        """Move a spooled file whose SHA-256 the caller already computed into place."""
+        if self.has(digest) and self.touch(digest):
+            os.unlink(spool_path)
+            return digest
+        path = self.path_for(digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Same-filesystem rename is atomic; a concurrent writer of the same digest
+        # replaces identical bytes.
+        os.replace(spool_path, path)
+        self._known.add(digest)
+        return digest
+
+    def record(self, records: Iterable[AssetRecord]) -> None:
+        run_many(
+            self.index_path,
+            """
+            INSERT OR IGNORE INTO asset_metadata
+            (asset_id, source_location, mime, size_bytes, extraction_status)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            ((r.asset_id, r.source_location, r.mime, r.size_bytes, r.extraction_status) for r in records),
+        )
+
+    def metadata(self, digest: str) -> list[AssetRecord]:
+        rows = run_query(
+            self.index_path,
+            """
+            SELECT asset_id, mime, size_bytes, source_location, extraction_status
+            FROM asset_metadata WHERE asset_id = ? ORDER BY source_location
+            """,
+            (digest,),
+        )
+        return [AssetRecord(**dict(r)) for r in rows]
+
+    def mime(self, digest: str) -> str:
+        """MIME type recorded for ``digest`` in the metadata index (memoized once recorded)."""
+        mime = self._mime.get(digest)
+        if mime is None:
+            records = self.metadata(digest)
+            if not records:
+                # Not cached: the metadata may be recorded after the bytes land.
+                return "application/octet-stream"
+            mime = self._mime[digest] = records[0].mime
+        return mime
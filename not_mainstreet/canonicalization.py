@@ -12,6 +12,9 @@ _STYLE_KEYS_TO_IGNORE = {
     "font_size",
     "color",
 }
+# Which stored upload a payload came from; byte-different uploads of the same
+# content must keep one cdm_hash.
+_UPLOAD_KEYS_TO_IGNORE = {"source_asset_id"}
 
 
 def _normalize_text(value: str) -> str:
@@ -33,7 +36,7 @@ def _canonicalize(obj: Any) -> Any:
     if isinstance(obj, dict):
         out: dict[str, Any] = {}
         for key in sorted(obj.keys()):
-            if key in _STYLE_KEYS_TO_IGNORE:
+            if key in _STYLE_KEYS_TO_IGNORE or key in _UPLOAD_KEYS_TO_IGNORE:
                 continue
             value = obj[key]
             if value is None:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable, Iterator
 
 from .canonicalization import cdm_hash
 
@@ -19,13 +19,36 @@ class CDMRegistry:
 
     def __init__(self) -> None:
         self._by_document: dict[str, list[CDMRecord]] = {}
+        self._listeners: list[Callable[[CDMRecord], None]] = []
+        # (record, error) for listener calls that raised; the registration itself stands.
+        self.listener_errors: list[tuple[CDMRecord, Exception]] = []
+
+    def subscribe(self, listener: Callable[[CDMRecord], None]) -> None:
+        """Call ``listener`` with every newly registered version (not idempotent re-registrations).
+
+        A listener that raises does not undo or fail the registration; the
+        error is kept in ``listener_errors`` so the caller can retry it.
+        """
+        self._listeners.append(listener)
 
     def latest(self, document_id: str) -> CDMRecord | None:
         rows = self._by_document.get(document_id, [])
         return rows[-1] if rows else None
 
-    def register(self, document_id: str, payload: dict[str, Any]) -> CDMRecord:
-        digest = cdm_hash(payload)
+    def get(self, document_id: str, version: int) -> CDMRecord | None:
+        rows = self._by_document.get(document_id, [])
+        # Versions are dense and start at 1, so the list index is the version.
+        if 1 <= version <= len(rows):
+            return rows[version - 1]
+        return None
+
+    def records(self) -> Iterator[CDMRecord]:
+        for rows in self._by_document.values():
+            yield from rows
+
+    def register(self, document_id: str, payload: dict[str, Any], *, digest: str | None = None) -> CDMRecord:
+        """Register ``payload``; ``digest`` may carry a ``cdm_hash`` computed elsewhere."""
+        digest = digest or cdm_hash(payload)
         latest = self.latest(document_id)
         if latest and latest.cdm_hash == digest:
             return latest
@@ -33,4 +56,9 @@ class CDMRegistry:
         next_version = 1 if latest is None else latest.version + 1
         record = CDMRecord(document_id=document_id, version=next_version, payload=payload, cdm_hash=digest)
         self._by_document.setdefault(document_id, []).append(record)
+        for listener in self._listeners:
+            try:
+                listener(record)
+            except Exception as exc:  # noqa: BLE001 - a listener must not fail a registration that happened
+                self.listener_errors.append((record, exc))
         return record
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
 import sqlite3
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
 
 @dataclass(frozen=True)
 class EngineDatabases:
     inside_path: str = "data/inside_ivi.db"
     outside_path: str = "data/outside_portal.db"
+    search_path: str = "data/search.db"
 
 
 def _connect(path: str) -> sqlite3.Connection:
@@ -78,6 +80,24 @@ def initialize_databases(cfg: EngineDatabases = EngineDatabases()) -> None:
     CREATE INDEX IF NOT EXISTS idx_edge_proposals_tenant_routing
       ON edge_proposals (tenant_id, routing_class);
 
+    -- Covers "proposals in status X by tenant" (newest first) without touching the row.
+    CREATE INDEX IF NOT EXISTS idx_edge_proposals_tenant_status
+      ON edge_proposals (tenant_id, status, updated_at DESC, proposal_id, proposal_version);
+
+    -- Append-only history; edge_proposals is the current state materialized from it.
+    CREATE TABLE IF NOT EXISTS edge_proposal_events (
+        event_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        proposal_id TEXT NOT NULL,
+        tenant_id TEXT NOT NULL,
+        proposal_version INTEGER NOT NULL,
+        event_type TEXT NOT NULL,
+        from_status TEXT,
+        to_status TEXT NOT NULL,
+        payload_json TEXT,
+        created_at TEXT NOT NULL,
+        UNIQUE (proposal_id, proposal_version)
+    );
+
     CREATE TABLE IF NOT EXISTS proposal_bridge (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
         submission_id INTEGER NOT NULL,
@@ -100,3 +120,26 @@ def run_query(path: str, sql: str, params: Iterable[object] = ()) -> list[sqlite
         rows = cur.fetchall()
         conn.commit()
         return rows
+
+
+def run_many(path: str, sql: str, rows: Iterable[Iterable[object]]) -> int:
+    with _connect(path) as conn:
+        cur = conn.executemany(sql, (tuple(r) for r in rows))
+        conn.commit()
+        return cur.rowcount
+
+
+@contextmanager
+def transaction(path: str, *, immediate: bool = False) -> Iterator[sqlite3.Connection]:
+    """One connection, committed on success; ``immediate`` takes the write lock up front."""
+    conn = _connect(path)
+    try:
+        if immediate:
+            conn.execute("BEGIN IMMEDIATE")
+        yield conn
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import os
+import signal
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from .canonicalization import cdm_hash
+from .docx_ingest import open_docx_mmap, sha256_chunked
+from .docx_parser import parse_docx_zip
+
+try:  # POSIX only; Windows workers run without an address-space cap.
+    import resource
+except ImportError:  # pragma: no cover - platform dependent
+    resource = None  # type: ignore[assignment]
+
+
+# Spec section 6.4 limits.
+MAX_DOCX_BYTES = 50 * 1024 * 1024
+TYPICAL_TIMEOUT_S = 30.0
+HARD_TIMEOUT_S = 120.0
+DEFAULT_MEMORY_LIMIT_MB = 1024
+
+
+@dataclass(frozen=True)
+class BatchIngestResult:
+    path: str
+    status: str  # ok|slow|timeout|too_large|error
+    checksum_sha256: str | None
+    cdm_hash: str | None
+    block_count: int
+    size_bytes: int
+    duration_s: float
+    error: str | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.status in {"ok", "slow"}
+
+
+@dataclass
+class BatchIngestStats:
+    files: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    bytes_in: int = 0
+    elapsed_s: float = 0.0
+    by_status: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def files_per_s(self) -> float:
+        return self.files / self.elapsed_s if self.elapsed_s else 0.0
+
+    @property
+    def mb_per_s(self) -> float:
+        return self.bytes_in / (1024 * 1024) / self.elapsed_s if self.elapsed_s else 0.0
+
+    def record(self, result: BatchIngestResult) -> None:
+        self.files += 1
+        self.bytes_in += result.size_bytes
+        self.by_status[result.status] = self.by_status.get(result.status, 0) + 1
+        if result.succeeded:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+
+
+class _HardTimeout(Exception):
+    pass
+
+
+def _raise_hard_timeout(signum: int, frame: object) -> None:
+    raise _HardTimeout()
+
+
+def _init_worker(memory_limit_mb: int | None) -> None:
+    if hasattr(signal, "setitimer"):
+        signal.signal(signal.SIGALRM, _raise_hard_timeout)
+    if resource is not None and memory_limit_mb:
+        limit = memory_limit_mb * 1024 * 1024
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _ingest_one(path: str, typical_timeout_s: float, hard_timeout_s: float) -> BatchIngestResult:
+    started = time.perf_counter()
+    size = 0
+
+    def result(
+        status: str,
+        *,
+        checksum: str | None = None,
+        digest: str | None = None,
+        blocks: int = 0,
+        error: str | None = None,
+    ) -> BatchIngestResult:
+        return BatchIngestResult(
+            path=path,
+            status=status,
+            checksum_sha256=checksum,
+            cdm_hash=digest,
+            block_count=blocks,
+            size_bytes=size,
+            duration_s=time.perf_counter() - started,
+            error=error,
+        )
+
+    armed = hasattr(signal, "setitimer")
+    if armed:
+        signal.setitimer(signal.ITIMER_REAL, hard_timeout_s)
+    try:
+        size = os.path.getsize(path)
+        if size > MAX_DOCX_BYTES:
+            return result("too_large", error=f"{size} bytes exceeds {MAX_DOCX_BYTES}")
+        with open_docx_mmap(path) as (mapping, zf):
+            checksum = sha256_chunked(mapping)
+            cdm = parse_docx_zip(zf, document_id=Path(path).stem)
+        cdm_digest = cdm_hash(cdm)
+    except _HardTimeout:
+        return result("timeout", error=f"exceeded hard timeout of {hard_timeout_s}s")
+    except MemoryError:
+        return result("error", error="worker memory limit exceeded")
+    except Exception as exc:  # noqa: BLE001 - every failure is reported per file
+        return result("error", error=f"{type(exc).__name__}: {exc}")
+    finally:
+        if armed:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+    elapsed = time.perf_counter() - started
+    return result(
+        "slow" if elapsed > typical_timeout_s else "ok",
+        checksum=checksum,
+        digest=cdm_digest,
+        blocks=len(cdm["content"]["blocks"]),
+    )
+
+
+def _parent_result(path: str, status: str, duration_s: float, error: str) -> BatchIngestResult:
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        size = 0
+    return BatchIngestResult(
+        path=path,
+        status=status,
+        checksum_sha256=None,
+        cdm_hash=None,
+        block_count=0,
+        size_bytes=size,
+        duration_s=duration_s,
+        error=error,
+    )
+
+
+def _new_pool(workers: int, memory_limit_mb: int | None) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(memory_limit_mb,))
+
+
+def _terminate_pool(pool: ProcessPoolExecutor) -> None:
+    """Kill the pool's workers outright; ``shutdown`` alone would wait on a wedged one."""
+    terminate = getattr(pool, "terminate_workers", None)  # Python 3.14+
+    if terminate is not None:
+        terminate()
+        return
+    processes = list((pool._processes or {}).values())
+    pool.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        if process.is_alive():
+            process.terminate()
+    for process in processes:
+        process.join()
+
+
+def ingest_docx_batch(
+    paths: Iterable[str | os.PathLike[str]],
+    *,
+    workers: int | None = None,
+    typical_timeout_s: float = TYPICAL_TIMEOUT_S,
+    hard_timeout_s: float = HARD_TIMEOUT_S,
+    memory_limit_mb: int | None = DEFAULT_MEMORY_LIMIT_MB,
+    stats: BatchIngestStats | None = None,
+) -> Iterator[BatchIngestResult]:
+    """Ingest and parse DOCX files on a process pool, yielding in completion order.
+
+    Each worker arms a hard timeout per file and runs under an address-space cap,
+    so one pathological document cannot stall or exhaust the whole backfill.
+    At most ``workers * 4`` files are in flight, keeping the parent's memory flat
+    regardless of how many paths are supplied.
+
+    The worker's alarm cannot interrupt a parser stuck inside C code, so the
+    parent also holds a deadline per running file. When one expires, or a worker
+    dies and breaks the pool, the pool is torn down, the overdue file is reported
+    and the other in-flight files are resubmitted to a fresh pool. Files that
+    were in flight when a pool broke are retried one at a time, so the one that
+    kills its worker is reported as an error without taking others with it.
+    """
+
+    workers = workers or os.cpu_count() or 1
+    stats = stats if stats is not None else BatchIngestStats()
+    started = time.perf_counter()
+    # The executor hands one call beyond ``workers`` to its queue early, so a
+    # file can look running for up to one hard timeout before it actually starts.
+    parent_timeout_s = 2 * hard_timeout_s
+    poll_s = min(1.0, hard_timeout_s / 4)
+    source = iter(paths)
+    retry: deque[str] = deque()
+    quarantine: deque[str] = deque()
+    pending: dict[Future[BatchIngestResult], str] = {}
+    running_since: dict[Future[BatchIngestResult], float] = {}
+
+    def fill() -> None:
+        if quarantine:
+            if not pending:
+                path = quarantine.popleft()
+                pending[pool.submit(_ingest_one, path, typical_timeout_s, hard_timeout_s)] = path
+            return
+        while len(pending) < workers * 4:
+            if retry:
+                path = retry.popleft()
+            else:
+                next_path = next(source, None)
+                if next_path is None:
+                    return
+                path = os.fspath(next_path)
+            pending[pool.submit(_ingest_one, path, typical_timeout_s, hard_timeout_s)] = path
+
+    def emit(item: BatchIngestResult) -> BatchIngestResult:
+        stats.record(item)
+        stats.elapsed_s = time.perf_counter() - started
+        return item
+
+    pool = _new_pool(workers, memory_limit_mb)
+    try:
+        fill()
+        while pending:
+            done, _ = wait(pending, timeout=poll_s, return_when=FIRST_COMPLETED)
+            now = time.monotonic()
+            broken = False
+            for future in done:
+                if isinstance(future.exception(), BrokenProcessPool):
+                    broken = True  # resolved below, together with the rest of the pool
+                    continue
+                pending.pop(future)
+                running_since.pop(future, None)
+                yield emit(future.result())
+            for future in pending:
+                if future.running():
+                    running_since.setdefault(future, now)
+            overdue = [f for f, since in running_since.items() if now - since > parent_timeout_s]
+            if not (broken or overdue):
+                fill()
+                continue
+
+            _terminate_pool(pool)
+            isolated = len(pending) == 1
+            for future in overdue:
+                path = pending.pop(future)
+                error = f"worker exceeded parent deadline of {parent_timeout_s}s"
+                yield emit(_parent_result(path, "timeout", now - running_since.pop(future), error))
+            for future, path in list(pending.items()):
+                if future.done() and not future.cancelled() and future.exception() is None:
+                    yield emit(future.result())
+                elif broken and isolated:
+                    yield emit(_parent_result(path, "error", 0.0, "worker process died (memory limit or crash)"))
+                elif broken:
+                    quarantine.append(path)
+                else:
+                    retry.append(path)
+            pending.clear()
+            running_since.clear()
+            pool = _new_pool(workers, memory_limit_mb)
+            fill()
+    finally:
+        if pending:  # closed early; do not wait on files nobody will read
+            _terminate_pool(pool)
+        else:
+            pool.shutdown()
+    stats.elapsed_s = time.perf_counter() - started
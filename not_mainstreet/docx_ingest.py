@@ -1,11 +1,19 @@
 from __future__ import annotations
 
 import hashlib
+import io
+import mmap
+import os
 import re
 import zipfile
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from io import BytesIO
+from typing import Iterator
+
+
+CHECKSUM_CHUNK_BYTES = 1024 * 1024
 
 
 @dataclass
@@ -14,19 +22,100 @@ class IngestedDocx:
     checksum_sha256: str
     uploaded_at: str
 
+    @classmethod
+    def registered_now(cls, filename: str, checksum_sha256: str) -> IngestedDocx:
+        return cls(
+            filename=filename,
+            checksum_sha256=checksum_sha256,
+            uploaded_at=datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        )
+
+
+def sha256_chunked(buffer: bytes | bytearray | memoryview | mmap.mmap, chunk_size: int = CHECKSUM_CHUNK_BYTES) -> str:
+    """SHA-256 over fixed-size zero-copy slices of ``buffer``."""
+    digest = hashlib.sha256()
+    with memoryview(buffer) as view:
+        for offset in range(0, len(view), chunk_size):
+            digest.update(view[offset:offset + chunk_size])
+    return digest.hexdigest()
+
+
+class _MappedReader(io.RawIOBase):
+    """Seekable file facade over an mmap so ``zipfile`` can read it in place."""
+
+    def __init__(self, mapping: mmap.mmap) -> None:
+        self._mapping = mapping
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        try:
+            self._mapping.seek(offset, whence)
+        except ValueError as exc:  # zipfile expects file semantics (OSError) here
+            raise OSError(str(exc)) from exc
+        return self._mapping.tell()
+
+    def tell(self) -> int:
+        return self._mapping.tell()
+
+    def read(self, size: int | None = -1) -> bytes:
+        return self._mapping.read(None if size is None or size < 0 else size)
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:  # type: ignore[override]
+        data = self._mapping.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+@contextmanager
+def open_docx_mmap(path: str | os.PathLike[str]) -> Iterator[tuple[mmap.mmap, zipfile.ZipFile]]:
+    """Map a DOCX file read-only and open the zip directly over the mapping.
+
+    Only the members actually read are materialized on the heap; the archive
+    itself stays in the page cache.
+    """
+
+    with open(path, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            raise zipfile.BadZipFile(f"{os.fspath(path)} is empty")
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+            with zipfile.ZipFile(_MappedReader(mapping)) as zf:
+                yield mapping, zf
+
 
 def ingest_docx(filename: str, blob: bytes) -> IngestedDocx:
     """Minimal ingest primitive for DOCX payload metadata registration."""
-    return IngestedDocx(
-        filename=filename,
-        checksum_sha256=hashlib.sha256(blob).hexdigest(),
-        uploaded_at=datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
-    )
+    return IngestedDocx.registered_now(filename, hashlib.sha256(blob).hexdigest())
+
+
+def ingest_docx_path(path: str | os.PathLike[str], filename: str | None = None) -> IngestedDocx:
+    """Register a DOCX on disk, checksumming it in chunks over a memory map."""
+    with open(path, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            checksum = hashlib.sha256(b"").hexdigest()
+        else:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+                checksum = sha256_chunked(mapping)
+    return IngestedDocx.registered_now(filename or os.path.basename(os.fspath(path)), checksum)
+
+
+def extract_docx_text_zip(zf: zipfile.ZipFile) -> str:
+    xml = zf.read("word/document.xml").decode("utf-8", errors="ignore")
+    text_nodes = re.findall(r"<w:t[^>]*>(.*?)</w:t>", xml)
+    return "\n".join(t for t in text_nodes if t)
 
 
 def extract_docx_text(blob: bytes) -> str:
     """Extract plain text from DOCX word/document.xml without external dependencies."""
     with zipfile.ZipFile(BytesIO(blob)) as zf:
-        xml = zf.read("word/document.xml").decode("utf-8", errors="ignore")
-    text_nodes = re.findall(r"<w:t[^>]*>(.*?)</w:t>", xml)
-    return "\n".join(t for t in text_nodes if t)
+        return extract_docx_text_zip(zf)
+
+
+def extract_docx_text_path(path: str | os.PathLike[str]) -> str:
+    """Path variant of ``extract_docx_text`` that reads through a memory map."""
+    with open_docx_mmap(path) as (_, zf):
+        return extract_docx_text_zip(zf)
@@ -0,0 +1,451 @@
+from __future__ import annotations
+
+import os
+import posixpath
+import re
+import zipfile
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Any
+from xml.etree import ElementTree as ET
+
+from .docx_ingest import open_docx_mmap
+
+
+PARSER_VERSION = "docx-parser/v1"
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_R = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+_WP = "{http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing}"
+_PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_DC = "{http://purl.org/dc/elements/1.1/}"
+_CP = "{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}"
+
+_HEADING_NAME = re.compile(r"^heading\s*(\d+)$")
+_CODE_NAME = re.compile(r"code|source|preformatted|verbatim")
+_ANCHOR_STRIP = re.compile(r"[^a-z0-9]+")
+_OFF_VALUES = {"0", "false", "off", "none"}
+
+
+@dataclass(frozen=True)
+class _ParagraphStyle:
+    heading_level: int | None
+    code: bool
+    num_id: str | None
+    num_level: int
+
+
+@dataclass(frozen=True)
+class _RunStyle:
+    bold: bool
+    italic: bool
+    code: bool
+
+
+@dataclass
+class _StyleTable:
+    """Style and numbering lookups resolved once per document."""
+
+    paragraphs: dict[str, _ParagraphStyle]
+    runs: dict[str, _RunStyle]
+    list_types: dict[tuple[str, int], str]
+    relationships: dict[str, str]
+
+
+_DEFAULT_PARAGRAPH = _ParagraphStyle(heading_level=None, code=False, num_id=None, num_level=0)
+_DEFAULT_RUN = _RunStyle(bold=False, italic=False, code=False)
+
+
+def _read_xml(zf: zipfile.ZipFile, name: str) -> ET.Element | None:
+    try:
+        data = zf.read(name)
+    except KeyError:
+        return None
+    return ET.fromstring(data)
+
+
+def _val(el: ET.Element | None, default: str | None = None) -> str | None:
+    if el is None:
+        return default
+    return el.get(f"{_W}val", default)
+
+
+def _toggle(el: ET.Element | None) -> bool | None:
+    if el is None:
+        return None
+    return (el.get(f"{_W}val") or "true").lower() not in _OFF_VALUES
+
+
+def _build_style_table(zf: zipfile.ZipFile) -> _StyleTable:
+    raw_paragraph: dict[str, dict[str, Any]] = {}
+    raw_run: dict[str, dict[str, Any]] = {}
+
+    styles = _read_xml(zf, "word/styles.xml")
+    for style in styles.iter(f"{_W}style") if styles is not None else ():
+        style_id = style.get(f"{_W}styleId")
+        if not style_id:
+            continue
+        name = (_val(style.find(f"{_W}name")) or style_id).lower()
+        ppr = style.find(f"{_W}pPr")
+        rpr = style.find(f"{_W}rPr")
+        num_pr = ppr.find(f"{_W}numPr") if ppr is not None else None
+
+        heading_level = None
+        match = _HEADING_NAME.match(name)
+        if match:
+            heading_level = int(match.group(1))
+        elif ppr is not None and ppr.find(f"{_W}outlineLvl") is not None:
+            outline = _val(ppr.find(f"{_W}outlineLvl"), "9")
+            if outline and outline.isdigit() and int(outline) < 9:
+                heading_level = int(outline) + 1
+
+        entry = {
+            "based_on": _val(style.find(f"{_W}basedOn")),
+            "heading_level": heading_level,
+            "code": True if _CODE_NAME.search(name) else None,
+            "num_id": _val(num_pr.find(f"{_W}numId")) if num_pr is not None else None,
+            "num_level": int(_val(num_pr.find(f"{_W}ilvl"), "0") or 0) if num_pr is not None else 0,
+            "bold": _toggle(rpr.find(f"{_W}b")) if rpr is not None else None,
+            "italic": _toggle(rpr.find(f"{_W}i")) if rpr is not None else None,
+        }
+        if style.get(f"{_W}type") == "character":
+            raw_run[style_id] = entry
+        else:
+            raw_paragraph[style_id] = entry
+
+    def resolve(table: dict[str, dict[str, Any]], style_id: str, key: str, seen: set[str]) -> Any:
+        entry = table.get(style_id)
+        if entry is None or style_id in seen:
+            return None
+        if entry[key] is not None:  # only an absent property inherits; an explicit off (w:val="0") wins
+            return entry[key]
+        seen.add(style_id)
+        parent = entry["based_on"]
+        return resolve(table, parent, key, seen) if parent else entry[key]
+
+    paragraphs = {
+        sid: _ParagraphStyle(
+            heading_level=resolve(raw_paragraph, sid, "heading_level", set()),
+            code=bool(resolve(raw_paragraph, sid, "code", set())),
+            num_id=resolve(raw_paragraph, sid, "num_id", set()),
+            num_level=raw_paragraph[sid]["num_level"],
+        )
+        for sid in raw_paragraph
+    }
+    runs = {
+        sid: _RunStyle(
+            bold=bool(resolve(raw_run, sid, "bold", set())),
+            italic=bool(resolve(raw_run, sid, "italic", set())),
+            code=bool(resolve(raw_run, sid, "code", set())),
+        )
+        for sid in raw_run
+    }
+
+    list_types: dict[tuple[str, int], str] = {}
+    numbering = _read_xml(zf, "word/numbering.xml")
+    if numbering is not None:
+        abstract: dict[str, dict[int, str]] = {}
+        for node in numbering.iter(f"{_W}abstractNum"):
+            levels: dict[int, str] = {}
+            for lvl in node.iter(f"{_W}lvl"):
+                fmt = _val(lvl.find(f"{_W}numFmt"), "bullet")
+                levels[int(lvl.get(f"{_W}ilvl", "0"))] = "unordered" if fmt in {"bullet", "none"} else "ordered"
+            abstract[node.get(f"{_W}abstractNumId", "")] = levels
+        for num in numbering.iter(f"{_W}num"):
+            levels = abstract.get(_val(num.find(f"{_W}abstractNumId"), "") or "", {})
+            for ilvl, kind in levels.items():
+                list_types[(num.get(f"{_W}numId", ""), ilvl)] = kind
+
+    relationships: dict[str, str] = {}
+    rels = _read_xml(zf, "word/_rels/document.xml.rels")
+    for rel in rels.iter(f"{_PKG_REL}Relationship") if rels is not None else ():
+        target = rel.get("Target", "")
+        if rel.get("TargetMode") != "External":
+            target = posixpath.normpath(posixpath.join("word", target))
+        relationships[rel.get("Id", "")] = target
+
+    return _StyleTable(paragraphs=paragraphs, runs=runs, list_types=list_types, relationships=relationships)
+
+
+def _anchor(text: str, used: dict[str, int]) -> str:
+    base = _ANCHOR_STRIP.sub("-", text.lower()).strip("-") or "section"
+    count = used.get(base, 0)
+    used[base] = count + 1
+    return base if count == 0 else f"{base}-{count + 1}"
+
+
+def _text_of(el: ET.Element) -> str:
+    return "".join(t.text or "" for t in el.iter(f"{_W}t"))
+
+
+def _footnotes(zf: zipfile.ZipFile) -> dict[str, str]:
+    root = _read_xml(zf, "word/footnotes.xml")
+    if root is None:
+        return {}
+    notes: dict[str, str] = {}
+    for note in root.iter(f"{_W}footnote"):
+        if note.get(f"{_W}type") in {"separator", "continuationSeparator", "continuationNotice"}:
+            continue
+        notes[note.get(f"{_W}id", "")] = "\n".join(_text_of(p) for p in note.iter(f"{_W}p")).strip()
+    return notes
+
+
+def _core_metadata(zf: zipfile.ZipFile) -> dict[str, Any]:
+    root = _read_xml(zf, "docProps/core.xml")
+    if root is None:
+        return {}
+    out: dict[str, Any] = {}
+    title = root.findtext(f"{_DC}title")
+    if title:
+        out["title"] = title
+    creator = root.findtext(f"{_DC}creator")
+    if creator:
+        out["authors"] = [creator]
+    keywords = root.findtext(f"{_CP}keywords")
+    if keywords:
+        out["tags"] = [k.strip() for k in re.split(r"[,;]", keywords) if k.strip()]
+    return out
+
+
+class _DocumentWalker:
+    """Single pass over ``word/document.xml`` emitting CDM blocks."""
+
+    def __init__(self, styles: _StyleTable, footnotes: dict[str, str]) -> None:
+        self.styles = styles
+        self.footnotes = footnotes
+        self.blocks: list[dict[str, Any]] = []
+        self.toc: list[dict[str, Any]] = []
+        self.references: list[dict[str, Any]] = []
+        self.footnote_order: list[str] = []
+        self._anchors: dict[str, int] = {}
+        self._open_list: dict[str, Any] | None = None
+        self._open_list_num: str | None = None
+
+    def _block_id(self) -> str:
+        return f"blk-{len(self.blocks) + 1:04d}"
+
+    def _emit(self, block: dict[str, Any]) -> dict[str, Any]:
+        block = {"block_id": self._block_id(), **block}
+        self.blocks.append(block)
+        return block
+
+    def _close_list(self) -> None:
+        self._open_list = None
+        self._open_list_num = None
+
+    def walk(self, body: ET.Element) -> None:
+        for child in body:
+            if child.tag == f"{_W}p":
+                self._paragraph(child)
+            elif child.tag == f"{_W}tbl":
+                self._close_list()
+                self._emit({"type": "table", "table": {"rows": self._table_rows(child)}})
+        self._close_list()
+        for note_id in self.footnote_order:
+            block = self._emit({"type": "footnote", "footnote_id": note_id, "text": self.footnotes.get(note_id, "")})
+            self.references.append({
+                "ref_id": f"fn-{note_id}",
+                "label": note_id,
+                "target": block["block_id"],
+                "kind": "footnote",
+                "resolved": note_id in self.footnotes,
+            })
+
+    def _runs(self, paragraph: ET.Element, base_code: bool) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        runs: list[dict[str, Any]] = []
+        images: list[dict[str, Any]] = []
+        rels = self.styles.relationships
+        run_styles = self.styles.runs
+
+        def visit(parent: ET.Element, href: str | None) -> None:
+            for node in parent:
+                if node.tag == f"{_W}hyperlink":
+                    rid = node.get(f"{_R}id")
+                    target = rels.get(rid) if rid else None
+                    if target is None and node.get(f"{_W}anchor"):
+                        target = f"#{node.get(f'{_W}anchor')}"
+                    visit(node, target)
+                    continue
+                if node.tag in {f"{_W}ins", f"{_W}smartTag", f"{_W}sdt", f"{_W}sdtContent"}:
+                    visit(node, href)
+                    continue
+                if node.tag != f"{_W}r":
+                    continue
+
+                rpr = node.find(f"{_W}rPr")
+                style = _DEFAULT_RUN
+                bold = italic = None
+                if rpr is not None:
+                    style = run_styles.get(_val(rpr.find(f"{_W}rStyle")) or "", _DEFAULT_RUN)
+                    bold = _toggle(rpr.find(f"{_W}b"))
+                    italic = _toggle(rpr.find(f"{_W}i"))
+                flags = (
+                    style.bold if bold is None else bold,
+                    style.italic if italic is None else italic,
+                    style.code or base_code,
+                )
+
+                parts: list[str] = []
+                for item in node:
+                    if item.tag == f"{_W}t":
+                        parts.append(item.text or "")
+                    elif item.tag == f"{_W}tab":
+                        parts.append("\t")
+                    elif item.tag in {f"{_W}br", f"{_W}cr"}:
+                        parts.append("\n")
+                    elif item.tag == f"{_W}footnoteReference":
+                        note_id = item.get(f"{_W}id", "")
+                        if note_id not in self.footnote_order:
+                            self.footnote_order.append(note_id)
+                        runs.append({"footnote_ref": note_id})
+                    elif item.tag == f"{_W}drawing":
+                        blip = item.find(f".//{_A}blip")
+                        doc_pr = item.find(f".//{_WP}docPr")
+                        if blip is not None:
+                            images.append({
+                                "source_location": rels.get(blip.get(f"{_R}embed", ""), ""),
+                                "alt": (doc_pr.get("descr") or doc_pr.get("title") or "") if doc_pr is not None else "",
+                            })
+                text = "".join(parts)
+                if not text:
+                    continue
+
+                last = runs[-1] if runs else None
+                if last is not None and "text" in last and last.get("_flags") == (flags, href):
+                    last["text"] += text
+                    continue
+                run: dict[str, Any] = {"text": text, "_flags": (flags, href)}
+                if flags[0]:
+                    run["bold"] = True
+                if flags[1]:
+                    run["italic"] = True
+                if flags[2]:
+                    run["code"] = True
+                if href:
+                    run["href"] = href
+                runs.append(run)
+
+        visit(paragraph, None)
+        for run in runs:
+            run.pop("_flags", None)
+        return runs, images
+
+    def _paragraph(self, paragraph: ET.Element) -> None:
+        ppr = paragraph.find(f"{_W}pPr")
+        style = _DEFAULT_PARAGRAPH
+        num_id, num_level = None, 0
+        if ppr is not None:
+            style = self.styles.paragraphs.get(_val(ppr.find(f"{_W}pStyle")) or "", _DEFAULT_PARAGRAPH)
+            num_id, num_level = style.num_id, style.num_level
+            num_pr = ppr.find(f"{_W}numPr")
+            if num_pr is not None:
+                num_id = _val(num_pr.find(f"{_W}numId"), num_id)
+                num_level = int(_val(num_pr.find(f"{_W}ilvl"), str(num_level)) or 0)
+
+        runs, images = self._runs(paragraph, style.code)
+        text = "".join(r.get("text", "") for r in runs)
+
+        if num_id and num_id != "0" and style.heading_level is None:
+            kind = self.styles.list_types.get((num_id, num_level), "unordered")
+            if self._open_list is None or self._open_list_num != num_id:
+                self._open_list = self._emit({"type": "list", "list_type": kind, "items": [], "item_levels": []})
+                self._open_list_num = num_id
+            self._open_list["items"].append(text)
+            self._open_list["item_levels"].append(num_level)
+        else:
+            self._close_list()
+            if style.heading_level is not None and text.strip():
+                anchor = _anchor(text.strip(), self._anchors)
+                block = self._emit({
+                    "type": "heading",
+                    "heading_level": style.heading_level,
+                    "text": text,
+                    "anchor": anchor,
+                })
+                self.toc.append({
+                    "block_id": block["block_id"],
+                    "heading_level": style.heading_level,
+                    "text": text,
+                    "anchor": anchor,
+                })
+            elif text.strip() or any("footnote_ref" in r for r in runs):
+                self._emit({"type": "paragraph", "text": text, "runs": runs})
+
+        for image in images:
+            self._emit({"type": "image", "image": image})
+
+    def _cell_lines(self, tc: ET.Element) -> list[str]:
+        lines: list[str] = []
+        for child in tc:
+            if child.tag == f"{_W}p":
+                lines.append(_text_of(child))
+            elif child.tag == f"{_W}tbl":
+                lines.extend("\t".join(row) for row in self._table_rows(child))
+        return lines
+
+    def _table_rows(self, table: ET.Element) -> list[list[str]]:
+        rows: list[list[str]] = []
+        for tr in table.findall(f"{_W}tr"):  # direct rows only; nested tables stay inside their cell
+            row: list[str] = []
+            for tc in tr.findall(f"{_W}tc"):
+                tcpr = tc.find(f"{_W}tcPr")
+                span = 1
+                continued = False
+                if tcpr is not None:
+                    span = int(_val(tcpr.find(f"{_W}gridSpan"), "1") or 1)
+                    vmerge = tcpr.find(f"{_W}vMerge")
+                    continued = vmerge is not None and _val(vmerge, "continue") == "continue"
+                text = "" if continued else "\n".join(self._cell_lines(tc))
+                row.append(text)
+                row.extend("" for _ in range(span - 1))
+            rows.append(row)
+        return rows
+
+
+def parse_docx_zip(zf: zipfile.ZipFile, document_id: str) -> dict[str, Any]:
+    """Build a CDM payload from an opened DOCX archive.
+
+    Upload details (filename, checksum, timestamp) are deliberately left out so
+    formatting-only re-uploads do not churn ``cdm_hash``; ``ingest_docx_upload``
+    records the stored upload as ``provenance.source_asset_id``, which the hash ignores. Styles, numbering and relationships are resolved once up front so the
+    body walk only performs dictionary lookups per paragraph and run.
+    """
+
+    styles = _build_style_table(zf)
+    document = _read_xml(zf, "word/document.xml")
+    if document is None:
+        raise ValueError("DOCX archive is missing word/document.xml")
+    body = document.find(f"{_W}body")
+
+    walker = _DocumentWalker(styles, _footnotes(zf))
+    if body is not None:
+        walker.walk(body)
+
+    metadata = _core_metadata(zf)
+    if "title" not in metadata:
+        metadata["title"] = walker.toc[0]["text"] if walker.toc else ""
+
+    cdm: dict[str, Any] = {
+        "schema_version": "cdm/v1",
+        "document_id": document_id,
+        "provenance": {"parser_version": PARSER_VERSION},
+        "metadata": metadata,
+        "structure": {"toc": walker.toc},
+        "content": {"blocks": walker.blocks},
+        "references": walker.references,
+        "assets": [],
+    }
+    return cdm
+
+
+def parse_docx(blob: bytes, document_id: str) -> dict[str, Any]:
+    """Parse DOCX bytes into a CDM payload ready for ``CDMRegistry.register``."""
+    with zipfile.ZipFile(BytesIO(blob)) as zf:
+        return parse_docx_zip(zf, document_id)
+
+
+def parse_docx_path(path: str | os.PathLike[str], document_id: str) -> dict[str, Any]:
+    """Parse a DOCX on disk through a read-only memory map."""
+    with open_docx_mmap(path) as (_, zf):
+        return parse_docx_zip(zf, document_id)
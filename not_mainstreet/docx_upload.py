@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from dataclasses import dataclass
+from typing import Any, BinaryIO
+
+from .assets import AssetStore
+from .docx_ingest import CHECKSUM_CHUNK_BYTES, IngestedDocx, extract_docx_text_zip, open_docx_mmap
+from .docx_media import MediaExtraction, attach_assets, extract_docx_media
+from .docx_parser import parse_docx_zip
+from .errors import ValidationError
+
+
+MAX_UPLOAD_BYTES = 50 * 1024 * 1024
+
+
+@dataclass
+class DocxUpload:
+    ingested: IngestedDocx
+    asset_id: str
+    size_bytes: int
+    text: str
+    cdm: dict[str, Any] | None
+    media: MediaExtraction | None = None
+
+
+def ingest_docx_upload(
+    filename: str,
+    stream: BinaryIO,
+    store: AssetStore,
+    *,
+    document_id: str | None = None,
+    max_bytes: int = MAX_UPLOAD_BYTES,
+    extract_media: bool = True,
+    chunk_size: int = CHECKSUM_CHUNK_BYTES,
+) -> DocxUpload:
+    """Read an upload stream exactly once: hash, spool and parse in one pipeline.
+
+    Each chunk updates the document checksum and is written to a spool file on
+    the asset store's filesystem. The zip reader then works over a memory map of
+    that spool file, and the file is renamed into the content-addressed store
+    under the checksum already computed, so nothing is hashed or copied twice.
+    Uploads that are oversized or not valid DOCX never enter the store. Embedded
+    ``word/media`` parts are extracted from the same mapping and bound into the CDM.
+    """
+
+    digest = hashlib.sha256()
+    size = 0
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    readinto = getattr(stream, "readinto", None)
+
+    spool = store.spool()
+    try:
+        with spool:
+            while True:
+                if readinto is not None:
+                    n = readinto(view)
+                    chunk = view[:n] if n else b""
+                else:
+                    chunk = stream.read(chunk_size)
+                    n = len(chunk)
+                if not n:
+                    break
+                size += n
+                if size > max_bytes:
+                    raise ValidationError(f"upload {filename!r} exceeds {max_bytes} bytes")
+                digest.update(chunk)
+                spool.write(chunk)
+
+        with open_docx_mmap(spool.name) as (_, zf):
+            text = extract_docx_text_zip(zf)
+            cdm = parse_docx_zip(zf, document_id) if document_id else None
+            media = extract_docx_media(zf, store) if extract_media else None
+        if cdm is not None and media is not None:
+            attach_assets(cdm, media.assets)
+
+        asset_id = store.adopt(spool.name, digest.hexdigest())
+        if cdm is not None:
+            # Keeps the source DOCX live for asset GC while this version is retained.
+            cdm["provenance"]["source_asset_id"] = asset_id
+    except BaseException:
+        if os.path.exists(spool.name):
+            os.unlink(spool.name)
+        raise
+
+    return DocxUpload(
+        ingested=IngestedDocx.registered_now(filename, asset_id),
+        asset_id=asset_id,
+        size_bytes=size,
+        text=text,
+        cdm=cdm,
+        media=media,
+    )
@@ -1,12 +1,29 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+import heapq
+import string
+import sys
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
 
+from .gate_policy import RULE_CODES, GatePolicy, default_gate_policy
+from .serialization import compile_to_dict
+
 
 VALID_SCOPES = {"household", "block", "town", "region"}
 VALID_STATUSES = {"draft", "submitted", "gated", "matched", "scheduled", "completed"}
+# Forward-only lifecycle. "submitted" (gate not passed) only moves by resubmitting
+# through the gate, never by a status transition.
+STATUS_TRANSITIONS: dict[str, frozenset[str]] = {
+    "draft": frozenset({"submitted"}),
+    "submitted": frozenset(),
+    "gated": frozenset({"matched"}),
+    "matched": frozenset({"scheduled"}),
+    "scheduled": frozenset({"completed"}),
+    "completed": frozenset(),
+}
+RESUBMITTABLE_STATUSES = frozenset({"draft", "submitted", "gated"})
 VALID_EDGE_CLASSES = {
     "service_request",
     "commerce_exchange",
@@ -22,15 +39,20 @@ FAILURE_CODES = {
     "FEASIBILITY_BLOCK",
 }
 
+# Labels up to this length (scope levels, categories, roles, windows such as
+# "this-week") are interned so millions of in-memory proposals share one copy;
+# longer free text is left alone so the intern table does not grow with it.
+INTERN_MAX_LEN = 32
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Who:
     user_id: str
     roles: list[str]
     reputation_ref: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Why:
     goal: str
     constraints: list[str]
@@ -38,7 +60,7 @@ class Why:
     urgency: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class What:
     category: str
     description: str
@@ -46,7 +68,7 @@ class What:
     requirements: list[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Where:
     scope_level: str
     geo: str
@@ -54,21 +76,21 @@ class Where:
     constraints: list[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class When:
     window: str
     trigger_conditions: list[str]
     deadline: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FailureSignal:
     code: str
     field: str
     message: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GateResults:
     gate_outcome: str  # pass|fail|partial
     noumenal: bool
@@ -77,15 +99,16 @@ class GateResults:
     conflicts: list[FailureSignal]
     policy_blocks: list[FailureSignal]
     feasibility_blocks: list[FailureSignal]
+    policy_version: str | None = None  # spec 20.4: the policy the decision was made under
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RoutingAlternative:
     edge_class: str
     confidence: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EdgeProposal:
     proposal_id: str
     tenant_id: str
@@ -109,7 +132,7 @@ class EdgeProposal:
     updated_at: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IntakeEvaluation:
     gate_results: GateResults
     routing_class: str
@@ -120,65 +143,57 @@ class IntakeEvaluation:
 
 
 
-def _now() -> str:
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-
-
-def _missing(field: str, message: str) -> FailureSignal:
-    return FailureSignal(code="MISSING_FIELD", field=field, message=message)
+def intern_label(value: Any) -> Any:
+    """``sys.intern`` short strings (and the items of string lists); anything else is returned unchanged."""
+    if type(value) is str:
+        return sys.intern(value) if len(value) <= INTERN_MAX_LEN else value
+    if type(value) is list:
+        return [sys.intern(v) if type(v) is str and len(v) <= INTERN_MAX_LEN else v for v in value]
+    return value
 
 
-def _conflict(field: str, message: str) -> FailureSignal:
-    return FailureSignal(code="CONFLICT", field=field, message=message)
+def _labels(fields: dict[str, Any], *names: str) -> dict[str, Any]:
+    return {**fields, **{name: intern_label(fields[name]) for name in names if name in fields}}
 
 
-def _policy(field: str, message: str) -> FailureSignal:
-    return FailureSignal(code="POLICY_BLOCK", field=field, message=message)
+def five_w_from_dicts(
+    who: dict[str, Any], why: dict[str, Any], what: dict[str, Any], where: dict[str, Any], when: dict[str, Any]
+) -> tuple[Who, Why, What, Where, When]:
+    """The 5W records for intake or stored payload dicts, with repeated labels interned."""
+    return (
+        Who(**_labels(who, "roles")),
+        Why(**_labels(why, "values", "urgency")),
+        What(**_labels(what, "category")),
+        Where(**_labels(where, "scope_level", "service_area")),
+        When(**_labels(when, "window")),
+    )
 
 
-def _feasibility(field: str, message: str) -> FailureSignal:
-    return FailureSignal(code="FEASIBILITY_BLOCK", field=field, message=message)
+_SIGNALS: dict[tuple[str, str, str], FailureSignal] = {}
 
 
-def evaluate_dual_gate(who: Who, why: Why, what: What, where: Where, when: When) -> GateResults:
-    missing_fields: list[FailureSignal] = []
-    conflicts: list[FailureSignal] = []
-    policy_blocks: list[FailureSignal] = []
-    feasibility_blocks: list[FailureSignal] = []
+def failure_signal(code: str, field: str, message: str) -> FailureSignal:
+    """The shared (frozen) ``FailureSignal`` for a fixed code/field/message."""
+    key = (code, field, message)
+    signal = _SIGNALS.get(key)
+    if signal is None:
+        signal = _SIGNALS[key] = FailureSignal(sys.intern(code), sys.intern(field), message)
+    return signal
 
-    # missing-field checks (failure-as-signal)
-    if not who.user_id:
-        missing_fields.append(_missing("who.user_id", "WHO user identity is required"))
-    if not why.goal:
-        missing_fields.append(_missing("why.goal", "WHY goal is required"))
-    if not what.description:
-        missing_fields.append(_missing("what.description", "WHAT description is required"))
-    if where.scope_level not in VALID_SCOPES:
-        missing_fields.append(_missing("where.scope_level", "WHERE scope_level must be one of household|block|town|region"))
-    if not when.window:
-        missing_fields.append(_missing("when.window", "WHEN window is required"))
 
-    # noumenal checks
-    noumenal = True
-    if not why.values:
-        policy_blocks.append(_policy("why.values", "Intent requires at least one value commitment"))
-        noumenal = False
-    if "banned" in (r.lower() for r in who.roles):
-        policy_blocks.append(_policy("who.roles", "Actor role is not permitted for this action"))
-        noumenal = False
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
-    # phenomenal checks
-    phenomenal = True
-    if where.scope_level == "household" and what.category == "governance":
-        conflicts.append(_conflict("where.scope_level+what.category", "Governance requests cannot be household-only"))
-        phenomenal = False
-    if what.budget is not None and what.budget < 0:
-        feasibility_blocks.append(_feasibility("what.budget", "Budget cannot be negative"))
-        phenomenal = False
 
-    if missing_fields:
-        noumenal = False
-        phenomenal = False
+def _gate_template(policy: GatePolicy, flags: int) -> GateResults:
+    buckets: dict[str, list[FailureSignal]] = {bucket: [] for bucket, _, _ in RULE_CODES.values()}
+    noumenal = phenomenal = True
+    for rule in policy.rules:
+        if flags >> rule.bit & 1:
+            bucket, fails_noumenal, fails_phenomenal = RULE_CODES[rule.code]
+            buckets[bucket].append(failure_signal(rule.code, rule.field, rule.message))
+            noumenal = noumenal and not fails_noumenal
+            phenomenal = phenomenal and not fails_phenomenal
 
     if noumenal and phenomenal:
         gate_outcome = "pass"
@@ -191,44 +206,176 @@ def evaluate_dual_gate(who: Who, why: Why, what: What, where: Where, when: When)
         gate_outcome=gate_outcome,
         noumenal=noumenal,
         phenomenal=phenomenal,
-        missing_fields=missing_fields,
-        conflicts=conflicts,
-        policy_blocks=policy_blocks,
-        feasibility_blocks=feasibility_blocks,
+        policy_version=policy.policy_version,
+        **buckets,
     )
 
 
-def route_edge_class(what: What, why: Why) -> tuple[str, float, list[RoutingAlternative], bool]:
-    c = what.category.lower().strip()
-    scores = {
-        "service_request": 0.2,
-        "commerce_exchange": 0.2,
-        "governance_petition": 0.2,
-        "volunteer_task": 0.2,
-        "meetup_coordination": 0.2,
-    }
-
-    if c in {"service", "repair", "care"}:
-        scores["service_request"] = 0.92
-    elif c in {"commerce", "market", "sale"}:
-        scores["commerce_exchange"] = 0.92
-    elif c in {"governance", "petition", "policy"}:
-        scores["governance_petition"] = 0.92
-    elif c in {"volunteer", "mutual_aid"}:
-        scores["volunteer_task"] = 0.92
-    elif c in {"event", "meetup"}:
-        scores["meetup_coordination"] = 0.92
-    elif "volunteer" in why.goal.lower():
-        scores["volunteer_task"] = 0.75
-    else:
-        scores["service_request"] = 0.55
-        scores["commerce_exchange"] = 0.45
+def gate_results_for(policy: GatePolicy, flags: int) -> GateResults:
+    """``GateResults`` for a bitmask of failed ``policy`` rules (see ``GatePolicy.flags``)."""
+    template = policy.templates.get(flags)
+    if template is None:
+        gate = _gate_template(policy, flags)
+        template = policy.templates[flags] = (
+            gate.gate_outcome,
+            gate.noumenal,
+            gate.phenomenal,
+            tuple(gate.missing_fields),
+            tuple(gate.conflicts),
+            tuple(gate.policy_blocks),
+            tuple(gate.feasibility_blocks),
+        )
+    outcome, noumenal, phenomenal, missing, conflicts, policy_blocks, feasibility_blocks = template
+    # Signals are frozen and shared; the lists are fresh for every decision.
+    return GateResults(
+        outcome,
+        noumenal,
+        phenomenal,
+        [*missing],
+        [*conflicts],
+        [*policy_blocks],
+        [*feasibility_blocks],
+        policy.policy_version,
+    )
 
-    ordered = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)
-    primary_class, primary_score = ordered[0]
-    alternatives = [RoutingAlternative(edge_class=k, confidence=v) for k, v in ordered[:3]]
-    needs_disambiguation = primary_score < 0.7
-    return primary_class, primary_score, alternatives, needs_disambiguation
+
+def evaluate_dual_gate(
+    who: Who, why: Why, what: What, where: Where, when: When, *, policy: GatePolicy | None = None
+) -> GateResults:
+    """Run the compiled gate policy (default: ``contracts/gate_policy.json``) over the 5W fields."""
+    policy = policy or default_gate_policy()
+    return gate_results_for(policy, policy.flags(who, why, what, where, when))
+
+
+# Routing table (edge class -> synonyms). Class order breaks score ties.
+ROUTING_CATEGORIES: dict[str, tuple[str, ...]] = {
+    "service_request": ("service", "repair", "care"),
+    "commerce_exchange": ("commerce", "market", "sale"),
+    "governance_petition": ("governance", "petition", "policy"),
+    "volunteer_task": ("volunteer", "mutual_aid"),
+    "meetup_coordination": ("event", "meetup"),
+}
+# Edge class -> {weight: keywords} scanned in what.description and why.goal.
+ROUTING_KEYWORDS: dict[str, dict[float, tuple[str, ...]]] = {
+    "service_request": {
+        1.0: ("repair", "repairs", "fix", "fixing", "plumbing", "plumber", "electrician", "childcare", "eldercare",
+              "tutoring", "tutor", "caregiver", "caregiving", "delivery", "deliver"),
+        0.5: ("broken", "install", "clean", "cleaning", "ride", "rides", "errand", "errands", "care"),
+    },
+    "commerce_exchange": {
+        1.0: ("sell", "selling", "sale", "buy", "buying", "purchase", "market", "marketplace", "vendor", "trade",
+              "trading", "swap"),
+        0.5: ("price", "pay", "shop", "goods", "produce", "crafts"),
+    },
+    "governance_petition": {
+        1.0: ("petition", "policy", "council", "ordinance", "zoning", "bylaw", "bylaws", "vote", "voting",
+              "referendum", "governance"),
+        0.5: ("permit", "proposal", "budget", "board"),
+    },
+    "volunteer_task": {
+        1.0: ("volunteer", "volunteers", "volunteering", "volunteered", "mutual_aid", "donate", "donation",
+              "donations"),
+        0.5: ("cleanup", "drive", "pantry", "shelter"),
+    },
+    "meetup_coordination": {
+        1.0: ("meetup", "meetups", "potluck", "gathering", "picnic", "festival", "workshop", "rsvp", "event",
+              "events"),
+        0.5: ("meet", "party", "club", "social"),
+    },
+}
+BASE_ROUTE_SCORE = 0.2
+CATEGORY_ROUTE_SCORE = 0.92
+KEYWORD_ROUTE_SPAN = 0.55  # keyword-only routing tops out at 0.75, below a category match
+DISAMBIGUATION_BELOW = 0.7
+_FALLBACK_SCORES = {"service_request": 0.55, "commerce_exchange": 0.45}
+# ASCII punctuation (except "_", as in "mutual_aid") splits words like whitespace. The
+# table covers all of ASCII: characters missing from a translate table take a slow path.
+_WORD_BREAKS = {
+    code: " " if chr(code) in string.punctuation and chr(code) != "_" else code for code in range(128)
+}
+_ROUTE_MEMO_SIZE = 4096
+
+
+class RoutingClassifier:
+    """Edge-class router compiled once from a category/keyword table.
+
+    A known ``what.category`` decides outright. Otherwise ``what.description``
+    and ``why.goal`` are tokenized in one pass and each class scores its share
+    of the matched keyword weight; the top three are picked with ``heapq``
+    (ties go to the earlier class), so routing is deterministic.
+    """
+
+    def __init__(
+        self,
+        categories: dict[str, tuple[str, ...]] = ROUTING_CATEGORIES,
+        keywords: dict[str, dict[float, tuple[str, ...]]] = ROUTING_KEYWORDS,
+    ) -> None:
+        self.classes = tuple(categories)
+        self._category = {synonym: i for i, name in enumerate(self.classes) for synonym in categories[name]}
+        table: dict[str, list[tuple[int, float]]] = {}
+        for i, name in enumerate(self.classes):
+            for weight, words in keywords.get(name, {}).items():
+                for word in words:
+                    table.setdefault(word, []).append((i, weight))
+        self._keywords = {word: tuple(hits) for word, hits in table.items()}
+        base = [BASE_ROUTE_SCORE] * len(self.classes)
+        self._by_category = tuple(
+            self._result([CATEGORY_ROUTE_SCORE if j == i else score for j, score in enumerate(base)])
+            for i in range(len(self.classes))
+        )
+        self._fallback = self._result([_FALLBACK_SCORES.get(name, BASE_ROUTE_SCORE) for name in self.classes])
+        # Keyword evidence falls on a small set of weight sums, so ranked results are memoized per
+        # (class, weight) sequence and the scores are only computed on a miss.
+        self._ranked: dict[tuple[tuple[int, float], ...], tuple[str, float, tuple[RoutingAlternative, ...], bool]] = {}
+
+    def category_index(self, category: str) -> int | None:
+        return self._category.get(category.lower().strip())
+
+    def category_route(self, index: int) -> tuple[str, float, tuple[RoutingAlternative, ...], bool]:
+        """Precomputed routing for a category that names ``classes[index]``."""
+        return self._by_category[index]
+
+    def _result(self, scores: list[float]) -> tuple[str, float, tuple[RoutingAlternative, ...], bool]:
+        top = heapq.nlargest(3, range(len(scores)), key=lambda i: (scores[i], -i))
+        alternatives = tuple(RoutingAlternative(edge_class=self.classes[i], confidence=scores[i]) for i in top)
+        primary = alternatives[0]
+        return primary.edge_class, primary.confidence, alternatives, primary.confidence < DISAMBIGUATION_BELOW
+
+    def route_text(self, description: str, goal: str) -> tuple[str, float, tuple[RoutingAlternative, ...], bool]:
+        """Keyword routing over ``description`` and ``goal`` (no category match)."""
+        evidence: dict[int, float] = {}
+        keywords = self._keywords
+        tokens = f"{description} {goal}".lower().translate(_WORD_BREAKS).split()
+        for token in filter(keywords.__contains__, tokens):
+            for i, weight in keywords[token]:
+                evidence[i] = evidence.get(i, 0.0) + weight
+        if not evidence:
+            return self._fallback
+        key = tuple(evidence.items())
+        ranked = self._ranked.get(key)
+        if ranked is None:
+            total = sum(evidence.values())
+            scores = [BASE_ROUTE_SCORE] * len(self.classes)
+            for i, weight in evidence.items():
+                scores[i] = round(BASE_ROUTE_SCORE + KEYWORD_ROUTE_SPAN * weight / total, 4)
+            if len(self._ranked) >= _ROUTE_MEMO_SIZE:
+                self._ranked.clear()
+            ranked = self._ranked[key] = self._result(scores)
+        return ranked
+
+    def route(self, category: str, description: str, goal: str) -> tuple[str, float, list[RoutingAlternative], bool]:
+        i = self.category_index(category)
+        edge_class, confidence, alternatives, needs_disambiguation = (
+            self.category_route(i) if i is not None else self.route_text(description, goal)
+        )
+        return edge_class, confidence, list(alternatives), needs_disambiguation
+
+
+DEFAULT_ROUTER = RoutingClassifier()
+
+
+def route_edge_class(what: What, why: Why) -> tuple[str, float, list[RoutingAlternative], bool]:
+    return DEFAULT_ROUTER.route(what.category, what.description, why.goal)
 
 
 def next_actions(gate: GateResults, edge_class: str, needs_disambiguation: bool) -> list[str]:
@@ -307,5 +454,14 @@ def build_edge_proposal(
     )
 
 
+_PROPOSAL_TO_DICT = compile_to_dict(EdgeProposal)
+_EVALUATION_TO_DICT = compile_to_dict(IntakeEvaluation)
+
+
 def proposal_to_dict(p: EdgeProposal) -> dict[str, Any]:
-    return asdict(p)
+    """``dataclasses.asdict(p)`` via a precompiled builder (see ``serialization.compile_to_dict``)."""
+    return _PROPOSAL_TO_DICT(p)
+
+
+def evaluation_to_dict(evaluation: IntakeEvaluation) -> dict[str, Any]:
+    return _EVALUATION_TO_DICT(evaluation)
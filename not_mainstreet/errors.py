@@ -10,5 +10,28 @@ class ContinuityViolation(NotMainStreetError):
     pass
 
 
+class ConcurrencyConflict(NotMainStreetError):
+    """A write expected a proposal_version (or publish lease) that is no longer current; re-read and retry."""
+
+
 class UnsupportedIntegrationMode(NotMainStreetError):
     pass
+
+
+class GitPublishError(NotMainStreetError):
+    pass
+
+
+class TransportError(NotMainStreetError):
+    """Connection failure, timeout, 408/429 or 5xx from a target API; safe to retry.
+
+    ``retry_after_s`` is the delay the server asked for with ``Retry-After``, if any.
+    """
+
+    def __init__(self, message: str = "", *, retry_after_s: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after_s = retry_after_s
+
+
+class ContractError(NotMainStreetError):
+    """Other 4xx from a target API: the payload does not match its contract; retrying will not help."""
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Sequence
+
+from .edge_proposal import (
+    EdgeProposal,
+    GateResults,
+    RoutingAlternative,
+    What,
+    When,
+    Where,
+    Who,
+    Why,
+    DEFAULT_ROUTER,
+    five_w_from_dicts,
+    gate_results_for,
+)
+from .errors import ValidationError
+from .gate_policy import GatePolicy, default_gate_policy
+
+try:  # optional; the plain-list path below gives identical results
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None  # type: ignore[assignment]
+
+
+HAS_NUMPY = np is not None
+
+# ``route_codes`` gives the index of the class a row's category names, or this
+# when the row is routed on description/goal keywords instead.
+ROUTE_BY_KEYWORDS = -1
+
+_PARTS = {"who": 0, "why": 1, "what": 2, "where": 3, "when": 4}
+_NUMBERS = (int, float)
+_COMPARE = {"lt": "less", "le": "less_equal", "gt": "greater", "ge": "greater_equal"}
+_SCALAR_COMPARE = {
+    "lt": lambda a, b: a < b,
+    "le": lambda a, b: a <= b,
+    "gt": lambda a, b: a > b,
+    "ge": lambda a, b: a >= b,
+}
+
+
+@dataclass(frozen=True)
+class GateColumns:
+    """5W records for batch gating and routing, read one field (policy path) at a time.
+
+    ``column("what.category")`` is built from ``rows`` on first use and kept,
+    as are the NumPy arrays ``gate_flags`` derives from it, so evaluating
+    several policies over the same rows converts each field once.
+    """
+
+    rows: Sequence[tuple[Who, Why, What, Where, When]]
+    _columns: dict[str, list[Any]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _arrays: dict[str, tuple[str, Any]] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def column(self, path: str) -> list[Any]:
+        """One value per row for a ``"who.user_id"``-style path."""
+        values = self._columns.get(path)
+        if values is None:
+            part, _, name = path.partition(".")
+            i = _PARTS[part]
+            values = self._columns[path] = [getattr(row[i], name) for row in self.rows]
+        return values
+
+    @classmethod
+    def from_fields(cls, rows: Iterable[tuple[Who, Why, What, Where, When]]) -> GateColumns:
+        return cls(list(rows))
+
+    @classmethod
+    def from_proposals(cls, proposals: Iterable[EdgeProposal]) -> GateColumns:
+        return cls.from_fields((p.who, p.why, p.what, p.where, p.when) for p in proposals)
+
+    @classmethod
+    def from_payloads(cls, payloads: Iterable[dict[str, Any]]) -> GateColumns:
+        """Columns from stored ``proposal_to_dict`` payloads (e.g. ``edge_proposals.payload_json``)."""
+        return cls.from_fields(
+            five_w_from_dicts(p["who"], p["why"], p["what"], p["where"], p["when"]) for p in payloads
+        )
+
+
+def _use_numpy(use_numpy: bool) -> bool:
+    if use_numpy and np is None:
+        raise RuntimeError("numpy is not installed")
+    return use_numpy
+
+
+def _array(columns: GateColumns, path: str) -> tuple[str, Any]:
+    """``(kind, array)`` for a column: strings, numbers (NaN for None), item counts, or the raw values."""
+    cached = columns._arrays.get(path)
+    if cached is not None:
+        return cached
+    values = columns.column(path)
+    if all(value.__class__ is str for value in values):
+        kind, array = "str", np.asarray(values, dtype=str)
+    elif all(value is None or value.__class__ in _NUMBERS for value in values):
+        kind, array = "number", np.asarray([math.nan if value is None else value for value in values], dtype=float)
+    elif all(value.__class__ in (list, tuple) for value in values):
+        kind, array = "items", np.fromiter(map(len, values), dtype=np.int64, count=len(values))
+    else:
+        kind, array = "object", values
+    cached = columns._arrays[path] = (kind, array)
+    return cached
+
+
+def _each(columns: GateColumns, path: str, test: Callable[[Any], bool]) -> Any:
+    values = columns.column(path)
+    return np.fromiter(map(test, values), dtype=bool, count=len(values))
+
+
+def _mask(columns: GateColumns, test: dict[str, Any]) -> Any:
+    """Vectorized form of one ``contracts/gate_policy.json`` test; equal to the compiled scalar program."""
+    op = test["op"]
+    if op in ("all", "any"):
+        parts = [_mask(columns, part) for part in test["of"]]
+        return (np.logical_and if op == "all" else np.logical_or).reduce(parts)
+    if op == "not":
+        return ~_mask(columns, test["test"])
+    path = test["path"]
+    kind, array = _array(columns, path)
+    if op == "empty":
+        if kind == "str":
+            return array == ""
+        if kind == "items":
+            return array == 0
+        return _each(columns, path, lambda value: not value)
+    if op in ("in", "not_in"):
+        values = frozenset(test.get("values", ()))
+        if kind == "str" and all(value.__class__ is str for value in values):
+            found = np.isin(array, sorted(values))
+        else:
+            found = _each(columns, path, values.__contains__)
+        return found if op == "in" else ~found
+    if op in ("eq", "ne"):
+        value = test.get("value")
+        if (kind == "str" and value.__class__ is str) or (kind == "number" and value.__class__ in _NUMBERS):
+            equal = array == value  # NaN (an unset number) equals nothing, like None
+        else:
+            equal = _each(columns, path, lambda item: item == value)
+        return equal if op == "eq" else ~equal
+    if op in _COMPARE:
+        value = test.get("value")
+        if kind == "number" and value.__class__ in _NUMBERS:
+            return getattr(np, _COMPARE[op])(array, value)  # NaN compares False: unset never fails
+        compare = _SCALAR_COMPARE[op]
+        return _each(columns, path, lambda item: item is not None and compare(item, value))
+    if op == "has_item_ci":
+        needle = str(test.get("value", "")).lower()
+        return _each(columns, path, lambda items: any(item.lower() == needle for item in items))
+    raise ValidationError(f"unknown gate policy op {op!r}")
+
+
+def gate_flags(
+    columns: GateColumns, *, use_numpy: bool = False, policy: GatePolicy | None = None
+) -> Sequence[int]:
+    """Bitmask of failed ``policy`` rules per row, bit ``i`` for rule ``i`` (see ``GatePolicy.flags``).
+
+    The plain path runs the compiled (memoized) scalar program on each row;
+    the NumPy path builds one boolean mask per rule from the rule's tests.
+    """
+    policy = policy or default_gate_policy()
+    if not _use_numpy(use_numpy):
+        return [policy.flags(*row) for row in columns.rows]
+    flags = np.zeros(len(columns), dtype=np.int64)
+    for rule in policy.rules:
+        flags |= _mask(columns, rule.when).astype(np.int64) << rule.bit
+    return flags
+
+
+def route_codes(columns: GateColumns, *, use_numpy: bool = False) -> Sequence[int]:
+    """Per row: index into ``RoutingClassifier.classes`` for a known category, else ``ROUTE_BY_KEYWORDS``."""
+    if not _use_numpy(use_numpy):
+        return [
+            ROUTE_BY_KEYWORDS if (code := DEFAULT_ROUTER.category_index(category)) is None else code
+            for category in columns.column("what.category")
+        ]
+
+    # Categories repeat heavily, so normalize each distinct value once with
+    # ``str`` methods and scatter the codes back.
+    categories, inverse = np.unique(np.asarray(columns.column("what.category"), dtype=str), return_inverse=True)
+    by_category = [DEFAULT_ROUTER.category_index(category) for category in categories.tolist()]
+    codes = np.asarray([ROUTE_BY_KEYWORDS if code is None else code for code in by_category], dtype=np.int8)
+    return codes[inverse.reshape(-1)]
+
+
+def evaluate_dual_gate_batch(
+    columns: GateColumns, *, use_numpy: bool = False, policy: GatePolicy | None = None
+) -> list[GateResults]:
+    """Row-for-row equal to ``evaluate_dual_gate`` under any compiled ``policy``.
+
+    Building the per-row ``GateResults`` dominates, so the plain path is the
+    default; ``use_numpy=True`` only pays off when masks are reused.
+    """
+    policy = policy or default_gate_policy()
+    flags = gate_flags(columns, use_numpy=use_numpy, policy=policy)
+    if not isinstance(flags, list):
+        flags = flags.tolist()
+    return [gate_results_for(policy, value) for value in flags]
+
+
+def route_edge_class_batch(
+    columns: GateColumns, *, use_numpy: bool = False
+) -> list[tuple[str, float, list[RoutingAlternative], bool]]:
+    """Row-for-row equal to ``route_edge_class``; keyword routing runs once per distinct text."""
+    by_text: dict[tuple[str, str], tuple[str, float, tuple[RoutingAlternative, ...], bool]] = {}
+    routes = []
+    codes = route_codes(columns, use_numpy=use_numpy)
+    for code, description, goal in zip(codes, columns.column("what.description"), columns.column("why.goal")):
+        if code == ROUTE_BY_KEYWORDS:
+            key = (description, goal)
+            route = by_text.get(key)
+            if route is None:
+                route = by_text[key] = DEFAULT_ROUTER.route_text(*key)
+        else:
+            route = DEFAULT_ROUTER.category_route(code)
+        edge_class, confidence, alternatives, needs_disambiguation = route
+        routes.append((edge_class, confidence, list(alternatives), needs_disambiguation))
+    return routes
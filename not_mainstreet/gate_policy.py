@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable
+
+from .errors import ValidationError
+
+
+DEFAULT_POLICY_PATH = Path(__file__).resolve().parents[1] / "contracts" / "gate_policy.json"
+DECISION_CACHE_SIZE = 65536
+
+# Failure code -> (GateResults list, fails noumenal, fails phenomenal). Any
+# MISSING_FIELD fails both gates, as in the original hand-written checks.
+RULE_CODES: dict[str, tuple[str, bool, bool]] = {
+    "MISSING_FIELD": ("missing_fields", True, True),
+    "POLICY_BLOCK": ("policy_blocks", True, False),
+    "CONFLICT": ("conflicts", False, True),
+    "FEASIBILITY_BLOCK": ("feasibility_blocks", False, True),
+}
+
+_PATH = re.compile(r"(who|why|what|where|when)\.([a-z][a-z0-9_]*)")
+_COMPARE = {"eq": "==", "ne": "!=", "lt": "<", "le": "<=", "gt": ">", "ge": ">="}
+
+
+@dataclass(frozen=True)
+class GateRule:
+    rule_id: str
+    code: str
+    field: str
+    message: str
+    bit: int
+    when: Any = field(default=None, repr=False, compare=False)  # the contract's test, for ``gate_batch``
+
+
+@dataclass(frozen=True)
+class GatePolicy:
+    """A gate policy compiled to one Python function returning a bitmask of failed rules.
+
+    Rule ``i`` sets bit ``1 << i``. Decisions are memoized on the values the
+    rules read, so a resubmission with identical inputs costs one cache hit;
+    the cache belongs to the compiled policy and therefore to its version.
+    ``templates`` holds the ``GateResults`` parts built per bitmask (see
+    ``edge_proposal.gate_results_for``) and is likewise per policy instance.
+    """
+
+    name: str
+    policy_version: str
+    rules: tuple[GateRule, ...]
+    source: str
+    program: Callable[..., int]  # (who, why, what, where, when) -> failed-rule bitmask
+    decisions: Any  # the lru_cache behind ``program``
+    templates: dict[int, tuple[Any, ...]] = field(default_factory=dict, repr=False, compare=False)
+
+    def flags(self, who: Any, why: Any, what: Any, where: Any, when: Any) -> int:
+        return self.program(who, why, what, where, when)
+
+    def cache_info(self) -> Any:
+        return self.decisions.cache_info()
+
+
+class _Compiler:
+    def __init__(self) -> None:
+        self.constants: dict[str, Any] = {}
+        self.paths: dict[str, str] = {}  # "who.user_id" -> argument name in the generated code
+
+    def constant(self, value: Any) -> str:
+        name = f"_c{len(self.constants)}"
+        self.constants[name] = value
+        return name
+
+    def path(self, path: Any) -> str:
+        if not isinstance(path, str) or not _PATH.fullmatch(path):
+            raise ValidationError(f"gate policy path must look like 'who.user_id', got {path!r}")
+        return self.paths.setdefault(path, f"_v{len(self.paths)}")
+
+    def expression(self, test: Any) -> str:
+        if not isinstance(test, dict):
+            raise ValidationError(f"gate policy test must be an object, got {test!r}")
+        op = test.get("op")
+        if op in ("all", "any"):
+            parts = [self.expression(part) for part in test.get("of") or ()]
+            if not parts:
+                raise ValidationError(f"gate policy '{op}' needs a non-empty 'of' list")
+            return "(" + (" and " if op == "all" else " or ").join(parts) + ")"
+        if op == "not":
+            return f"(not {self.expression(test.get('test'))})"
+        value = self.path(test.get("path"))
+        if op == "empty":
+            return f"(not {value})"
+        if op in ("in", "not_in"):
+            values = self.constant(frozenset(test.get("values", ())))
+            return f"({value} {'in' if op == 'in' else 'not in'} {values})"
+        if op in ("eq", "ne"):
+            return f"({value} {_COMPARE[op]} {self.constant(test.get('value'))})"
+        if op in _COMPARE:
+            # An unset (None) field never fails an ordering comparison.
+            return f"({value} is not None and {value} {_COMPARE[op]} {self.constant(test.get('value'))})"
+        if op == "has_item_ci":
+            needle = self.constant(str(test.get("value", "")).lower())
+            return f"any(item.lower() == {needle} for item in {value})"
+        raise ValidationError(f"unknown gate policy op {op!r}")
+
+
+def compile_gate_policy(document: dict[str, Any], *, cache_size: int = DECISION_CACHE_SIZE) -> GatePolicy:
+    """Compile a ``contracts/gate_policy.json``-shaped document; raises ``ValidationError`` if malformed."""
+    version = document.get("policy_version")
+    if not isinstance(version, str) or not version:
+        raise ValidationError("gate policy needs a policy_version")
+    compiler = _Compiler()
+    rules, terms = [], []
+    for bit, raw in enumerate(document.get("rules") or ()):
+        if raw.get("code") not in RULE_CODES:
+            raise ValidationError(f"gate policy rule {raw.get('id')!r} has unknown code {raw.get('code')!r}")
+        rule_id, field_, message = raw.get("id", f"rule-{bit}"), raw.get("field", ""), raw.get("message", "")
+        rules.append(GateRule(rule_id, raw["code"], field_, message, bit, raw.get("when")))
+        terms.append(f"{compiler.expression(raw.get('when'))} << {bit}")
+    if not rules:
+        raise ValidationError("gate policy has no rules")
+
+    params = ", ".join(compiler.paths.values())
+    # List fields are passed as tuples so the memoized decision can hash them.
+    reads = ", ".join(f"{path} if {path}.__class__ is not list else tuple({path})" for path in compiler.paths)
+    source = (
+        f"def _decide({params}):\n"
+        f"    return {' | '.join(terms)}\n"
+        f"\n"
+        f"def flags(who, why, what, where, when):\n"
+        f"    return decide({reads})\n"
+    )
+    namespace: dict[str, Any] = dict(compiler.constants)
+    exec(compile(source, f"<gate policy {version}>", "exec"), namespace)  # noqa: S102 - constants are bound, never inlined
+    decisions = namespace["decide"] = lru_cache(maxsize=cache_size)(namespace["_decide"])
+    return GatePolicy(
+        name=document.get("name", "gate_policy"),
+        policy_version=version,
+        rules=tuple(rules),
+        source=source,
+        program=namespace["flags"],
+        decisions=decisions,
+    )
+
+
+def load_gate_policy(path: str | Path = DEFAULT_POLICY_PATH) -> GatePolicy:
+    return compile_gate_policy(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+@lru_cache(maxsize=1)
+def default_gate_policy() -> GatePolicy:
+    """The policy in ``contracts/gate_policy.json``, compiled once per process."""
+    return load_gate_policy()
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Mapping
+
+from .cdm import CDMRecord
+from .errors import GitPublishError
+
+
+DEFAULT_MESSAGE_TEMPLATE = "publish: {documents} document(s), {artifacts} artifact(s) [{targets}]\n\n{listing}\n"
+
+
+@dataclass(frozen=True)
+class GitCommit:
+    sha: str
+    tree: str
+    parent: str | None
+    paths: tuple[str, ...]
+    message: str
+    pushed: bool = False
+
+
+class GitPublisher:
+    """Commits adapter artifacts to a Git work tree, one commit per batch.
+
+    Uses index plumbing instead of porcelain: one ``hash-object --stdin-paths``
+    and one ``update-index --index-info`` per batch regardless of file count,
+    then ``write-tree``/``commit-tree``/``update-ref``. Each batch builds its
+    tree in a private index (``GIT_INDEX_FILE``) seeded from the branch head, so
+    anything staged by hand never leaks into a publish commit. The branch ref
+    is moved with compare-and-swap on its previous value, and a batch that
+    leaves the tree unchanged produces no commit. Instances are callable with
+    the ``Orchestrator.process_many`` ``on_batch`` signature.
+
+    The work tree must have ``branch`` checked out (or be a dedicated publish
+    repository created by ``ensure_repository``): after each commit the
+    published paths are also recorded in the work tree's own index, so
+    ``git status`` stays clean for them and a later manual commit keeps them.
+    ``commit`` raises ``GitPublishError`` if another branch is checked out.
+    """
+
+    def __init__(
+        self,
+        worktree: str | os.PathLike[str] = ".",
+        *,
+        branch: str = "main",
+        remote: str | None = None,
+        push: bool = True,
+        message_template: str = DEFAULT_MESSAGE_TEMPLATE,
+        author_name: str = "not-mainstreet publisher",
+        author_email: str = "publisher@not-mainstreet.invalid",
+        git: str = "git",
+    ) -> None:
+        self.worktree = Path(worktree).resolve()
+        self.branch = branch
+        self.remote = remote
+        self.push_enabled = push and remote is not None
+        self.message_template = message_template
+        self.git = git
+        self._env = {
+            **os.environ,
+            "GIT_AUTHOR_NAME": author_name,
+            "GIT_AUTHOR_EMAIL": author_email,
+            "GIT_COMMITTER_NAME": author_name,
+            "GIT_COMMITTER_EMAIL": author_email,
+        }
+        self.commits: list[GitCommit] = []
+
+    def _run(self, *args: str, stdin: str | None = None, env: Mapping[str, str] | None = None) -> str:
+        proc = subprocess.run(
+            [self.git, *args],
+            cwd=self.worktree,
+            input=stdin,
+            capture_output=True,
+            text=True,
+            env=env or self._env,
+        )
+        if proc.returncode != 0:
+            raise GitPublishError(f"git {args[0]} failed ({proc.returncode}): {proc.stderr.strip()}")
+        return proc.stdout
+
+    def ensure_repository(self) -> None:
+        """Initialise the work tree as a repository on ``branch`` if it is not one yet."""
+        self.worktree.mkdir(parents=True, exist_ok=True)
+        if not (self.worktree / ".git").exists():
+            self._run("init", "-q", "-b", self.branch)
+
+    def _relative(self, path: str) -> str:
+        resolved = Path(path).resolve()
+        try:
+            return resolved.relative_to(self.worktree).as_posix()
+        except ValueError:
+            raise GitPublishError(f"{path} is outside work tree {self.worktree}") from None
+
+    def _head(self) -> str | None:
+        proc = subprocess.run(
+            [self.git, "rev-parse", "--verify", "-q", f"refs/heads/{self.branch}"],
+            cwd=self.worktree,
+            capture_output=True,
+            text=True,
+            env=self._env,
+        )
+        return proc.stdout.strip() or None
+
+    def _checked_out(self) -> None:
+        proc = subprocess.run(
+            [self.git, "symbolic-ref", "-q", "HEAD"],
+            cwd=self.worktree,
+            capture_output=True,
+            text=True,
+            env=self._env,
+        )
+        head = proc.stdout.strip()
+        if head != f"refs/heads/{self.branch}":
+            raise GitPublishError(
+                f"{self.worktree} has {head or 'a detached HEAD'} checked out, not {self.branch}; "
+                "publish from a dedicated work tree on that branch"
+            )
+
+    def message(self, paths: Mapping[str, list[str]], records: Iterable[CDMRecord] = ()) -> str:
+        """Render the commit message; depends only on the batch contents, not on time or order."""
+        records = list(records)
+        return self.message_template.format(
+            documents=len({r.document_id for r in records}),
+            artifacts=sum(len(p) for p in paths.values()),
+            targets=",".join(sorted(paths)),
+            listing="\n".join(sorted(f"{r.document_id} v{r.version} {r.cdm_hash[:12]}" for r in records)),
+        )
+
+    def commit(self, paths: Mapping[str, list[str]], records: Iterable[CDMRecord] = ()) -> GitCommit | None:
+        """Stage every path in ``paths`` (target -> files) and record a single commit."""
+        relative = sorted({self._relative(p) for files in paths.values() for p in files})
+        if not relative:
+            return None
+        self._checked_out()
+        oids = self._run("hash-object", "-w", "--stdin-paths", stdin="\n".join(relative) + "\n").split()
+        if len(oids) != len(relative):
+            raise GitPublishError(f"hash-object returned {len(oids)} ids for {len(relative)} paths")
+        entries = "".join(f"100644 {oid}\t{path}\n" for oid, path in zip(oids, relative))
+        parent = self._head()
+        with tempfile.TemporaryDirectory(prefix="publish-index-") as tmp:
+            env = {**self._env, "GIT_INDEX_FILE": os.path.join(tmp, "index")}
+            if parent is not None:
+                self._run("read-tree", parent, env=env)
+            self._run("update-index", "--add", "--index-info", stdin=entries, env=env)
+            tree = self._run("write-tree", env=env).strip()
+        if parent is not None and self._run("rev-parse", f"{parent}^{{tree}}").strip() == tree:
+            return None
+
+        message = self.message(paths, records)
+        args = ["commit-tree", "--no-gpg-sign", tree, "-F", "-"]
+        if parent is not None:
+            args[3:3] = ["-p", parent]
+        sha = self._run(*args, stdin=message).strip()
+        # Compare-and-swap: fails if another writer moved the branch since _head().
+        self._run("update-ref", f"refs/heads/{self.branch}", sha, parent or "0" * 40)
+        # The branch is checked out: record the same blobs in the real index, leaving other entries alone.
+        self._run("update-index", "--add", "--index-info", stdin=entries)
+
+        pushed = False
+        if self.push_enabled:
+            self._run("push", "-q", self.remote, f"refs/heads/{self.branch}:refs/heads/{self.branch}")
+            pushed = True
+        result = GitCommit(sha=sha, tree=tree, parent=parent, paths=tuple(relative), message=message, pushed=pushed)
+        self.commits.append(result)
+        return result
+
+    def __call__(self, records: list[CDMRecord], paths: dict[str, list[str]]) -> None:
+        self.commit(paths, records)
@@ -1,8 +1,35 @@
 from __future__ import annotations
 
+import functools
 import hashlib
+import heapq
+import json
 import math
+import os
+import tempfile
+import threading
+import time
+from collections import Counter
 from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Sequence
+
+from .errors import ValidationError
+
+try:  # optional; the plain-loop path gives identical certificates
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None  # type: ignore[assignment]
+
+
+HAS_NUMPY = np is not None
+# Vectorized cosines may differ from ``math.cos`` in the last ulp, so any
+# longitude index within this relative distance of a cell edge is recomputed
+# with ``quantize_location`` to keep cells identical to the scalar path.
+_EDGE_TOLERANCE = 1e-9
+
+SNAPSHOT_VERSION = "density-index/v1"
+DEFAULT_PRESENCE_WINDOW_S = 3600.0
 
 
 @dataclass(frozen=True)
@@ -41,11 +68,26 @@ def quantize_location(lat: float, lon: float, cell_size_m: float = 500.0) -> Gri
     return GridCell(x=x, y=y)
 
 
+def _cell_key(cell: GridCell) -> tuple[int, int]:
+    return cell.x, cell.y
+
+
 def cell_commitment(cell: GridCell, epoch_salt: str) -> str:
     payload = f"{cell.x}:{cell.y}:{epoch_salt}".encode("utf-8")
     return hashlib.sha256(payload).hexdigest()
 
 
+@functools.lru_cache(maxsize=65_536)
+def _cached_commitment(x: int, y: int, epoch_salt: str) -> str:
+    # In-process only: hot cells are hashed once, nothing here is snapshotted.
+    return cell_commitment(GridCell(x=x, y=y), epoch_salt)
+
+
+def _grid_fingerprint(cell_size_m: float, epoch_salt: str) -> str:
+    # Identifies a grid without revealing its epoch salt.
+    return hashlib.sha256(f"{float(cell_size_m)!r}:{epoch_salt}".encode("utf-8")).hexdigest()
+
+
 def _density_band(count: int) -> str:
     if count < 5:
         return "sparse"
@@ -83,3 +125,305 @@ def build_density_certificate(
         verified=population_floor >= min_k,
         population_floor=population_floor,
     )
+
+
+def _quantize_many(points: Sequence[tuple[float, float]], cell_size_m: float) -> list[tuple[int, int]]:
+    """``quantize_location`` for many points at once, as ``(x, y)`` tuples."""
+    if not len(points):
+        return []
+    coords = np.asarray(points, dtype=float).reshape(-1, 2)
+    lat, lon = coords[:, 0], coords[:, 1]
+    if not ((lat >= -90.0) & (lat <= 90.0) & (lon >= -180.0) & (lon <= 180.0)).all():
+        raise ValueError("invalid latitude/longitude")
+
+    # Same operations in the same order as quantize_location, elementwise.
+    x = np.floor((lat * _meters_per_degree_lat()) / cell_size_m)
+    scaled = (lon * (111_320.0 * np.maximum(0.01, np.cos(np.radians(lat))))) / cell_size_m
+    y = np.floor(scaled)
+    margin = _EDGE_TOLERANCE * np.maximum(1.0, np.abs(scaled))
+    cells = list(zip(x.astype(np.int64).tolist(), y.astype(np.int64).tolist()))
+    for i in np.flatnonzero(np.floor(scaled - margin) != np.floor(scaled + margin)).tolist():
+        cell = quantize_location(float(lat[i]), float(lon[i]), cell_size_m=cell_size_m)
+        cells[i] = (cell.x, cell.y)
+    return cells
+
+
+def build_density_certificates(
+    subjects: Iterable[tuple[float, float]],
+    peer_locations: Iterable[tuple[float, float]],
+    *,
+    min_k: int,
+    cell_size_m: float,
+    epoch_salt: str,
+    use_numpy: bool | None = None,
+) -> list[DensityCertificate]:
+    """``build_density_certificate`` for every subject against one shared peer set.
+
+    Peers are quantized once into a cell histogram, so the cost is
+    O(subjects + peers) instead of O(subjects x peers); certificates are equal
+    to the per-subject function's. NumPy is used when installed (``use_numpy``
+    overrides), otherwise ``quantize_location`` runs in a plain loop.
+    """
+    subjects, peers = list(subjects), list(peer_locations)
+    if cell_size_m <= 0:
+        raise ValueError("cell_size_m must be > 0")
+    if use_numpy and np is None:
+        raise RuntimeError("numpy is not installed")
+    if HAS_NUMPY if use_numpy is None else use_numpy:
+        subject_cells = _quantize_many(subjects, cell_size_m)
+        histogram = Counter(_quantize_many(peers, cell_size_m))
+    else:
+        subject_cells = [_cell_key(quantize_location(lat, lon, cell_size_m=cell_size_m)) for lat, lon in subjects]
+        histogram = Counter(_cell_key(quantize_location(lat, lon, cell_size_m=cell_size_m)) for lat, lon in peers)
+
+    # Subjects sharing a cell share one (frozen) certificate.
+    by_cell: dict[tuple[int, int], DensityCertificate] = {}
+    certificates = []
+    for x, y in subject_cells:
+        cert = by_cell.get((x, y))
+        if cert is None:
+            population_floor = histogram[(x, y)] + 1
+            cert = by_cell[(x, y)] = DensityCertificate(
+                cell_commitment=cell_commitment(GridCell(x=x, y=y), epoch_salt),
+                density_band=_density_band(population_floor),
+                verified=population_floor >= min_k,
+                population_floor=population_floor,
+            )
+        certificates.append(cert)
+    return certificates
+
+
+class DensityIndex:
+    """Long-lived per-cell presence counts for one ``(cell_size_m, epoch_salt)`` grid.
+
+    Members ``join`` with a coordinate that is quantized once and only its cell
+    is kept; ``leave`` or ``window_s`` without a refresh removes them again.
+    ``certificate`` then answers ``build_density_certificate`` for the current
+    members as peers with one cell lookup. Expiry is amortized into every call
+    through a heap of presence deadlines. Cells are held only as their salted
+    ``cell_commitment``, so snapshots carry neither coordinates, grid cells nor
+    the epoch salt, and restore the counts without asking members to rejoin.
+    """
+
+    def __init__(
+        self,
+        *,
+        cell_size_m: float,
+        epoch_salt: str,
+        window_s: float = DEFAULT_PRESENCE_WINDOW_S,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if cell_size_m <= 0:
+            raise ValueError("cell_size_m must be > 0")
+        self.cell_size_m = cell_size_m
+        self.epoch_salt = epoch_salt
+        self.window_s = window_s
+        self.clock = clock
+        self._members: dict[str, tuple[str, float]] = {}  # member -> (cell commitment, last seen)
+        self._counts: Counter[str] = Counter()
+        self._deadlines: list[tuple[float, str]] = []  # (last seen, member); stale entries are skipped
+        self._lock = threading.RLock()
+
+    @property
+    def key(self) -> tuple[float, str]:
+        return self.cell_size_m, self.epoch_salt
+
+    def __len__(self) -> int:
+        with self._lock:
+            self.expire()
+            return len(self._members)
+
+    def _cell(self, lat: float, lon: float) -> str:
+        cell = quantize_location(lat, lon, cell_size_m=self.cell_size_m)
+        return _cached_commitment(cell.x, cell.y, self.epoch_salt)
+
+    def _drop(self, member_id: str) -> None:
+        cell, _ = self._members.pop(member_id)
+        self._counts[cell] -= 1
+        if not self._counts[cell]:
+            del self._counts[cell]
+
+    def join(self, member_id: str, lat: float, lon: float, *, at: float | None = None) -> None:
+        """Record (or move and refresh) a member's presence at ``at`` (default: now)."""
+        cell = self._cell(lat, lon)
+        seen = self.clock() if at is None else at
+        with self._lock:
+            if member_id in self._members:
+                self._drop(member_id)
+            self._members[member_id] = (cell, seen)
+            self._counts[cell] += 1
+            heapq.heappush(self._deadlines, (seen, member_id))
+            self.expire()
+
+    def leave(self, member_id: str) -> bool:
+        with self._lock:
+            if member_id not in self._members:
+                return False
+            self._drop(member_id)
+            return True
+
+    def expire(self, now: float | None = None) -> int:
+        """Drop members not seen within ``window_s`` of ``now``; returns how many left."""
+        cutoff = (self.clock() if now is None else now) - self.window_s
+        removed = 0
+        with self._lock:
+            deadlines = self._deadlines
+            while deadlines and deadlines[0][0] < cutoff:
+                seen, member_id = heapq.heappop(deadlines)
+                current = self._members.get(member_id)
+                if current is not None and current[1] == seen:
+                    self._drop(member_id)
+                    removed += 1
+            return removed
+
+    def count(self, lat: float, lon: float) -> int:
+        """Current members in the cell containing ``(lat, lon)``."""
+        cell = self._cell(lat, lon)
+        with self._lock:
+            self.expire()
+            return self._counts.get(cell, 0)
+
+    def certificate(self, lat: float, lon: float, *, min_k: int, member_id: str | None = None) -> DensityCertificate:
+        """``build_density_certificate`` with the current members as peers.
+
+        Pass the subject's own ``member_id`` so its presence is not counted
+        twice (the subject always counts as one local participant).
+        """
+        cell = self._cell(lat, lon)
+        with self._lock:
+            self.expire()
+            same_cell = self._counts.get(cell, 0)
+            own = self._members.get(member_id) if member_id is not None else None
+            if own is not None and own[0] == cell:
+                same_cell -= 1
+        population_floor = same_cell + 1
+        return DensityCertificate(
+            cell_commitment=cell,
+            density_band=_density_band(population_floor),
+            verified=population_floor >= min_k,
+            population_floor=population_floor,
+        )
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            self.expire()
+            return {
+                "version": SNAPSHOT_VERSION,
+                "cell_size_m": self.cell_size_m,
+                "grid": _grid_fingerprint(self.cell_size_m, self.epoch_salt),
+                "window_s": self.window_s,
+                "members": [[member_id, cell, seen] for member_id, (cell, seen) in self._members.items()],
+            }
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Write ``snapshot()`` atomically (temp file renamed over ``path``)."""
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        text = json.dumps(self.snapshot(), separators=(",", ":"))
+        fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(text)
+            os.replace(tmp, target)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        snapshot: dict[str, Any],
+        *,
+        epoch_salt: str,
+        cell_size_m: float | None = None,
+        window_s: float | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> DensityIndex:
+        """Restore an index; raises ``ValidationError`` if the snapshot is for another grid or format.
+
+        The salt is not stored in the snapshot, so the caller supplies it; cell
+        counts are rebuilt from the members. ``window_s`` overrides the window
+        the snapshot was saved with.
+        """
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            raise ValidationError(f"unsupported density snapshot version {snapshot.get('version')!r}")
+        if (cell_size_m is not None and snapshot["cell_size_m"] != cell_size_m) or (
+            snapshot["grid"] != _grid_fingerprint(snapshot["cell_size_m"], epoch_salt)
+        ):
+            raise ValidationError("density snapshot belongs to another (cell_size_m, epoch_salt)")
+        index = cls(
+            cell_size_m=snapshot["cell_size_m"],
+            epoch_salt=epoch_salt,
+            window_s=snapshot["window_s"] if window_s is None else window_s,
+            clock=clock,
+        )
+        for member_id, cell, seen in snapshot["members"]:
+            index._members[member_id] = (cell, seen)
+        index._deadlines = [(seen, member_id) for member_id, (_, seen) in index._members.items()]
+        heapq.heapify(index._deadlines)
+        index._counts = Counter(cell for cell, _ in index._members.values())
+        index.expire()
+        return index
+
+    @classmethod
+    def load(
+        cls,
+        path: str | os.PathLike[str],
+        *,
+        epoch_salt: str,
+        cell_size_m: float | None = None,
+        window_s: float | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> DensityIndex:
+        snapshot = json.loads(Path(path).read_text(encoding="utf-8"))
+        return cls.from_snapshot(
+            snapshot, cell_size_m=cell_size_m, epoch_salt=epoch_salt, window_s=window_s, clock=clock
+        )
+
+
+class DensityIndexes:
+    """``DensityIndex`` per ``(cell_size_m, epoch_salt)``, each snapshotted to its own file under ``root``."""
+
+    def __init__(
+        self,
+        root: str | os.PathLike[str] = "data/density",
+        *,
+        window_s: float = DEFAULT_PRESENCE_WINDOW_S,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.root = Path(root)
+        self.window_s = window_s
+        self.clock = clock
+        self._indexes: dict[tuple[float, str], DensityIndex] = {}
+        self._lock = threading.Lock()
+
+    def path(self, cell_size_m: float, epoch_salt: str) -> Path:
+        # Hashed so file names do not reveal the epoch salt.
+        name = _grid_fingerprint(cell_size_m, epoch_salt)[:32]
+        return self.root / f"{name}.json"
+
+    def get(self, cell_size_m: float, epoch_salt: str) -> DensityIndex:
+        """The live index for this grid, restored from its snapshot on first use."""
+        key = (float(cell_size_m), epoch_salt)
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is None:
+                path = self.path(*key)
+                if path.exists():
+                    index = DensityIndex.load(
+                        path, cell_size_m=key[0], epoch_salt=epoch_salt, window_s=self.window_s, clock=self.clock
+                    )
+                else:
+                    index = DensityIndex(
+                        cell_size_m=key[0], epoch_salt=epoch_salt, window_s=self.window_s, clock=self.clock
+                    )
+                self._indexes[key] = index
+            return index
+
+    def save_all(self) -> int:
+        with self._lock:
+            indexes = list(self._indexes.values())
+        for index in indexes:
+            index.save(self.path(*index.key))
+        return len(indexes)
@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import heapq
+import json
+import threading
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from typing import Any, Iterable
+
+from .database import EngineDatabases, initialize_databases, run_query
+from .edge_proposal import EdgeProposal
+from .location_privacy import quantize_location
+
+
+DEFAULT_CELL_SIZE_M = 500.0
+DEFAULT_MAX_RING = 2
+# Passed the gate and not yet matched; later statuses leave the index.
+OPEN_STATUS = "gated"
+_DAY_S = 86_400.0
+# Windows longer than this are kept apart so they don't widen every bisection.
+LONG_WINDOW_S = 31 * _DAY_S
+
+Place = tuple  # ("cell", x, y) for a parseable "lat,lon" geo, else ("area", service_area)
+
+
+@dataclass(frozen=True)
+class MatchCandidate:
+    proposal_id: str
+    score: float  # locality weight (1 / (1 + ring)) times window overlap
+    ring: int  # grid cells between the two proposals; 0 for the same cell or service area
+    overlap: float  # overlap as a share of the shorter window; 1.0 for identical window labels
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    proposal_id: str
+    user_id: str
+    start: float | None
+    end: float | None
+    label: str
+
+
+@dataclass(slots=True)
+class _Intervals:
+    """Windows sorted by start; ``max_span`` bounds how far back an overlap can start."""
+
+    starts: list[float] = field(default_factory=list)
+    entries: list[_Entry] = field(default_factory=list)
+    max_span: float = 0.0
+
+    def add(self, entry: _Entry) -> None:
+        i = bisect_right(self.starts, entry.start)
+        self.starts.insert(i, entry.start)
+        self.entries.insert(i, entry)
+        self.max_span = max(self.max_span, entry.end - entry.start)
+
+    def remove(self, entry: _Entry) -> None:
+        i = bisect_left(self.starts, entry.start)
+        while self.entries[i].proposal_id != entry.proposal_id:
+            i += 1
+        del self.starts[i], self.entries[i]
+        if not self.entries:
+            self.max_span = 0.0
+
+    def overlapping(self, start: float, end: float) -> Iterable[tuple[_Entry, float]]:
+        lo = bisect_left(self.starts, start - self.max_span)
+        hi = bisect_left(self.starts, end)
+        span = end - start
+        for entry in self.entries[lo:hi]:
+            if entry.end > start:
+                shared = min(end, entry.end) - max(start, entry.start)
+                yield entry, shared / min(span, entry.end - entry.start)
+
+
+@dataclass(slots=True)
+class _Bucket:
+    """Proposals of one tenant, routing class and place: short and long windows, plus labelled windows.
+
+    Windows longer than ``LONG_WINDOW_S`` live in their own list, so one outlier
+    only widens the bisection of that (small) list. Each label keeps its
+    entries sorted by ``proposal_id``, the tie-break among equal label scores.
+    """
+
+    short: _Intervals = field(default_factory=_Intervals)
+    long: _Intervals = field(default_factory=_Intervals)
+    labels: dict[str, tuple[list[str], list[_Entry]]] = field(default_factory=dict)
+
+    def add(self, entry: _Entry) -> None:
+        if entry.start is None:
+            ids, entries = self.labels.setdefault(entry.label, ([], []))
+            i = bisect_left(ids, entry.proposal_id)
+            ids.insert(i, entry.proposal_id)
+            entries.insert(i, entry)
+        elif entry.end - entry.start > LONG_WINDOW_S:
+            self.long.add(entry)
+        else:
+            self.short.add(entry)
+
+    def remove(self, entry: _Entry) -> None:
+        if entry.start is None:
+            ids, entries = self.labels[entry.label]
+            i = bisect_left(ids, entry.proposal_id)
+            del ids[i], entries[i]
+            if not ids:
+                del self.labels[entry.label]
+        elif entry.end - entry.start > LONG_WINDOW_S:
+            self.long.remove(entry)
+        else:
+            self.short.remove(entry)
+
+    def overlapping(self, start: float, end: float) -> Iterable[tuple[_Entry, float]]:
+        yield from self.short.overlapping(start, end)
+        yield from self.long.overlapping(start, end)
+
+    def labelled(self, label: str) -> list[_Entry]:
+        return self.labels.get(label, ((), []))[1]
+
+    def __len__(self) -> int:
+        return len(self.short.entries) + len(self.long.entries) + sum(len(ids) for ids, _ in self.labels.values())
+
+
+def _instant(value: str, *, end: bool) -> float:
+    value = value.strip()
+    if len(value) == 10:  # a bare date covers the whole day
+        day = datetime.combine(date.fromisoformat(value), datetime.min.time(), timezone.utc).timestamp()
+        return day + _DAY_S if end else day
+    moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+def window_interval(window: str) -> tuple[float, float] | None:
+    """``when.window`` as epoch seconds: ``"2026-03-01"``, ``"start/end"`` (ISO dates or datetimes), else ``None``."""
+    parts = window.split("/")
+    if len(parts) not in (1, 2):
+        return None
+    try:
+        start = _instant(parts[0], end=False)
+        end = _instant(parts[-1], end=True)
+    except ValueError:
+        return None
+    return (start, end) if end > start else None
+
+
+def _fields(proposal: EdgeProposal | dict[str, Any]) -> tuple[str, str, str, str, str, str, str, str]:
+    if isinstance(proposal, EdgeProposal):
+        return (
+            proposal.proposal_id,
+            proposal.tenant_id,
+            proposal.who.user_id,
+            proposal.routing_class,
+            proposal.status,
+            proposal.where.geo,
+            proposal.where.service_area,
+            proposal.when.window,
+        )
+    return (
+        proposal["proposal_id"],
+        proposal["tenant_id"],
+        proposal["who"]["user_id"],
+        proposal["routing_class"],
+        proposal["status"],
+        proposal["where"].get("geo", ""),
+        proposal["where"].get("service_area", ""),
+        proposal["when"].get("window", ""),
+    )
+
+
+class ProposalMatcher:
+    """In-memory index of gated proposals for locality-weighted counterpart matching.
+
+    Proposals are bucketed by tenant, ``routing_class`` and place: a grid cell
+    (``location_privacy.quantize_location``) when ``where.geo`` is ``"lat,lon"``,
+    otherwise ``where.service_area``. Each bucket keeps windows sorted by start
+    so overlaps are found by bisection. ``match`` walks grid rings outwards and
+    stops once no farther ring could beat the current top ``k``, so a query
+    never scans the full set of open proposals.
+    """
+
+    def __init__(self, *, cell_size_m: float = DEFAULT_CELL_SIZE_M, max_ring: int = DEFAULT_MAX_RING) -> None:
+        self.cell_size_m = cell_size_m
+        self.max_ring = max_ring
+        self._buckets: dict[tuple[str, str, Place], _Bucket] = {}
+        self._by_id: dict[str, tuple[tuple[str, str, Place], _Entry]] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, proposal_id: str) -> bool:
+        return proposal_id in self._by_id
+
+    @classmethod
+    def from_database(cls, cfg: EngineDatabases = EngineDatabases(), **kwargs: Any) -> ProposalMatcher:
+        """Index every open (``status == "gated"``) proposal stored in ``edge_proposals``."""
+        initialize_databases(cfg)
+        matcher = cls(**kwargs)
+        rows = run_query(cfg.outside_path, "SELECT payload_json FROM edge_proposals WHERE status = ?", (OPEN_STATUS,))
+        for row in rows:
+            matcher.add(json.loads(row["payload_json"]))
+        return matcher
+
+    def place(self, geo: str, service_area: str) -> Place:
+        try:
+            lat, lon = (float(part) for part in geo.split(","))
+            cell = quantize_location(lat, lon, cell_size_m=self.cell_size_m)
+        except ValueError:
+            return ("area", service_area.strip().lower())
+        return ("cell", cell.x, cell.y)
+
+    def _key_and_entry(self, proposal: EdgeProposal | dict[str, Any]) -> tuple[tuple[str, str, Place], _Entry, str]:
+        proposal_id, tenant_id, user_id, routing_class, status, geo, service_area, window = _fields(proposal)
+        interval = window_interval(window)
+        start, end = interval if interval else (None, None)
+        entry = _Entry(proposal_id, user_id, start, end, window.strip().lower())
+        return (tenant_id, routing_class, self.place(geo, service_area)), entry, status
+
+    def add(self, proposal: EdgeProposal | dict[str, Any]) -> bool:
+        """Index (or re-index) ``proposal``; a proposal that is no longer ``gated`` is dropped instead."""
+        key, entry, status = self._key_and_entry(proposal)
+        with self._lock:
+            self.remove(entry.proposal_id)
+            if status != OPEN_STATUS:
+                return False
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = _Bucket()
+            bucket.add(entry)
+            self._by_id[entry.proposal_id] = (key, entry)
+            return True
+
+    def remove(self, proposal_id: str) -> bool:
+        with self._lock:
+            indexed = self._by_id.pop(proposal_id, None)
+            if indexed is None:
+                return False
+            key, entry = indexed
+            bucket = self._buckets[key]
+            bucket.remove(entry)
+            if not len(bucket):
+                del self._buckets[key]
+            return True
+
+    def match(self, proposal: str | EdgeProposal | dict[str, Any], k: int = 10) -> list[MatchCandidate]:
+        """Top ``k`` counterparts: same tenant and routing class, overlapping window, other users, nearest first."""
+        if k <= 0:
+            return []
+        if isinstance(proposal, str):
+            key, entry = self._by_id[proposal]
+        else:
+            key, entry, _ = self._key_and_entry(proposal)
+        tenant_id, routing_class, place = key
+        found: list[tuple[float, str, int, float]] = []  # (-score, proposal_id, ring, overlap)
+        rings = self.max_ring if place[0] == "cell" else 0
+        for ring in range(rings + 1):
+            locality = 1.0 / (1 + ring)
+            with self._lock:
+                for spot in _ring(place, ring):
+                    bucket = self._buckets.get((tenant_id, routing_class, spot))
+                    if bucket is not None:
+                        self._collect(bucket, entry, locality, ring, k, found)
+            # Overlap is at most 1, so ring r + 1 scores at most 1 / (r + 2); a
+            # tie could still win on proposal_id, hence the strict comparison.
+            if len(found) >= k and -heapq.nsmallest(k, found)[-1][0] > 1.0 / (2 + ring):
+                break
+        return [
+            MatchCandidate(proposal_id, -negative, ring, overlap)
+            for negative, proposal_id, ring, overlap in heapq.nsmallest(k, found)
+        ]
+
+    @staticmethod
+    def _collect(bucket: _Bucket, query: _Entry, locality: float, ring: int, k: int, found: list) -> None:
+        if query.start is None:
+            # Label matches in one bucket all score ``locality``, so only the
+            # first ``k`` eligible ids (the tie-break order) can make the top k.
+            taken = 0
+            for entry in bucket.labelled(query.label):
+                if entry.proposal_id != query.proposal_id and entry.user_id != query.user_id:
+                    found.append((-round(locality, 6), entry.proposal_id, ring, 1.0))
+                    taken += 1
+                    if taken == k:
+                        break
+            return
+        for entry, overlap in bucket.overlapping(query.start, query.end):
+            if entry.proposal_id != query.proposal_id and entry.user_id != query.user_id:
+                found.append((-round(locality * overlap, 6), entry.proposal_id, ring, round(overlap, 6)))
+
+
+def _ring(place: Place, ring: int) -> Iterable[Place]:
+    if ring == 0:
+        yield place
+        return
+    _, x, y = place
+    for dx in range(-ring, ring + 1):
+        yield ("cell", x + dx, y - ring)
+        yield ("cell", x + dx, y + ring)
+    for dy in range(-ring + 1, ring):
+        yield ("cell", x - ring, y + dy)
+        yield ("cell", x + ring, y + dy)
@@ -1,32 +1,315 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import islice
+from typing import Any, Callable, Iterable, TypeVar
 
-from .adapters import feigenbuam, kantian_ivi
+from .adapters import ArtifactWriter, feigenbuam, kantian_ivi
+from .api_transport import FeigenbuamApiPublisher, HTTPConnectionPool, KantianApiPublisher
+from .canonicalization import cdm_hash
 from .cdm import CDMRecord, CDMRegistry
-from .errors import UnsupportedIntegrationMode
+from .errors import ContractError, TransportError, UnsupportedIntegrationMode, ValidationError
+from .publish_queue import PublishQueue, PublishWorkerPool
+from .search import SearchIndex
+
+
+Publisher = Callable[[CDMRecord], str]
+BatchPublisher = Callable[[list[CDMRecord]], list[str]]
+BatchHook = Callable[[list[CDMRecord], dict[str, list[str]]], None]
+
+_T = TypeVar("_T")
+
+SUPPORTED_MODES = ("git", "api")
+
+
+@dataclass
+class TargetStatus:
+    target: str
+    state: str = "pending"  # pending|retrying|success|failed
+    attempts: int = 0
+    latency_ms: float = 0.0
+    path: str | None = None
+    error: str | None = None
 
 
 @dataclass
 class PublishResult:
     record: CDMRecord
-    kantian_ivi_path: str
-    feigenbuam_path: str
+    kantian_ivi_path: str | None
+    feigenbuam_path: str | None
+    targets: dict[str, TargetStatus] = field(default_factory=dict)
+    latency_ms: float = 0.0
+
+    @property
+    def complete(self) -> bool:
+        return all(t.state == "success" for t in self.targets.values())
+
+
+@dataclass
+class BatchPublishStats:
+    documents: int = 0
+    published: int = 0
+    unchanged: int = 0
+    failed: int = 0
+    batches: int = 0
+    hash_s: float = 0.0
+    publish_s: float = 0.0
+    elapsed_s: float = 0.0
+    target_failures: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def docs_per_s(self) -> float:
+        return self.documents / self.elapsed_s if self.elapsed_s else 0.0
+
+
+def _git_publishers(writer: ArtifactWriter, history: CDMRegistry, published: dict[str, int]) -> dict[str, Publisher]:
+    return {
+        "kantian_ivi": partial(kantian_ivi.publish_git, writer=writer),
+        "feigenbuam": partial(feigenbuam.publish_git, writer=writer, history=history, published=published),
+    }
+
+
+def _git_batch_publishers(
+    writer: ArtifactWriter, history: CDMRegistry, published: dict[str, int]
+) -> dict[str, BatchPublisher]:
+    return {
+        "kantian_ivi": partial(kantian_ivi.publish_git_many, writer=writer),
+        "feigenbuam": partial(feigenbuam.publish_git_many, writer=writer, history=history, published=published),
+    }
+
+
+def _check_mode(mode: str) -> None:
+    if mode not in SUPPORTED_MODES:
+        raise UnsupportedIntegrationMode(
+            f"mode '{mode}' not implemented; supported modes are {', '.join(SUPPORTED_MODES)}"
+        )
+
+
+def _batched(items: Iterable[_T], size: int) -> Iterable[list[_T]]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
 
 
 class Orchestrator:
-    def __init__(self, mode: str = "git") -> None:
+    """Registers CDM versions and fans publication out to every adapter target.
+
+    Targets publish concurrently and retry independently (spec section 11), so a
+    failing target neither blocks nor fails the others; per-target outcomes are
+    reported in ``PublishResult.targets``. In ``api`` mode each target is reached
+    over a pool of keep-alive HTTP connections at ``endpoints[target]``; a
+    ``ContractError`` (4xx) is terminal while transport errors are retried.
+    """
+
+    def __init__(
+        self,
+        mode: str = "git",
+        *,
+        publishers: dict[str, Publisher] | None = None,
+        batch_publishers: dict[str, BatchPublisher] | None = None,
+        max_attempts: int = 3,
+        retry_backoff_s: float = 0.05,
+        queue: PublishQueue | None = None,
+        writer: ArtifactWriter | None = None,
+        endpoints: dict[str, str] | None = None,
+        connections_per_target: int = 4,
+        search: SearchIndex | None = None,
+    ) -> None:
         self.mode = mode
+        self.writer = writer or ArtifactWriter()
         self.registry = CDMRegistry()
+        # Newest version per document confirmed published to feigenbuam: the delta base.
+        self.search_published: dict[str, int] = {}
+        self.search = search
+        if search is not None:
+            self.registry.subscribe(search.index_record)
+        self.http_pools: dict[str, HTTPConnectionPool] = {}
+        if mode == "api" and publishers is None:
+            missing = {"kantian_ivi", "feigenbuam"} - set(endpoints or {})
+            if missing:
+                raise ValidationError(f"api mode needs endpoints for {', '.join(sorted(missing))}")
+            self.http_pools = {
+                name: HTTPConnectionPool(url, size=connections_per_target) for name, url in endpoints.items()
+            }
+            api = {
+                "kantian_ivi": KantianApiPublisher(self.http_pools["kantian_ivi"]),
+                "feigenbuam": FeigenbuamApiPublisher(
+                    self.http_pools["feigenbuam"], history=self.registry, published=self.search_published
+                ),
+            }
+            publishers = dict(api)
+            if batch_publishers is None:
+                batch_publishers = {name: publisher.publish_many for name, publisher in api.items()}
+        if publishers is None:
+            publishers = _git_publishers(self.writer, self.registry, self.search_published)
+            if batch_publishers is None:
+                batch_publishers = _git_batch_publishers(self.writer, self.registry, self.search_published)
+        self.publishers = publishers
+        if batch_publishers is None:
+            batch_publishers = {name: _one_by_one(publisher) for name, publisher in self.publishers.items()}
+        self.batch_publishers = batch_publishers
+        # Records registered by process_many whose batch failed on some target;
+        # they are republished the next time they show up, even if unchanged.
+        self._unpublished: dict[str, CDMRecord] = {}
+        self.max_attempts = max_attempts
+        self.retry_backoff_s = retry_backoff_s
+        self._queue = queue
+        self._pool = ThreadPoolExecutor(max_workers=max(1, len(self.publishers)), thread_name_prefix="publish")
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True)
+        for pool in self.http_pools.values():
+            pool.close()
+
+    @property
+    def queue(self) -> PublishQueue:
+        if self._queue is None:
+            self._queue = PublishQueue()
+        return self._queue
+
+    def enqueue(self, document_id: str, cdm_payload: dict, *, lane: str = "ingest") -> CDMRecord:
+        """Register ``cdm_payload`` and queue it durably for every target instead of publishing inline."""
+        _check_mode(self.mode)
+        record = self.registry.register(document_id=document_id, payload=cdm_payload)
+        self.queue.enqueue(record, self.publishers, lane=lane)
+        return record
+
+    def workers(self, *, workers: int = 4, poll_interval_s: float = 0.05) -> PublishWorkerPool:
+        """Worker pool that drains ``queue`` through this orchestrator's publishers."""
+        return PublishWorkerPool(self.queue, self.publishers, workers=workers, poll_interval_s=poll_interval_s)
+
+    def _publish_target(self, status: TargetStatus, publisher: Publisher, record: CDMRecord) -> TargetStatus:
+        status.path = self._with_retries(status, lambda: publisher(record))
+        return status
+
+    def _with_retries(self, status: TargetStatus, attempt: Callable[[], Any]) -> Any:
+        started = time.perf_counter()
+        value = None
+        while True:
+            status.attempts += 1
+            try:
+                value = attempt()
+                status.state = "success"
+                status.error = None
+                break
+            except Exception as exc:  # noqa: BLE001 - failures are reported per target
+                status.error = f"{type(exc).__name__}: {exc}"
+                if isinstance(exc, ContractError) or status.attempts >= self.max_attempts:
+                    status.state = "failed"
+                    break
+                status.state = "retrying"
+                delay = self.retry_backoff_s * 2 ** (status.attempts - 1)
+                if isinstance(exc, TransportError) and exc.retry_after_s:
+                    delay = max(delay, exc.retry_after_s)
+                time.sleep(delay)
+        status.latency_ms = (time.perf_counter() - started) * 1000
+        return value
+
+    def publish(self, record: CDMRecord) -> PublishResult:
+        started = time.perf_counter()
+        statuses = {name: TargetStatus(target=name) for name in self.publishers}
+        futures = [
+            self._pool.submit(self._publish_target, statuses[name], publisher, record)
+            for name, publisher in self.publishers.items()
+        ]
+        for future in futures:
+            future.result()
+        return PublishResult(
+            record=record,
+            kantian_ivi_path=statuses["kantian_ivi"].path if "kantian_ivi" in statuses else None,
+            feigenbuam_path=statuses["feigenbuam"].path if "feigenbuam" in statuses else None,
+            targets=statuses,
+            latency_ms=(time.perf_counter() - started) * 1000,
+        )
 
     def process(self, document_id: str, cdm_payload: dict) -> PublishResult:
         record = self.registry.register(document_id=document_id, payload=cdm_payload)
 
-        if self.mode != "git":
-            raise UnsupportedIntegrationMode(
-                f"mode '{self.mode}' not implemented; default 'git' is the supported mode"
-            )
+        _check_mode(self.mode)
+
+        return self.publish(record)
+
+    def publish_batch(self, records: list[CDMRecord]) -> tuple[dict[str, TargetStatus], dict[str, list[str]]]:
+        """Publish ``records`` with one call per target; targets still run concurrently."""
+        statuses = {name: TargetStatus(target=name) for name in self.batch_publishers}
+        futures = {
+            name: self._pool.submit(self._with_retries, statuses[name], lambda p=publisher: p(records))
+            for name, publisher in self.batch_publishers.items()
+        }
+        results = {name: future.result() for name, future in futures.items()}
+        paths = {name: value for name, value in results.items() if statuses[name].state == "success"}
+        return statuses, paths
+
+    def process_many(
+        self,
+        items: Iterable[tuple[str, dict]],
+        *,
+        batch_size: int = 500,
+        hash_workers: int = 1,
+        on_batch: BatchHook | None = None,
+    ) -> BatchPublishStats:
+        """Register and publish ``(document_id, cdm_payload)`` pairs in batches.
+
+        Hashes are computed up front (on a process pool when ``hash_workers > 1``)
+        and handed to the registry, so unchanged documents are dropped before any
+        adapter runs. Each batch of changed records is written with one call per
+        target, and ``on_batch`` receives the written paths so a caller can, for
+        example, record a single Git commit per batch.
+        """
+
+        _check_mode(self.mode)
+
+        stats = BatchPublishStats()
+        started = time.perf_counter()
+        hash_pool = ProcessPoolExecutor(max_workers=hash_workers) if hash_workers > 1 else None
+        try:
+            for batch in _batched(items, batch_size):
+                hashed_at = time.perf_counter()
+                payloads = [payload for _, payload in batch]
+                if hash_pool is not None:
+                    chunksize = max(1, len(payloads) // (hash_workers * 4))
+                    digests = list(hash_pool.map(cdm_hash, payloads, chunksize=chunksize))
+                else:
+                    digests = [cdm_hash(payload) for payload in payloads]
+
+                changed = []
+                for (document_id, payload), digest in zip(batch, digests):
+                    previous = self.registry.latest(document_id)
+                    record = self.registry.register(document_id, payload, digest=digest)
+                    if record is previous and self._unpublished.get(document_id) is not record:
+                        stats.unchanged += 1
+                    else:
+                        changed.append(record)
+                stats.documents += len(batch)
+                stats.hash_s += time.perf_counter() - hashed_at
+                if not changed:
+                    continue
+
+                published_at = time.perf_counter()
+                statuses, paths = self.publish_batch(changed)
+                stats.publish_s += time.perf_counter() - published_at
+                stats.batches += 1
+                failed = [name for name, status in statuses.items() if status.state != "success"]
+                for name in failed:
+                    stats.target_failures[name] = stats.target_failures.get(name, 0) + len(changed)
+                if failed:
+                    stats.failed += len(changed)
+                    self._unpublished.update((record.document_id, record) for record in changed)
+                else:
+                    stats.published += len(changed)
+                    for record in changed:
+                        self._unpublished.pop(record.document_id, None)
+                if on_batch is not None and paths:
+                    on_batch(changed, paths)
+        finally:
+            if hash_pool is not None:
+                hash_pool.shutdown(wait=True)
+        stats.elapsed_s = time.perf_counter() - started
+        return stats
+
 
-        k_path = kantian_ivi.publish_git(record)
-        f_path = feigenbuam.publish_git(record)
-        return PublishResult(record=record, kantian_ivi_path=k_path, feigenbuam_path=f_path)
+def _one_by_one(publisher: Publisher) -> BatchPublisher:
+    return lambda records: [publisher(record) for record in records]
@@ -1,20 +1,23 @@
 from __future__ import annotations
 
 import json
+import sqlite3
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
 
-from .database import EngineDatabases, initialize_databases, run_query
+from .database import EngineDatabases, initialize_databases, run_query, transaction
 from .edge_proposal import (
-    What,
-    When,
-    Where,
-    Who,
-    Why,
+    RESUBMITTABLE_STATUSES,
+    STATUS_TRANSITIONS,
     build_edge_proposal,
+    evaluation_to_dict,
+    five_w_from_dicts,
     proposal_to_dict,
 )
+from .errors import ConcurrencyConflict, ValidationError
+from .search import SearchIndex, shared_index
+from .serialization import dumps
 
 
 @dataclass(frozen=True)
@@ -42,6 +45,35 @@ def submit_to_portal(submission: Submission, cfg: EngineDatabases = EngineDataba
     return int(row[0]["id"])
 
 
+def _check_version(proposal_id: str, current: int, expected: int | None) -> None:
+    if expected is not None and expected != current:
+        raise ConcurrencyConflict(f"proposal {proposal_id} is at version {current}, expected {expected}")
+
+
+def _append_event(
+    conn: sqlite3.Connection,
+    proposal_id: str,
+    tenant_id: str,
+    proposal_version: int,
+    event_type: str,
+    from_status: str | None,
+    to_status: str,
+    payload_json: str | None,
+    created_at: str,
+) -> None:
+    try:
+        conn.execute(
+            """
+            INSERT INTO edge_proposal_events
+            (proposal_id, tenant_id, proposal_version, event_type, from_status, to_status, payload_json, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (proposal_id, tenant_id, proposal_version, event_type, from_status, to_status, payload_json, created_at),
+        )
+    except sqlite3.IntegrityError as exc:  # another writer logged this version first
+        raise ConcurrencyConflict(f"proposal {proposal_id} version {proposal_version} was already written") from exc
+
+
 def submit_edge_intake(
     *,
     proposal_id: str,
@@ -55,8 +87,17 @@ def submit_edge_intake(
     when: dict[str, Any],
     thread_ref: str,
     idempotency_key: str | None = None,
+    expected_version: int | None = None,
     cfg: EngineDatabases = EngineDatabases(),
+    search: SearchIndex | None = None,
 ) -> dict[str, Any]:
+    """Gate, route and store a proposal; resubmitting an existing ``proposal_id`` stores the next version.
+
+    ``expected_version`` (0 for "must be new") makes the write conditional on
+    the stored ``proposal_version``; a mismatch raises ``ConcurrencyConflict``.
+    Every write appends to ``edge_proposal_events``. The proposal is indexed in
+    ``search``, by default the shared index at ``cfg.search_path``.
+    """
     initialize_databases(cfg)
 
     if idempotency_key:
@@ -72,61 +113,79 @@ def submit_edge_intake(
                 "idempotent_replay": True,
             }
 
-    proposal, evaluation = build_edge_proposal(
-        proposal_id=proposal_id,
-        tenant_id=tenant_id,
-        community_id=community_id,
-        session_id=session_id,
-        who=Who(**who),
-        why=Why(**why),
-        what=What(**what),
-        where=Where(**where),
-        when=When(**when),
-        thread_ref=thread_ref,
-    )
-
-    payload = proposal_to_dict(proposal)
-    evaluation_payload = {
-        "gate_results": {
-            "gate_outcome": evaluation.gate_results.gate_outcome,
-            "noumenal": evaluation.gate_results.noumenal,
-            "phenomenal": evaluation.gate_results.phenomenal,
-            "missing_fields": [s.__dict__ for s in evaluation.gate_results.missing_fields],
-            "conflicts": [s.__dict__ for s in evaluation.gate_results.conflicts],
-            "policy_blocks": [s.__dict__ for s in evaluation.gate_results.policy_blocks],
-            "feasibility_blocks": [s.__dict__ for s in evaluation.gate_results.feasibility_blocks],
-        },
-        "routing_class": evaluation.routing_class,
-        "routing_confidence": evaluation.routing_confidence,
-        "routing_alternatives": [a.__dict__ for a in evaluation.routing_alternatives],
-        "needs_disambiguation": evaluation.needs_disambiguation,
-        "next_actions": evaluation.next_actions,
-    }
+    who_, why_, what_, where_, when_ = five_w_from_dicts(who, why, what, where, when)
+    with transaction(cfg.outside_path, immediate=True) as conn:
+        current = conn.execute(
+            "SELECT tenant_id, status, proposal_version FROM edge_proposals WHERE proposal_id = ?", (proposal_id,)
+        ).fetchone()
+        if current and current["tenant_id"] != tenant_id:
+            raise ValidationError(f"proposal {proposal_id} belongs to another tenant")
+        version = current["proposal_version"] if current else 0
+        _check_version(proposal_id, version, expected_version)
+        if current and current["status"] not in RESUBMITTABLE_STATUSES:
+            raise ValidationError(f"proposal {proposal_id} is {current['status']} and can no longer be resubmitted")
 
-    run_query(
-        cfg.outside_path,
-        """
-        INSERT OR REPLACE INTO edge_proposals
-        (proposal_id, tenant_id, community_id, idempotency_key, payload_json, evaluation_json,
-         gate_outcome, routing_class, status, proposal_version, engine_version, created_at, updated_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        (
-            proposal.proposal_id,
-            proposal.tenant_id,
-            proposal.community_id,
+        proposal, evaluation = build_edge_proposal(
+            proposal_id=proposal_id,
+            tenant_id=tenant_id,
+            community_id=community_id,
+            session_id=session_id,
+            who=who_,
+            why=why_,
+            what=what_,
+            where=where_,
+            when=when_,
+            thread_ref=thread_ref,
+            proposal_version=version + 1,
+        )
+        payload = proposal_to_dict(proposal)
+        evaluation_payload = evaluation_to_dict(evaluation)
+        payload_json = dumps(payload)
+        state = (
             idempotency_key,
-            json.dumps(payload),
-            json.dumps(evaluation_payload),
+            payload_json,
+            dumps(evaluation_payload),
             proposal.gate_results.gate_outcome,
             proposal.routing_class,
             proposal.status,
             proposal.proposal_version,
             proposal.engine_version,
-            proposal.created_at,
             proposal.updated_at,
-        ),
-    )
+        )
+        if current:
+            # created_at stays the first submission's; the version check guards the row.
+            # A resubmission without a key keeps the stored one, so replays of it still resolve.
+            conn.execute(
+                """
+                UPDATE edge_proposals
+                SET idempotency_key = COALESCE(?, idempotency_key), payload_json = ?, evaluation_json = ?, gate_outcome = ?, routing_class = ?,
+                    status = ?, proposal_version = ?, engine_version = ?, updated_at = ?
+                WHERE proposal_id = ? AND proposal_version = ?
+                """,
+                (*state, proposal_id, version),
+            )
+        else:
+            conn.execute(
+                """
+                INSERT INTO edge_proposals
+                (idempotency_key, payload_json, evaluation_json, gate_outcome, routing_class, status,
+                 proposal_version, engine_version, updated_at, proposal_id, tenant_id, community_id, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (*state, proposal.proposal_id, proposal.tenant_id, proposal.community_id, proposal.created_at),
+            )
+        _append_event(
+            conn,
+            proposal_id,
+            tenant_id,
+            proposal.proposal_version,
+            "resubmitted" if current else "submitted",
+            current["status"] if current else None,
+            proposal.status,
+            payload_json,
+            proposal.updated_at,
+        )
+    (search or shared_index(cfg.search_path)).index_proposal(payload)
 
     return {"proposal": payload, "evaluation": evaluation_payload, "idempotent_replay": False}
 
@@ -137,6 +196,7 @@ def list_edge_intake(
     tenant_id: str | None = None,
     gate_outcome: str | None = None,
     routing_class: str | None = None,
+    status: str | None = None,
     limit: int = 50,
     offset: int = 0,
 ) -> list[dict[str, Any]]:
@@ -153,11 +213,14 @@ def list_edge_intake(
     if routing_class:
         clauses.append("routing_class = ?")
         params.append(routing_class)
+    if status:
+        clauses.append("status = ?")
+        params.append(status)
 
     where_sql = ("WHERE " + " AND ".join(clauses)) if clauses else ""
     sql = f"""
         SELECT proposal_id, tenant_id, community_id, payload_json, evaluation_json, status,
-               routing_class, gate_outcome, created_at, updated_at
+               routing_class, gate_outcome, proposal_version, created_at, updated_at
         FROM edge_proposals
         {where_sql}
         ORDER BY created_at DESC
@@ -175,6 +238,91 @@ def list_edge_intake(
     return out
 
 
+def list_proposals_by_status(
+    tenant_id: str,
+    status: str,
+    cfg: EngineDatabases = EngineDatabases(),
+    *,
+    limit: int = 50,
+    offset: int = 0,
+) -> list[dict[str, Any]]:
+    """Newest-first ``proposal_id``/``proposal_version``/``updated_at``, read from the covering status index alone."""
+    initialize_databases(cfg)
+    rows = run_query(
+        cfg.outside_path,
+        """
+        SELECT proposal_id, proposal_version, updated_at
+        FROM edge_proposals
+        WHERE tenant_id = ? AND status = ?
+        ORDER BY updated_at DESC
+        LIMIT ? OFFSET ?
+        """,
+        (tenant_id, status, limit, offset),
+    )
+    return [dict(r) for r in rows]
+
+
+def transition_proposal_status(
+    proposal_id: str,
+    status: str,
+    cfg: EngineDatabases = EngineDatabases(),
+    *,
+    expected_version: int | None = None,
+    search: SearchIndex | None = None,
+) -> dict[str, Any]:
+    """Move a stored proposal along ``STATUS_TRANSITIONS``; returns the updated payload (next version).
+
+    The proposal is re-indexed in ``search`` (default: the shared index at
+    ``cfg.search_path``) after the commit, so status filters see the new status.
+    """
+    initialize_databases(cfg)
+    with transaction(cfg.outside_path, immediate=True) as conn:
+        row = conn.execute(
+            "SELECT tenant_id, status, proposal_version, payload_json FROM edge_proposals WHERE proposal_id = ?",
+            (proposal_id,),
+        ).fetchone()
+        if row is None:
+            raise ValidationError(f"proposal {proposal_id} not found")
+        _check_version(proposal_id, row["proposal_version"], expected_version)
+        if status not in STATUS_TRANSITIONS.get(row["status"], ()):
+            raise ValidationError(f"invalid transition: {row['status']} -> {status}")
+
+        version = row["proposal_version"] + 1
+        now = _now()
+        payload = json.loads(row["payload_json"])
+        payload.update(status=status, proposal_version=version, updated_at=now)
+        conn.execute(
+            """
+            UPDATE edge_proposals SET status = ?, proposal_version = ?, updated_at = ?, payload_json = ?
+            WHERE proposal_id = ? AND proposal_version = ?
+            """,
+            (status, version, now, dumps(payload), proposal_id, row["proposal_version"]),
+        )
+        _append_event(conn, proposal_id, row["tenant_id"], version, "status_changed", row["status"], status, None, now)
+    (search or shared_index(cfg.search_path)).index_proposal(payload)
+    return payload
+
+
+def proposal_history(proposal_id: str, cfg: EngineDatabases = EngineDatabases()) -> list[dict[str, Any]]:
+    """Every logged version of a proposal, oldest first; ``payload`` is set for (re)submissions only."""
+    initialize_databases(cfg)
+    rows = run_query(
+        cfg.outside_path,
+        """
+        SELECT proposal_version, event_type, from_status, to_status, payload_json, created_at
+        FROM edge_proposal_events WHERE proposal_id = ? ORDER BY proposal_version
+        """,
+        (proposal_id,),
+    )
+    out = []
+    for r in rows:
+        item = dict(r)
+        raw = item.pop("payload_json")
+        item["payload"] = json.loads(raw) if raw is not None else None
+        out.append(item)
+    return out
+
+
 def list_unprocessed(cfg: EngineDatabases = EngineDatabases()) -> list[dict[str, Any]]:
     initialize_databases(cfg)
     rows = run_query(
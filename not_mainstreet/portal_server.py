@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import json
+import mmap
+import re
 from dataclasses import dataclass
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from urllib.parse import parse_qs, urlparse
 
+from .assets import AssetStore
 from .database import EngineDatabases
 from .empathy_engine import MANIFESTO_TITLE, empathy_reflection
+from .errors import ConcurrencyConflict, ValidationError
+from .matching import ProposalMatcher
 from .openclaw_bridge import OpenClawBridge, UserContext
 from .portal import (
     Submission,
@@ -17,7 +22,10 @@ from .portal import (
     submit_edge_intake,
     submit_to_portal,
     sync_submission_to_engine,
+    transition_proposal_status,
 )
+from .search import SearchIndex, shared_index
+from .serialization import dumps_bytes
 
 
 @dataclass(frozen=True)
@@ -25,13 +33,23 @@ class PortalServerConfig:
     host: str = "127.0.0.1"
     port: int = 8765
     databases: EngineDatabases = EngineDatabases()
+    assets_root: str = "assets"
+
+
+_DIGEST_PATH = re.compile(r"/assets/([0-9a-f]{64})")
+_RANGE = re.compile(r"bytes=(\d*)-(\d*)")
+# Content-addressed: a digest's bytes never change, so clients may cache forever.
+_IMMUTABLE = "public, max-age=31536000, immutable"
 
 
 class PortalRequestHandler(BaseHTTPRequestHandler):
     cfg = PortalServerConfig()
+    assets: AssetStore | None = None
+    search: SearchIndex | None = None
+    matcher: ProposalMatcher | None = None
 
     def _send_json(self, payload: dict, code: int = 200) -> None:
-        body = json.dumps(payload).encode("utf-8")
+        body = dumps_bytes(payload)
         self.send_response(code)
         self.send_header("Content-Type", "application/json; charset=utf-8")
         self.send_header("Content-Length", str(len(body)))
@@ -43,8 +61,63 @@ class PortalRequestHandler(BaseHTTPRequestHandler):
         data = self.rfile.read(length) if length else b"{}"
         return json.loads(data.decode("utf-8"))
 
+    def _send_asset(self, digest: str) -> None:
+        etag = f'"{digest}"'
+        if etag in (tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", _IMMUTABLE)
+            self.end_headers()
+            return
+
+        store = self.assets or AssetStore(self.cfg.assets_root)
+        try:
+            size = store.size(digest)
+        except KeyError:
+            self._send_json({"error": "not_found"}, code=404)
+            return
+
+        start, end, status = 0, size, HTTPStatus.OK
+        match = _RANGE.fullmatch(self.headers.get("Range", ""))
+        if match and (match.group(1) or match.group(2)):
+            if match.group(1):
+                start = int(match.group(1))
+                end = min(size, int(match.group(2)) + 1) if match.group(2) else size
+            else:
+                start = max(0, size - int(match.group(2)))
+            if start >= end:
+                self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            status = HTTPStatus.PARTIAL_CONTENT
+
+        mime = store.mime(digest)
+        body = store.get(digest) if status == HTTPStatus.OK else store.open_range(digest, start, end)
+        try:
+            self.send_response(status)
+            self.send_header("Content-Type", mime)
+            self.send_header("Content-Length", str(end - start))
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", _IMMUTABLE)
+            self.send_header("Accept-Ranges", "bytes")
+            if status == HTTPStatus.PARTIAL_CONTENT:
+                self.send_header("Content-Range", f"bytes {start}-{end - 1}/{size}")
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            # Large objects come back as an mmap; release the mapping once it is sent.
+            if isinstance(body, mmap.mmap):
+                body.close()
+
     def do_GET(self) -> None:  # noqa: N802
         parsed = urlparse(self.path)
+        asset = _DIGEST_PATH.fullmatch(parsed.path)
+        if asset:
+            self._send_asset(asset.group(1))
+            return
+
         if parsed.path == "/":
             html = render_portal_html(self.cfg.databases).encode("utf-8")
             self.send_response(HTTPStatus.OK)
@@ -67,12 +140,60 @@ class PortalRequestHandler(BaseHTTPRequestHandler):
                 tenant_id=qs.get("tenant_id", [None])[0],
                 gate_outcome=qs.get("gate_outcome", [None])[0],
                 routing_class=qs.get("routing_class", [None])[0],
+                status=qs.get("status", [None])[0],
                 limit=limit,
                 offset=offset,
             )
             self._send_json({"proposals": proposals, "limit": limit, "offset": offset})
             return
 
+        if parsed.path == "/api/search":
+            qs = parse_qs(parsed.query)
+            query = qs.get("q", [""])[0]
+            if not query.strip():
+                self._send_json({"error": "q query parameter required"}, code=400)
+                return
+            try:
+                limit = max(1, min(int(qs.get("limit", ["10"])[0]), 100))
+                offset = max(0, int(qs.get("offset", ["0"])[0]))
+            except ValueError:
+                self._send_json({"error": "limit and offset must be integers"}, code=400)
+                return
+            index = self.search or shared_index(self.cfg.databases.search_path)
+            hits = index.search(
+                query,
+                kind=qs.get("kind", [None])[0],
+                tenant_id=qs.get("tenant_id", [None])[0],
+                limit=limit,
+                offset=offset,
+            )
+            self._send_json({"query": query, "hits": [hit.__dict__ for hit in hits], "limit": limit, "offset": offset})
+            return
+
+        if parsed.path == "/api/matches":
+            qs = parse_qs(parsed.query)
+            proposal_id = qs.get("proposal_id", [""])[0]
+            if not proposal_id:
+                self._send_json({"error": "proposal_id query parameter required"}, code=400)
+                return
+            if self.matcher is None:
+                self._send_json({"error": "matching_unavailable"}, code=503)
+                return
+            try:
+                k = int(qs.get("k", ["10"])[0])
+            except ValueError:
+                k = 0
+            if not 1 <= k <= 100:
+                self._send_json({"error": "k must be an integer from 1 to 100"}, code=400)
+                return
+            try:
+                matches = self.matcher.match(proposal_id, k=k)
+            except KeyError:
+                self._send_json({"error": "not_found", "detail": "proposal is not open for matching"}, code=404)
+                return
+            self._send_json({"proposal_id": proposal_id, "matches": [m.__dict__ for m in matches], "k": k})
+            return
+
         self._send_json({"error": "not_found"}, code=404)
 
     def do_POST(self) -> None:  # noqa: N802
@@ -124,14 +245,45 @@ class PortalRequestHandler(BaseHTTPRequestHandler):
                     when=body["when"],
                     thread_ref=body["thread_ref"],
                     idempotency_key=body.get("idempotency_key"),
+                    expected_version=body.get("expected_version"),
                     cfg=self.cfg.databases,
+                    search=self.search,
                 )
+            except ConcurrencyConflict as exc:
+                self._send_json({"error": "version_conflict", "detail": str(exc)}, code=409)
+                return
             except Exception as exc:
                 self._send_json({"error": "validation_error", "detail": str(exc)}, code=400)
                 return
+            if self.matcher is not None:
+                self.matcher.add(result["proposal"])
             self._send_json(result, code=201)
             return
 
+        if parsed.path == "/api/intake/status":
+            body = self._read_json()
+            if not {"proposal_id", "status"}.issubset(body):
+                self._send_json({"error": "invalid_payload", "required": ["proposal_id", "status"]}, code=400)
+                return
+            try:
+                proposal = transition_proposal_status(
+                    body["proposal_id"],
+                    body["status"],
+                    self.cfg.databases,
+                    expected_version=body.get("expected_version"),
+                    search=self.search,
+                )
+            except ConcurrencyConflict as exc:
+                self._send_json({"error": "version_conflict", "detail": str(exc)}, code=409)
+                return
+            except ValidationError as exc:
+                self._send_json({"error": "validation_error", "detail": str(exc)}, code=400)
+                return
+            if self.matcher is not None:
+                self.matcher.add(proposal)
+            self._send_json({"proposal": proposal})
+            return
+
         if parsed.path == "/api/assistant/empathy":
             body = self._read_json()
             intent = body.get("intent", "unspecified")
@@ -195,6 +347,15 @@ class PortalRequestHandler(BaseHTTPRequestHandler):
 
 
 def run_portal_server(cfg: PortalServerConfig = PortalServerConfig()) -> ThreadingHTTPServer:
-    handler = type("ConfiguredPortalRequestHandler", (PortalRequestHandler,), {"cfg": cfg})
+    handler = type(
+        "ConfiguredPortalRequestHandler",
+        (PortalRequestHandler,),
+        {
+            "cfg": cfg,
+            "assets": AssetStore(cfg.assets_root),
+            "search": shared_index(cfg.databases.search_path),
+            "matcher": ProposalMatcher.from_database(cfg.databases),
+        },
+    )
     server = ThreadingHTTPServer((cfg.host, cfg.port), handler)
     return server
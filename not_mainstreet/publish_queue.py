@@ -0,0 +1,432 @@
+from __future__ import annotations
+
+import json
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+from .cdm import CDMRecord
+from .database import run_query, transaction
+from .errors import ConcurrencyConflict, ContractError, TransportError
+
+
+LANES = ("ingest", "replay")
+
+_QUEUE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS publish_jobs (
+    job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    target TEXT NOT NULL,
+    document_id TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    cdm_hash TEXT NOT NULL,
+    payload_json TEXT NOT NULL,
+    lane TEXT NOT NULL,
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    last_error TEXT,
+    lease_token TEXT,
+    enqueued_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_publish_jobs_claim
+  ON publish_jobs (state, lane, next_attempt_at, job_id);
+
+CREATE INDEX IF NOT EXISTS idx_publish_jobs_target_document
+  ON publish_jobs (target, document_id, version);
+
+CREATE TABLE IF NOT EXISTS publish_cursors (
+    target TEXT PRIMARY KEY,
+    last_job_id INTEGER NOT NULL,
+    document_id TEXT,
+    version INTEGER,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+@dataclass(frozen=True)
+class PublishJob:
+    job_id: int
+    target: str
+    document_id: str
+    version: int
+    cdm_hash: str
+    payload_json: str
+    lane: str
+    state: str
+    attempts: int
+    next_attempt_at: float
+    last_error: str | None = None
+    lease_token: str | None = None
+
+    def record(self) -> CDMRecord:
+        return CDMRecord(
+            document_id=self.document_id,
+            version=self.version,
+            payload=json.loads(self.payload_json),
+            cdm_hash=self.cdm_hash,
+        )
+
+
+@dataclass(frozen=True)
+class PublishCursor:
+    target: str
+    last_job_id: int
+    document_id: str | None
+    version: int | None
+    updated_at: float
+
+
+class PublishQueue:
+    """Durable per-target publish queue backed by SQLite (spec sections 9.4, 10.4, 15).
+
+    Jobs move ``pending -> in_flight -> done``; a failed attempt goes back to
+    ``pending`` with exponential backoff plus jitter until ``max_attempts`` is
+    reached, after which it is ``dead`` and can be replayed. Claims prefer the
+    ``ingest`` lane but hand every ``replay_every``-th claim to ``replay`` so
+    neither lane starves. Each target keeps a cursor: the highest job id below
+    which everything is settled, which is where a restarted worker resumes.
+
+    A claim is a lease of ``lease_s`` seconds carrying a fresh ``lease_token``;
+    ``ack`` and ``fail`` raise ``ConcurrencyConflict`` unless the job still
+    holds that token. Opening a queue never touches in-flight jobs, since other
+    workers may still hold them; a job whose lease has expired (its worker
+    crashed) is returned to ``pending`` by the next ``claim`` or ``recover``.
+
+    Versions of one document publish in order, one at a time per target: a job
+    is claimable only while no other job for its ``(target, document_id)`` is in
+    flight or pending at a lower version. A pending job older than a version
+    already published is settled as ``superseded`` instead of being published.
+    """
+
+    def __init__(
+        self,
+        path: str = "data/publish_queue.db",
+        *,
+        max_attempts: int = 5,
+        backoff_base_s: float = 0.5,
+        backoff_cap_s: float = 300.0,
+        jitter: float = 0.5,
+        replay_every: int = 4,
+        lease_s: float = 600.0,
+        clock: Callable[[], float] = time.time,
+        rng: random.Random | None = None,
+    ) -> None:
+        self.path = path
+        self.max_attempts = max_attempts
+        self.backoff_base_s = backoff_base_s
+        self.backoff_cap_s = backoff_cap_s
+        self.jitter = jitter
+        self.replay_every = max(1, replay_every)
+        self.lease_s = lease_s
+        self.clock = clock
+        self._rng = rng or random.Random()
+        self._claims = 0
+        self._lock = threading.Lock()
+        with transaction(path) as conn:
+            conn.executescript(_QUEUE_SCHEMA)
+
+    def recover(self) -> int:
+        """Return ``in_flight`` jobs whose lease has expired to ``pending``."""
+        with transaction(self.path, immediate=True) as conn:
+            return self._expire_leases(conn, self.clock())
+
+    def _expire_leases(self, conn: sqlite3.Connection, now: float) -> int:
+        cur = conn.execute(
+            """
+            UPDATE publish_jobs SET state = 'pending', lease_token = NULL, updated_at = ?
+            WHERE state = 'in_flight' AND updated_at <= ?
+            """,
+            (now, now - self.lease_s),
+        )
+        return cur.rowcount
+
+    def enqueue(self, record: CDMRecord, targets: Iterable[str], *, lane: str = "ingest") -> list[int]:
+        """Queue ``record`` for each target; a version already queued or published is skipped."""
+        if lane not in LANES:
+            raise ValueError(f"unknown lane {lane!r}")
+        now = self.clock()
+        payload_json = json.dumps(record.payload, sort_keys=True, ensure_ascii=False)
+        job_ids = []
+        with transaction(self.path) as conn:
+            for target in targets:
+                exists = conn.execute(
+                    "SELECT 1 FROM publish_jobs WHERE target = ? AND document_id = ? AND version = ?",
+                    (target, record.document_id, record.version),
+                ).fetchone()
+                if exists:
+                    continue
+                cur = conn.execute(
+                    """
+                    INSERT INTO publish_jobs
+                    (target, document_id, version, cdm_hash, payload_json, lane, state,
+                     next_attempt_at, enqueued_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, 'pending', ?, ?, ?)
+                    """,
+                    (target, record.document_id, record.version, record.cdm_hash, payload_json, lane, now, now, now),
+                )
+                job_ids.append(cur.lastrowid)
+        return job_ids
+
+    def replay(self, target: str, *, after_job_id: int = 0, states: tuple[str, ...] = ("dead",)) -> int:
+        """Re-queue settled jobs for ``target`` on the replay lane as fresh jobs."""
+        now = self.clock()
+        marks = ",".join("?" for _ in states)
+        with transaction(self.path) as conn:
+            cur = conn.execute(
+                f"""
+                INSERT INTO publish_jobs
+                (target, document_id, version, cdm_hash, payload_json, lane, state,
+                 next_attempt_at, enqueued_at, updated_at)
+                SELECT target, document_id, version, cdm_hash, payload_json, 'replay', 'pending', ?, ?, ?
+                FROM publish_jobs AS j
+                WHERE target = ? AND job_id > ? AND state IN ({marks})
+                  AND NOT EXISTS (
+                    SELECT 1 FROM publish_jobs AS o
+                    WHERE o.target = j.target AND o.document_id = j.document_id
+                      AND o.version = j.version AND o.state IN ('pending', 'in_flight')
+                  )
+                ORDER BY job_id
+                """,
+                (now, now, now, target, after_job_id, *states),
+            )
+            return cur.rowcount
+
+    def _lane_order(self) -> tuple[str, str]:
+        with self._lock:
+            self._claims += 1
+            turn = self._claims % self.replay_every == 0
+        return ("replay", "ingest") if turn else ("ingest", "replay")
+
+    def claim(self, targets: Iterable[str] | None = None) -> PublishJob | None:
+        """Atomically move the next due job to ``in_flight`` and return it."""
+        now = self.clock()
+        target_list = list(targets) if targets is not None else None
+        target_sql = ""
+        if target_list is not None:
+            if not target_list:
+                return None
+            target_sql = f" AND target IN ({','.join('?' for _ in target_list)})"
+        lanes = self._lane_order()
+        with transaction(self.path, immediate=True) as conn:
+            self._expire_leases(conn, now)
+            row = self._next_due(conn, lanes, now, target_sql, target_list or ())
+            if row is None:
+                return None
+            token = uuid.uuid4().hex
+            conn.execute(
+                """
+                UPDATE publish_jobs SET state = 'in_flight', attempts = attempts + 1, lease_token = ?, updated_at = ?
+                WHERE job_id = ?
+                """,
+                (token, now, row["job_id"]),
+            )
+        fields = {k: row[k] for k in PublishJob.__dataclass_fields__}
+        fields.update(state="in_flight", attempts=row["attempts"] + 1, lease_token=token)
+        return PublishJob(**fields)
+
+    def _next_due(
+        self, conn: sqlite3.Connection, lanes: tuple[str, str], now: float, target_sql: str, targets: Iterable[str]
+    ) -> sqlite3.Row | None:
+        """The next claimable job, settling superseded ones on the way."""
+        while True:
+            row = None
+            for lane in lanes:
+                row = conn.execute(
+                    f"""
+                    SELECT * FROM publish_jobs AS j
+                    WHERE state = 'pending' AND lane = ? AND next_attempt_at <= ?{target_sql}
+                      AND NOT EXISTS (
+                        SELECT 1 FROM publish_jobs AS o
+                        WHERE o.target = j.target AND o.document_id = j.document_id AND o.job_id != j.job_id
+                          AND (o.state = 'in_flight' OR (o.state = 'pending' AND o.version < j.version))
+                      )
+                    ORDER BY next_attempt_at, job_id LIMIT 1
+                    """,
+                    (lane, now, *targets),
+                ).fetchone()
+                if row is not None:
+                    break
+            if row is None:
+                return None
+            newer = conn.execute(
+                """
+                SELECT 1 FROM publish_jobs
+                WHERE target = ? AND document_id = ? AND version > ? AND state = 'done' LIMIT 1
+                """,
+                (row["target"], row["document_id"], row["version"]),
+            ).fetchone()
+            if newer is None:
+                return row
+            conn.execute(
+                "UPDATE publish_jobs SET state = 'superseded', updated_at = ? WHERE job_id = ?", (now, row["job_id"])
+            )
+            self._advance_cursor(conn, row["target"], now)
+
+    def backoff_s(self, attempts: int) -> float:
+        delay = min(self.backoff_cap_s, self.backoff_base_s * 2 ** max(0, attempts - 1))
+        return delay + self._rng.uniform(0, delay * self.jitter)
+
+    def _check_lease(self, cur: sqlite3.Cursor, job: PublishJob) -> None:
+        if cur.rowcount != 1:
+            raise ConcurrencyConflict(f"publish job {job.job_id} is no longer leased to this worker")
+
+    def ack(self, job: PublishJob) -> None:
+        """Mark ``job`` published; raises ``ConcurrencyConflict`` if its lease was lost."""
+        now = self.clock()
+        with transaction(self.path) as conn:
+            cur = conn.execute(
+                """
+                UPDATE publish_jobs SET state = 'done', last_error = NULL, lease_token = NULL, updated_at = ?
+                WHERE job_id = ? AND state = 'in_flight' AND lease_token = ?
+                """,
+                (now, job.job_id, job.lease_token),
+            )
+            self._check_lease(cur, job)
+            self._advance_cursor(conn, job.target, now)
+
+    def fail(
+        self, job: PublishJob, error: str, *, terminal: bool = False, retry_after_s: float | None = None
+    ) -> str:
+        """Record a failed attempt; returns the job's new state (``pending`` or ``dead``).
+
+        ``retry_after_s`` (a server's ``Retry-After``) is a floor on the backoff.
+        Raises ``ConcurrencyConflict`` if the job's lease was lost.
+        """
+        now = self.clock()
+        if terminal or job.attempts >= self.max_attempts:
+            state, next_at = "dead", now
+        else:
+            state, next_at = "pending", now + max(self.backoff_s(job.attempts), retry_after_s or 0.0)
+        with transaction(self.path) as conn:
+            cur = conn.execute(
+                """
+                UPDATE publish_jobs
+                SET state = ?, next_attempt_at = ?, last_error = ?, lease_token = NULL, updated_at = ?
+                WHERE job_id = ? AND state = 'in_flight' AND lease_token = ?
+                """,
+                (state, next_at, error, now, job.job_id, job.lease_token),
+            )
+            self._check_lease(cur, job)
+            if state == "dead":
+                self._advance_cursor(conn, job.target, now)
+        return state
+
+    def _advance_cursor(self, conn: sqlite3.Connection, target: str, now: float) -> None:
+        row = conn.execute(
+            """
+            SELECT job_id, document_id, version FROM publish_jobs
+            WHERE target = ? AND state IN ('done', 'dead', 'superseded')
+              AND job_id < COALESCE(
+                (SELECT MIN(job_id) FROM publish_jobs WHERE target = ? AND state IN ('pending', 'in_flight')),
+                9223372036854775807)
+            ORDER BY job_id DESC LIMIT 1
+            """,
+            (target, target),
+        ).fetchone()
+        if row is None:
+            return
+        conn.execute(
+            """
+            INSERT INTO publish_cursors (target, last_job_id, document_id, version, updated_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(target) DO UPDATE SET
+              last_job_id = excluded.last_job_id, document_id = excluded.document_id,
+              version = excluded.version, updated_at = excluded.updated_at
+            WHERE excluded.last_job_id > publish_cursors.last_job_id
+            """,
+            (target, row["job_id"], row["document_id"], row["version"], now),
+        )
+
+    def cursor(self, target: str) -> PublishCursor | None:
+        rows = run_query(self.path, "SELECT * FROM publish_cursors WHERE target = ?", (target,))
+        return PublishCursor(**dict(rows[0])) if rows else None
+
+    def counts(self, target: str | None = None) -> dict[str, int]:
+        sql = "SELECT state, COUNT(*) AS n FROM publish_jobs"
+        params: tuple[object, ...] = ()
+        if target is not None:
+            sql += " WHERE target = ?"
+            params = (target,)
+        return {r["state"]: r["n"] for r in run_query(self.path, sql + " GROUP BY state", params)}
+
+    def jobs(self, target: str, document_id: str) -> list[PublishJob]:
+        rows = run_query(
+            self.path,
+            "SELECT * FROM publish_jobs WHERE target = ? AND document_id = ? ORDER BY job_id",
+            (target, document_id),
+        )
+        return [PublishJob(**{k: r[k] for k in PublishJob.__dataclass_fields__}) for r in rows]
+
+
+class PublishWorkerPool:
+    """Threads that drain a ``PublishQueue`` through the given per-target publishers."""
+
+    def __init__(
+        self,
+        queue: PublishQueue,
+        publishers: dict[str, Callable[[CDMRecord], str]],
+        *,
+        workers: int = 4,
+        poll_interval_s: float = 0.05,
+    ) -> None:
+        self.queue = queue
+        self.publishers = publishers
+        self.workers = max(1, workers)
+        self.poll_interval_s = poll_interval_s
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    def run_once(self) -> bool:
+        """Claim and publish a single job; ``False`` when nothing is due."""
+        job = self.queue.claim(self.publishers)
+        if job is None:
+            return False
+        try:
+            try:
+                self.publishers[job.target](job.record())
+            except Exception as exc:  # noqa: BLE001 - failures are recorded on the job
+                self.queue.fail(
+                    job,
+                    f"{type(exc).__name__}: {exc}",
+                    terminal=isinstance(exc, ContractError),
+                    retry_after_s=exc.retry_after_s if isinstance(exc, TransportError) else None,
+                )
+            else:
+                self.queue.ack(job)
+        except ConcurrencyConflict:
+            pass  # the lease expired and the job was claimed again; its new holder settles it
+        return True
+
+    def drain(self) -> int:
+        """Publish every job that is currently due, on the calling thread."""
+        processed = 0
+        while self.run_once():
+            processed += 1
+        return processed
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            if not self.run_once():
+                self._stop.wait(self.poll_interval_s)
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._threads = [
+            threading.Thread(target=self._loop, name=f"publish-worker-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+from .adapters.feigenbuam import chunk_cdm
+from .cdm import CDMRecord
+from .database import run_query, transaction
+
+
+_SEARCH_SCHEMA = """
+CREATE TABLE IF NOT EXISTS search_docs (
+    rowid INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    ref_id TEXT NOT NULL,
+    item_id TEXT NOT NULL,
+    tenant_id TEXT,
+    version INTEGER,
+    title TEXT NOT NULL,
+    body TEXT NOT NULL,
+    meta_json TEXT NOT NULL DEFAULT '{}'
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_search_docs_item
+  ON search_docs (kind, ref_id, item_id);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS search_fts USING fts5(
+    title, body,
+    content='search_docs', content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2'
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS search_vocab USING fts5vocab(search_fts, 'row');
+
+CREATE TRIGGER IF NOT EXISTS search_docs_ai AFTER INSERT ON search_docs BEGIN
+  INSERT INTO search_fts (rowid, title, body) VALUES (new.rowid, new.title, new.body);
+END;
+
+CREATE TRIGGER IF NOT EXISTS search_docs_ad AFTER DELETE ON search_docs BEGIN
+  INSERT INTO search_fts (search_fts, rowid, title, body) VALUES ('delete', old.rowid, old.title, old.body);
+END;
+"""
+
+# bm25 column weights: (title, body). Headings and proposal descriptions
+# are short and strongly topical, so a title hit outranks a body hit.
+_BM25 = "bm25(search_fts, 4.0, 1.0)"
+_TERM = re.compile(r"\w+", re.UNICODE)
+# A memoized term frequency is trusted until the index grows by this share.
+_FREQUENCY_DRIFT = 0.1
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    kind: str  # chunk|proposal
+    ref_id: str
+    item_id: str
+    version: int | None
+    tenant_id: str | None
+    title: str
+    snippet: str
+    score: float
+    meta: dict[str, Any]
+
+
+def query_terms(query: str) -> list[tuple[str, bool]]:
+    """Split free text into ``(term, is_prefix)`` pairs; a trailing ``*`` marks prefix search."""
+    terms = []
+    for raw in query.split():
+        words = _TERM.findall(raw)
+        terms.extend((word, raw.endswith("*") and i == len(words) - 1) for i, word in enumerate(words))
+    return terms
+
+
+def match_expression(query: str | list[tuple[str, bool]]) -> str:
+    """FTS5 query in which every term must match; terms are quoted so no operator syntax leaks in."""
+    terms = query_terms(query) if isinstance(query, str) else query
+    return " ".join(f'"{term}"*' if prefix else f'"{term}"' for term, prefix in terms)
+
+
+class SearchIndex:
+    """Embedded full-text index (SQLite FTS5, BM25 ranking) over CDM chunks and edge proposals.
+
+    Documents are indexed as ``feigenbuam`` chunks, so a new version only
+    touches chunks whose ids changed. Proposals are indexed on
+    ``what.description`` (title column) and ``why.goal`` (body column).
+    """
+
+    def __init__(self, path: str = "data/search.db") -> None:
+        self.path = path
+        # term -> (rows containing it, index size when counted). Counting a
+        # common term walks its whole doclist, so it is done once per term.
+        self._frequency: dict[str, tuple[int, int]] = {}
+        with transaction(path) as conn:
+            conn.executescript(_SEARCH_SCHEMA)
+
+    def index_record(self, record: CDMRecord) -> tuple[int, int]:
+        """Bring the document's chunks up to ``record``; returns ``(added, removed)``."""
+        return self.index_records([record])
+
+    def index_records(self, records: Iterable[CDMRecord]) -> tuple[int, int]:
+        added = removed = 0
+        with transaction(self.path) as conn:
+            for record in records:
+                title = record.payload.get("metadata", {}).get("title", "")
+                chunks = {chunk["chunk_id"]: chunk for chunk in chunk_cdm(record.payload)}
+                # chunk_id does not cover the document title that prefixes every chunk
+                # title, so a chunk whose title changed is replaced like a changed chunk.
+                titles = {
+                    chunk_id: " / ".join([title, *chunk["heading_path"]]).strip(" /")
+                    for chunk_id, chunk in chunks.items()
+                }
+                existing = dict(
+                    conn.execute(
+                        "SELECT item_id, title FROM search_docs WHERE kind = 'chunk' AND ref_id = ?",
+                        (record.document_id,),
+                    ).fetchall()
+                )
+                stale = {item_id for item_id, old in existing.items() if titles.get(item_id) != old}
+                conn.executemany(
+                    "DELETE FROM search_docs WHERE kind = 'chunk' AND ref_id = ? AND item_id = ?",
+                    ((record.document_id, item_id) for item_id in stale),
+                )
+                fresh = [chunk for chunk_id, chunk in chunks.items() if chunk_id not in existing or chunk_id in stale]
+                conn.executemany(
+                    """
+                    INSERT INTO search_docs (kind, ref_id, item_id, version, title, body, meta_json)
+                    VALUES ('chunk', ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        (
+                            record.document_id,
+                            chunk["chunk_id"],
+                            record.version,
+                            titles[chunk["chunk_id"]],
+                            chunk["text"],
+                            json.dumps({"anchor": chunk["anchor"], "block_ids": chunk["block_ids"]}),
+                        )
+                        for chunk in fresh
+                    ),
+                )
+                conn.execute(
+                    "UPDATE search_docs SET version = ? WHERE kind = 'chunk' AND ref_id = ?",
+                    (record.version, record.document_id),
+                )
+                added += len(fresh)
+                removed += len(stale)
+        return added, removed
+
+    def index_proposal(self, proposal: dict[str, Any]) -> None:
+        """Index (or re-index) a proposal payload as produced by ``proposal_to_dict``."""
+        with transaction(self.path) as conn:
+            conn.execute(
+                "DELETE FROM search_docs WHERE kind = 'proposal' AND ref_id = ?",
+                (proposal["proposal_id"],),
+            )
+            conn.execute(
+                """
+                INSERT INTO search_docs (kind, ref_id, item_id, tenant_id, version, title, body, meta_json)
+                VALUES ('proposal', ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    proposal["proposal_id"],
+                    proposal["proposal_id"],
+                    proposal.get("tenant_id"),
+                    proposal.get("proposal_version"),
+                    proposal.get("what", {}).get("description", ""),
+                    proposal.get("why", {}).get("goal", ""),
+                    json.dumps({
+                        "community_id": proposal.get("community_id"),
+                        "routing_class": proposal.get("routing_class"),
+                        "status": proposal.get("status"),
+                    }),
+                ),
+            )
+
+    def remove(self, kind: str, ref_id: str) -> int:
+        with transaction(self.path) as conn:
+            return conn.execute("DELETE FROM search_docs WHERE kind = ? AND ref_id = ?", (kind, ref_id)).rowcount
+
+    def search(
+        self,
+        query: str,
+        *,
+        kind: str | None = None,
+        tenant_id: str | None = None,
+        limit: int = 10,
+        offset: int = 0,
+    ) -> list[SearchHit]:
+        terms = query_terms(query)
+        if not terms:
+            return []
+        with transaction(self.path) as conn:
+            expression = match_expression(self._rarest_first(conn, terms))
+            # Phase 1 ranks on the FTS index alone (joining only to filter);
+            # phase 2 builds rows and snippets for the page that is returned.
+            clauses, params = ["search_fts MATCH ?"], [expression]
+            join = ""
+            if kind or tenant_id:
+                join = "JOIN search_docs AS d ON d.rowid = search_fts.rowid"
+                if kind:
+                    clauses.append("d.kind = ?")
+                    params.append(kind)
+                if tenant_id:
+                    clauses.append("d.tenant_id = ?")
+                    params.append(tenant_id)
+            ranked = conn.execute(
+                f"""
+                SELECT search_fts.rowid, {_BM25} AS score FROM search_fts {join}
+                WHERE {" AND ".join(clauses)}
+                ORDER BY score LIMIT ? OFFSET ?
+                """,
+                (*params, limit, offset),
+            ).fetchall()
+            if not ranked:
+                return []
+            scores = {row[0]: row[1] for row in ranked}
+            marks = ",".join("?" for _ in scores)
+            found = conn.execute(
+                f"""
+                SELECT d.rowid, d.kind, d.ref_id, d.item_id, d.version, d.tenant_id, d.title, d.meta_json,
+                       snippet(search_fts, -1, '[', ']', '…', 16) AS snippet
+                FROM search_fts JOIN search_docs AS d ON d.rowid = search_fts.rowid
+                WHERE search_fts MATCH ? AND search_fts.rowid IN ({marks})
+                """,
+                (expression, *scores),
+            ).fetchall()
+        by_rowid = {r["rowid"]: r for r in found}
+        rows = [(by_rowid[rowid], score) for rowid, score in scores.items() if rowid in by_rowid]
+        return [
+            SearchHit(
+                kind=r["kind"],
+                ref_id=r["ref_id"],
+                item_id=r["item_id"],
+                version=r["version"],
+                tenant_id=r["tenant_id"],
+                title=r["title"],
+                snippet=r["snippet"],
+                # FTS5 bm25() is negative (lower is better); expose higher-is-better.
+                score=-score,
+                meta=json.loads(r["meta_json"]),
+            )
+            for r, score in rows
+        ]
+
+    def _rarest_first(self, conn: sqlite3.Connection, terms: list[tuple[str, bool]]) -> list[tuple[str, bool]]:
+        """Order exact terms by ascending row frequency, prefix terms last; every term is kept.
+
+        Every term still has to match, so results are unchanged. Only the order
+        in which FTS5 walks the doclists changes: the rarest doclist drives the
+        intersection instead of a near-universal one.
+        """
+        exact = [term.lower() for term, prefix in terms if not prefix]
+        if len(terms) < 2 or not exact:
+            return terms
+        total = conn.execute("SELECT MAX(rowid) FROM search_docs").fetchone()[0] or 0
+        stale = [
+            term
+            for term in set(exact)
+            if term not in self._frequency or total > self._frequency[term][1] * (1 + _FREQUENCY_DRIFT)
+        ]
+        if stale:
+            marks = ",".join("?" for _ in stale)
+            counted = dict(conn.execute(f"SELECT term, doc FROM search_vocab WHERE term IN ({marks})", stale))
+            self._frequency.update((term, (counted.get(term, 0), total)) for term in stale)
+        return sorted(terms, key=lambda t: (t[1], 0 if t[1] else self._frequency[t[0].lower()][0]))
+
+    def count(self, kind: str | None = None) -> int:
+        if kind is None:
+            return int(run_query(self.path, "SELECT COUNT(*) AS n FROM search_docs")[0]["n"])
+        return int(run_query(self.path, "SELECT COUNT(*) AS n FROM search_docs WHERE kind = ?", (kind,))[0]["n"])
+
+
+_SHARED: dict[str, SearchIndex] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_index(path: str) -> SearchIndex:
+    """The process-wide ``SearchIndex`` for ``path``, so callers share its schema setup and term counts.
+
+    A new instance is opened if the database file has been removed since.
+    """
+    with _SHARED_LOCK:
+        index = _SHARED.get(path)
+        if index is None or not os.path.exists(path):
+            index = _SHARED[path] = SearchIndex(path)
+        return index
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Compare Git-mode and API-mode publishing against the bundled local API stub."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from not_mainstreet.api_stub import run_api_stub  # noqa: E402
+from not_mainstreet.api_transport import (  # noqa: E402
+    FeigenbuamApiPublisher,
+    HTTPConnectionPool,
+    KantianApiPublisher,
+)
+from not_mainstreet.orchestrator import Orchestrator  # noqa: E402
+
+
+def _documents(n: int, blocks: int):
+    for i in range(n):
+        yield f"doc-{i:05d}", {
+            "metadata": {"title": f"Document {i}", "tags": ["bench"]},
+            "content": {"blocks": [{"type": "paragraph", "text": f"Paragraph {b} of {i}."} for b in range(blocks)]},
+        }
+
+
+def _row(stats, pools=()) -> dict:
+    row = {"elapsed_s": round(stats.elapsed_s, 3), "docs_per_s": round(stats.docs_per_s), "published": stats.published}
+    if pools:
+        row["requests"] = sum(p.requests_sent for p in pools)
+        row["connections"] = sum(p.connections_opened for p in pools)
+    return row
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=2000)
+    parser.add_argument("--blocks", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    report = {}
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            orch = Orchestrator()
+            report["git"] = _row(orch.process_many(_documents(args.documents, args.blocks), batch_size=args.batch_size))
+            orch.close()
+        finally:
+            os.chdir(cwd)
+
+    for label, keep_alive in (("api_keep_alive", True), ("api_connection_per_request", False)):
+        server, _ = run_api_stub()
+        url = f"http://127.0.0.1:{server.server_port}"
+        pools = {name: HTTPConnectionPool(url, keep_alive=keep_alive) for name in ("kantian_ivi", "feigenbuam")}
+        kantian, feig = KantianApiPublisher(pools["kantian_ivi"]), FeigenbuamApiPublisher(pools["feigenbuam"])
+        orch = Orchestrator(
+            mode="api",
+            publishers={"kantian_ivi": kantian, "feigenbuam": feig},
+            batch_publishers={"kantian_ivi": kantian.publish_many, "feigenbuam": feig.publish_many},
+        )
+        stats = orch.process_many(_documents(args.documents, args.blocks), batch_size=args.batch_size)
+        orch.close()
+        report[label] = _row(stats, pools.values())
+        for pool in pools.values():
+            pool.close()
+        server.shutdown()
+        server.server_close()
+
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
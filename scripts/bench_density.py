@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Density certificates: per-subject ``build_density_certificate``, the batch histogram and ``DensityIndex``."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from not_mainstreet.location_privacy import (  # noqa: E402
+    HAS_NUMPY,
+    DensityIndex,
+    build_density_certificate,
+    build_density_certificates,
+)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--subjects", type=int, default=10_000)
+    parser.add_argument("--peers", type=int, default=10_000)
+    parser.add_argument("--scalar-sample", type=int, default=50, help="subjects timed on the per-subject path")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(2)
+
+    def points(n: int) -> list[tuple[float, float]]:
+        return [(37.70 + rng.uniform(0, 0.15), -122.50 + rng.uniform(0, 0.15)) for _ in range(n)]
+
+    subjects, peers = points(args.subjects), points(args.peers)
+    options = {"min_k": 5, "cell_size_m": 500.0, "epoch_salt": "epoch-bench"}
+
+    sample = subjects[: args.scalar_sample]
+    started = time.perf_counter()
+    expected = [build_density_certificate(lat, lon, peers, **options) for lat, lon in sample]
+    scalar_s = (time.perf_counter() - started) / len(sample) * len(subjects)
+
+    report: dict = {
+        "subjects": len(subjects),
+        "peers": len(peers),
+        "seconds": {"per_subject_estimated": round(scalar_s, 3)},
+    }
+    for name, use_numpy in (("batch_plain", False), ("batch_numpy", True)):
+        if use_numpy and not HAS_NUMPY:
+            continue
+        started = time.perf_counter()
+        batch = build_density_certificates(subjects, peers, use_numpy=use_numpy, **options)
+        report["seconds"][name] = round(time.perf_counter() - started, 4)
+        assert batch[: len(sample)] == expected
+
+    index = DensityIndex(**{k: options[k] for k in ("cell_size_m", "epoch_salt")})
+    started = time.perf_counter()
+    for i, (lat, lon) in enumerate(peers):
+        index.join(f"peer-{i}", lat, lon)
+    joined = time.perf_counter() - started
+    started = time.perf_counter()
+    live = [index.certificate(lat, lon, min_k=options["min_k"]) for lat, lon in subjects]
+    queried = time.perf_counter() - started
+    assert live[: len(sample)] == expected
+    with tempfile.TemporaryDirectory() as tmp:
+        started = time.perf_counter()
+        index.save(Path(tmp) / "density.json")
+        DensityIndex.load(Path(tmp) / "density.json", epoch_salt=options["epoch_salt"])
+        restart = time.perf_counter() - started
+    report["index_us"] = {
+        "join": round(joined / len(peers) * 1e6, 2),
+        "certificate": round(queried / len(subjects) * 1e6, 2),
+    }
+    report["seconds"]["index_snapshot_save_and_load"] = round(restart, 4)
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
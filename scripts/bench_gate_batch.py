@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Throughput of the columnar 5W gate/router (``gate_batch``) against the per-proposal scalar path."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from not_mainstreet.edge_proposal import (  # noqa: E402
+    What,
+    When,
+    Where,
+    Who,
+    Why,
+    evaluate_dual_gate,
+    route_edge_class,
+)
+from not_mainstreet.gate_batch import (  # noqa: E402
+    HAS_NUMPY,
+    GateColumns,
+    evaluate_dual_gate_batch,
+    gate_flags,
+    route_codes,
+    route_edge_class_batch,
+)
+
+
+def _rows(n: int, rng: random.Random) -> list[tuple[Who, Why, What, Where, When]]:
+    categories = ["service", "repair", "sale", "governance", "volunteer", "event", "gardening", "other"]
+    return [
+        (
+            Who(f"u-{i}" if rng.random() > 0.02 else "", ["member"] if rng.random() > 0.01 else ["banned"], "rep"),
+            Why(rng.choice(["help neighbors", "volunteer at the shelter", ""]), [], ["care"] if i % 9 else [], "normal"),
+            What(rng.choice(categories), "details", rng.choice([None, 25.0, -1.0]), []),
+            Where(rng.choice(["household", "block", "town", "region"]), "g", "sa", []),
+            When("this-week" if i % 13 else "", [], "2026-03-01"),
+        )
+        for i in range(n)
+    ]
+
+
+def _rate(n: int, fn) -> float:
+    started = time.perf_counter()
+    fn()
+    return round(n / (time.perf_counter() - started))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    rows = _rows(args.rows, random.Random(1))
+    columns = GateColumns.from_fields(rows)
+    arrays = GateColumns.from_fields(rows)
+    if HAS_NUMPY:
+        gate_flags(arrays, use_numpy=True)  # converted arrays are kept on the columns for later evaluations
+    report: dict = {"rows": args.rows, "numpy": HAS_NUMPY, "rows_per_s": {}}
+    rates = report["rows_per_s"]
+    rates["scalar"] = _rate(args.rows, lambda: [(evaluate_dual_gate(*r), route_edge_class(r[2], r[1])) for r in rows])
+    for label, use_numpy, data in (("lists", False, columns), ("numpy", True, arrays)):
+        if use_numpy and not HAS_NUMPY:
+            continue
+        # "masks" is what a nightly re-evaluation needs to count or select rows;
+        # "results" also materializes per-row GateResults and routing tuples.
+        rates[f"{label}_masks"] = _rate(
+            args.rows,
+            lambda: (gate_flags(data, use_numpy=use_numpy), route_codes(data, use_numpy=use_numpy)),
+        )
+        rates[f"{label}_results"] = _rate(
+            args.rows,
+            lambda: (
+                evaluate_dual_gate_batch(data, use_numpy=use_numpy),
+                route_edge_class_batch(data, use_numpy=use_numpy),
+            ),
+        )
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
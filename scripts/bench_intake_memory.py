@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Retained memory (tracemalloc) and build throughput for in-memory ``EdgeProposal`` re-evaluation."""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from not_mainstreet.edge_proposal import build_edge_proposal, five_w_from_dicts  # noqa: E402
+
+
+def _payloads(n: int, rng: random.Random) -> list[str]:
+    """Stored-style JSON rows, so every decoded label starts out as its own string object."""
+    rows = []
+    for i in range(n):
+        rows.append(
+            json.dumps(
+                {
+                    "who": {"user_id": f"u-{i}", "roles": rng.choice([["member"], ["member", "organizer"]]), "reputation_ref": "rep"},
+                    "why": {"goal": "help neighbors", "constraints": [], "values": rng.choice([[], ["care"]]), "urgency": "normal"},
+                    "what": {
+                        "category": rng.choice(["service", "market", "petition", "volunteer", "event"]),
+                        "description": f"request {i}: fix the shared bicycles before the weekend",
+                        "budget": rng.choice([None, 10.0]),
+                        "requirements": [],
+                    },
+                    "where": {"scope_level": rng.choice(["household", "block", "town"]), "geo": "37.77,-122.42",
+                              "service_area": "mission", "constraints": []},
+                    "when": {"window": "this-week", "trigger_conditions": [], "deadline": "2026-03-10"},
+                }
+            )
+        )
+    return rows
+
+
+def _build(rows: list[str]) -> list:
+    proposals = []
+    for i, row in enumerate(rows):
+        p = json.loads(row)
+        who, why, what, where, when = five_w_from_dicts(p["who"], p["why"], p["what"], p["where"], p["when"])
+        proposal, _ = build_edge_proposal(f"p-{i}", "tenant", "community", "session", who, why, what, where, when, "thread")
+        proposals.append(proposal)
+    return proposals
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--proposals", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    rows = _payloads(args.proposals, random.Random(3))
+    started = time.perf_counter()
+    _build(rows)
+    elapsed = time.perf_counter() - started  # untraced: tracemalloc taxes every allocation
+    gc.collect()
+    tracemalloc.start()
+    proposals = _build(rows)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    report = {
+        "proposals": len(proposals),
+        "retained_bytes_per_proposal": round(current / len(proposals)),
+        "peak_mib": round(peak / 2**20, 1),
+        "proposals_per_s": round(len(proposals) / elapsed),
+    }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Build time and per-query latency of ``ProposalMatcher`` over synthetic open proposals."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from not_mainstreet.matching import ProposalMatcher  # noqa: E402
+
+CLASSES = ["service_request", "commerce_exchange", "governance_petition", "volunteer_task", "meetup_coordination"]
+# Roughly a 50 km x 50 km metro area.
+CENTER_LAT, CENTER_LON, SPREAD_DEG = 37.77, -122.42, 0.225
+
+
+def _payloads(n: int, rng: random.Random) -> list[dict]:
+    first = date(2026, 3, 1)
+    payloads = []
+    for i in range(n):
+        start = first + timedelta(days=rng.randrange(90))
+        end = start + timedelta(days=rng.randrange(14))
+        lat = CENTER_LAT + rng.uniform(-SPREAD_DEG, SPREAD_DEG)
+        lon = CENTER_LON + rng.uniform(-SPREAD_DEG, SPREAD_DEG)
+        payloads.append(
+            {
+                "proposal_id": f"p-{i}",
+                "tenant_id": "tenant-bench",
+                "who": {"user_id": f"u-{i % (n // 3 + 1)}"},
+                "routing_class": rng.choice(CLASSES),
+                "status": "gated",
+                "where": {"geo": f"{lat:.6f},{lon:.6f}", "service_area": "metro"},
+                "when": {"window": f"{start.isoformat()}/{end.isoformat()}"},
+            }
+        )
+    return payloads
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--proposals", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(5)
+    payloads = _payloads(args.proposals, rng)
+    matcher = ProposalMatcher()
+    started = time.perf_counter()
+    for payload in payloads:
+        matcher.add(payload)
+    build_s = time.perf_counter() - started
+
+    timings, sizes = [], []
+    for payload in rng.sample(payloads, min(args.queries, len(payloads))):
+        started = time.perf_counter()
+        matches = matcher.match(payload["proposal_id"], k=args.k)
+        timings.append((time.perf_counter() - started) * 1000)
+        sizes.append(len(matches))
+    timings.sort()
+    report = {
+        "proposals": len(matcher),
+        "build_s": round(build_s, 2),
+        "add_us": round(build_s / len(payloads) * 1e6, 2),
+        "match_ms": {
+            "p50": round(statistics.median(timings), 3),
+            "p95": round(timings[int(len(timings) * 0.95)], 3),
+            "max": round(timings[-1], 3),
+        },
+        "mean_matches": round(statistics.mean(sizes), 2),
+    }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
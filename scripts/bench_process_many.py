@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Throughput of batched ``Orchestrator.process_many`` against per-document ``process``."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from not_mainstreet.orchestrator import Orchestrator  # noqa: E402
+
+
+def _documents(n: int, blocks: int):
+    for i in range(n):
+        yield f"doc-{i:05d}", {
+            "schema_version": "cdm/v1",
+            "document_id": f"doc-{i:05d}",
+            "metadata": {"title": f"Document {i}", "tags": ["bench", f"t{i % 7}"]},
+            "content": {
+                "blocks": [
+                    {"block_id": f"blk-{b:04d}", "type": "paragraph", "text": f"Paragraph {b} of document {i}. " * 4}
+                    for b in range(blocks)
+                ]
+            },
+        }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=10_000)
+    parser.add_argument("--blocks", type=int, default=20)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--hash-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    report = {}
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            orch = Orchestrator()
+            for label in ("first_run", "replay"):
+                stats = orch.process_many(
+                    _documents(args.documents, args.blocks),
+                    batch_size=args.batch_size,
+                    hash_workers=args.hash_workers,
+                )
+                report[label] = {
+                    "documents": stats.documents,
+                    "published": stats.published,
+                    "unchanged": stats.unchanged,
+                    "elapsed_s": round(stats.elapsed_s, 3),
+                    "hash_s": round(stats.hash_s, 3),
+                    "publish_s": round(stats.publish_s, 3),
+                    "docs_per_s": round(stats.docs_per_s),
+                }
+            orch.close()
+
+            orch = Orchestrator()
+            started = time.perf_counter()
+            for document_id, payload in _documents(args.documents, args.blocks):
+                orch.process(document_id, payload)
+            elapsed = time.perf_counter() - started
+            orch.close()
+            report["process_loop"] = {"elapsed_s": round(elapsed, 3), "docs_per_s": round(args.documents / elapsed)}
+        finally:
+            os.chdir(cwd)
+
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Per-call cost of the compiled ``RoutingClassifier`` against the original if/elif router."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from not_mainstreet.edge_proposal import RoutingAlternative, What, Why, route_edge_class  # noqa: E402
+
+
+def _legacy_route_edge_class(what: What, why: Why) -> tuple[str, float, list[RoutingAlternative], bool]:
+    """``route_edge_class`` as it was before the classifier (category + goal substring only)."""
+    c = what.category.lower().strip()
+    scores = {
+        "service_request": 0.2,
+        "commerce_exchange": 0.2,
+        "governance_petition": 0.2,
+        "volunteer_task": 0.2,
+        "meetup_coordination": 0.2,
+    }
+    if c in {"service", "repair", "care"}:
+        scores["service_request"] = 0.92
+    elif c in {"commerce", "market", "sale"}:
+        scores["commerce_exchange"] = 0.92
+    elif c in {"governance", "petition", "policy"}:
+        scores["governance_petition"] = 0.92
+    elif c in {"volunteer", "mutual_aid"}:
+        scores["volunteer_task"] = 0.92
+    elif c in {"event", "meetup"}:
+        scores["meetup_coordination"] = 0.92
+    elif "volunteer" in why.goal.lower():
+        scores["volunteer_task"] = 0.75
+    else:
+        scores["service_request"] = 0.55
+        scores["commerce_exchange"] = 0.45
+    ordered = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)
+    primary_class, primary_score = ordered[0]
+    alternatives = [RoutingAlternative(edge_class=k, confidence=v) for k, v in ordered[:3]]
+    return primary_class, primary_score, alternatives, primary_score < 0.7
+
+
+def _inputs(n: int, rng: random.Random, categories: list[str]) -> list[tuple[What, Why]]:
+    descriptions = [
+        "Fix the leaking kitchen sink before the weekend",
+        "Selling surplus tomatoes and handmade crafts at the Saturday market",
+        "Collect signatures so the council reviews the zoning ordinance",
+        "Neighborhood potluck and picnic in the park, please RSVP",
+        "Looking for someone to walk my dog twice a day while I travel for work",
+    ]
+    goals = ["help neighbors", "volunteer at the pantry", "raise money for the school", "meet new people"]
+    return [
+        (What(rng.choice(categories), rng.choice(descriptions), None, []), Why(rng.choice(goals), [], [], "normal"))
+        for _ in range(n)
+    ]
+
+
+def _per_call_us(route, inputs) -> float:
+    started = time.perf_counter()
+    for what, why in inputs:
+        route(what, why)
+    return round((time.perf_counter() - started) / len(inputs) * 1e6, 3)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(1)
+    shapes = {
+        "category_match": ["service", "Market", "petition ", "volunteer", "event"],
+        "keyword_scan": ["", "other", "gardening"],
+    }
+    report: dict = {"calls": args.calls, "us_per_call": {}}
+    for shape, categories in shapes.items():
+        inputs = _inputs(args.calls, rng, categories)
+        report["us_per_call"][shape] = {
+            "legacy": _per_call_us(_legacy_route_edge_class, inputs),
+            "compiled": _per_call_us(route_edge_class, inputs),
+        }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
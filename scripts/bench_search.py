@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Build a synthetic chunk index and report BM25 query latency percentiles."""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from not_mainstreet.cdm import CDMRecord  # noqa: E402
+from not_mainstreet.search import SearchIndex  # noqa: E402
+
+
+def _records(chunks: int, per_doc: int, vocabulary: list[str], rng: random.Random):
+    # Zipf-like term frequencies; cumulative weights keep rng.choices O(log V) per draw.
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(vocabulary))))
+    for d in range(0, chunks, per_doc):
+        blocks = []
+        for s in range(min(per_doc, chunks - d)):
+            blocks.append({"type": "heading", "heading_level": 1, "text": f"Section {s}"})
+            blocks.append({"type": "paragraph", "text": " ".join(rng.choices(vocabulary, cum_weights=cum_weights, k=40))})
+        yield CDMRecord(f"doc-{d // per_doc}", 1, {"metadata": {"title": f"Doc {d}"}, "content": {"blocks": blocks}}, "h")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--chunks", type=int, default=1_000_000)
+    parser.add_argument("--per-doc", type=int, default=100)
+    parser.add_argument("--vocabulary", type=int, default=50_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--db", default=None, help="reuse/keep the index at this path")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(1)
+    vocabulary = [f"t{i}" for i in range(args.vocabulary)]
+    with tempfile.TemporaryDirectory() as tmp:
+        index = SearchIndex(args.db or str(Path(tmp) / "search.db"))
+        report: dict = {}
+        if index.count("chunk") < args.chunks:
+            started = time.perf_counter()
+            batch = []
+            for record in _records(args.chunks, args.per_doc, vocabulary, rng):
+                batch.append(record)
+                if len(batch) == 100:
+                    index.index_records(batch)
+                    batch = []
+            index.index_records(batch)
+            report["build_s"] = round(time.perf_counter() - started, 1)
+        report["chunks"] = index.count("chunk")
+
+        common, medium, rare = vocabulary[:20], vocabulary[500:2000], vocabulary[20_000:]
+        shapes = {
+            "common_one_term": lambda: rng.choice(common),
+            "common_two_terms": lambda: " ".join(rng.sample(common, 2)),
+            "common_plus_medium": lambda: f"{rng.choice(common)} {rng.choice(medium)}",
+            "medium_one_term": lambda: rng.choice(medium),
+            "medium_two_terms": lambda: " ".join(rng.sample(medium, 2)),
+            "rare_one_term": lambda: rng.choice(rare),
+            "rare_two_terms": lambda: " ".join(rng.sample(rare, 2)),
+        }
+        for shape, make_query in shapes.items():
+            timings = []
+            for _ in range(args.queries):
+                query = make_query()
+                started = time.perf_counter()
+                index.search(query, limit=10)
+                timings.append((time.perf_counter() - started) * 1000)
+            timings.sort()
+            report[f"{shape}_ms"] = {
+                "p50": round(statistics.median(timings), 2),
+                "p95": round(timings[int(len(timings) * 0.95) - 1], 2),
+            }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
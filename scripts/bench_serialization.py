@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Per-intake serialization cost: ``asdict`` + hand-built evaluation + ``json.dumps`` against the compiled path."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from not_mainstreet.edge_proposal import (  # noqa: E402
+    What,
+    When,
+    Where,
+    Who,
+    Why,
+    build_edge_proposal,
+    evaluation_to_dict,
+    proposal_to_dict,
+)
+from not_mainstreet.serialization import dumps  # noqa: E402
+
+
+def _legacy(proposal, evaluation) -> tuple[str, str]:
+    """Serialization as ``submit_edge_intake`` did it before the compiled serializer."""
+    payload = asdict(proposal)
+    gate = evaluation.gate_results
+    evaluation_payload = {
+        "gate_results": {
+            "gate_outcome": gate.gate_outcome,
+            "noumenal": gate.noumenal,
+            "phenomenal": gate.phenomenal,
+            "missing_fields": [asdict(s) for s in gate.missing_fields],
+            "conflicts": [asdict(s) for s in gate.conflicts],
+            "policy_blocks": [asdict(s) for s in gate.policy_blocks],
+            "feasibility_blocks": [asdict(s) for s in gate.feasibility_blocks],
+            "policy_version": gate.policy_version,
+        },
+        "routing_class": evaluation.routing_class,
+        "routing_confidence": evaluation.routing_confidence,
+        "routing_alternatives": [asdict(a) for a in evaluation.routing_alternatives],
+        "needs_disambiguation": evaluation.needs_disambiguation,
+        "next_actions": evaluation.next_actions,
+    }
+    return json.dumps(payload), json.dumps(evaluation_payload)
+
+
+def _compiled(proposal, evaluation) -> tuple[str, str]:
+    return dumps(proposal_to_dict(proposal)), dumps(evaluation_to_dict(evaluation))
+
+
+def _per_call_us(serialize, pairs) -> float:
+    started = time.perf_counter()
+    for proposal, evaluation in pairs:
+        serialize(proposal, evaluation)
+    return round((time.perf_counter() - started) / len(pairs) * 1e6, 3)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=50_000)
+    args = parser.parse_args(argv)
+
+    pairs = [
+        build_edge_proposal(
+            proposal_id=f"p-{i}",
+            tenant_id="t",
+            community_id="c",
+            session_id="s",
+            who=Who(user_id=f"u-{i}", roles=["member"], reputation_ref="r"),
+            why=Why(goal="help neighbors", constraints=["weekends"], values=["care"] if i % 4 else [], urgency="normal"),
+            what=What(category="repair", description="fix bikes", budget=12.5, requirements=["tools"]),
+            where=Where(scope_level="block", geo="37.77,-122.42", service_area="mission", constraints=[]),
+            when=When(window="2026-03-02/2026-03-04", trigger_conditions=[], deadline="2026-03-10"),
+            thread_ref="th",
+        )
+        for i in range(args.calls)
+    ]
+    assert all(_legacy(*pair) == _compiled(*pair) for pair in pairs[:100])
+    report = {
+        "calls": args.calls,
+        "us_per_intake": {"legacy": _per_call_us(_legacy, pairs), "compiled": _per_call_us(_compiled, pairs)},
+    }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
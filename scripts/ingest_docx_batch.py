@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Backfill DOCX files through the parser on a process pool."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from not_mainstreet.docx_batch import (  # noqa: E402
+    DEFAULT_MEMORY_LIMIT_MB,
+    HARD_TIMEOUT_S,
+    TYPICAL_TIMEOUT_S,
+    BatchIngestStats,
+    ingest_docx_batch,
+)
+
+
+def _expand(inputs: list[str]):
+    for raw in inputs:
+        path = Path(raw)
+        if path.is_dir():
+            yield from sorted(path.rglob("*.docx"))
+        else:
+            yield path
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Batch-ingest DOCX files into CDM payloads")
+    parser.add_argument("inputs", nargs="+", help="DOCX files or directories to scan recursively")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--timeout", type=float, default=TYPICAL_TIMEOUT_S, help="typical per-file budget (s)")
+    parser.add_argument("--hard-timeout", type=float, default=HARD_TIMEOUT_S, help="per-file hard limit (s)")
+    parser.add_argument("--memory-mb", type=int, default=DEFAULT_MEMORY_LIMIT_MB, help="per-worker memory cap")
+    args = parser.parse_args(argv)
+
+    stats = BatchIngestStats()
+    for result in ingest_docx_batch(
+        _expand(args.inputs),
+        workers=args.workers,
+        typical_timeout_s=args.timeout,
+        hard_timeout_s=args.hard_timeout,
+        memory_limit_mb=args.memory_mb,
+        stats=stats,
+    ):
+        print(json.dumps({
+            "path": result.path,
+            "status": result.status,
+            "checksum_sha256": result.checksum_sha256,
+            "cdm_hash": result.cdm_hash,
+            "blocks": result.block_count,
+            "duration_s": round(result.duration_s, 4),
+            "error": result.error,
+        }))
+
+    print(
+        f"{stats.files} files ({stats.succeeded} ok, {stats.failed} failed) in {stats.elapsed_s:.2f}s: "
+        f"{stats.files_per_s:.1f} files/s, {stats.mb_per_s:.2f} MB/s, statuses={stats.by_status}",
+        file=sys.stderr,
+    )
+    return 0 if stats.failed == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -13,12 +13,14 @@ def main() -> None:
     parser.add_argument("--port", type=int, default=8765)
     parser.add_argument("--inside-db", default="data/inside_ivi.db")
     parser.add_argument("--outside-db", default="data/outside_portal.db")
+    parser.add_argument("--assets-root", default="assets")
     args = parser.parse_args()
 
     cfg = PortalServerConfig(
         host=args.host,
         port=args.port,
         databases=EngineDatabases(inside_path=args.inside_db, outside_path=args.outside_db),
+        assets_root=args.assets_root,
     )
     server = run_portal_server(cfg)
     print(f"Portal running on http://{args.host}:{args.port}")
@@ -92,11 +92,23 @@ def validate_node_state_machine(doc: dict) -> None:
     assert doc["allowed_transitions"] == expected
 
 
+def validate_gate_policy(doc: dict) -> None:
+    assert isinstance(doc["policy_version"], str) and doc["policy_version"]
+    codes = {"MISSING_FIELD", "CONFLICT", "POLICY_BLOCK", "FEASIBILITY_BLOCK"}
+    ids = [rule["id"] for rule in doc["rules"]]
+    assert ids and len(ids) == len(set(ids))
+    for rule in doc["rules"]:
+        assert rule["code"] in codes
+        assert rule["field"] and rule["message"]
+        assert isinstance(rule["when"], dict) and rule["when"]["op"]
+
+
 def main() -> None:
     validate_anchor_event(_load("examples/anchor_event.example.json"))
     validate_relational_artifact(_load("examples/relational_artifact.example.json"))
     validate_continuity_constraint(_load("examples/continuity_constraint.example.json"))
     validate_node_state_machine(_load("contracts/node_state_machine.json"))
+    validate_gate_policy(_load("contracts/gate_policy.json"))
     validate_cdm(_load("examples/cdm.example.json"))
     print("All contract examples validated successfully.")
 
@@ -0,0 +1,90 @@
+"""Tiny in-memory DOCX builder shared by the DOCX pipeline tests."""
+
+from __future__ import annotations
+
+import zipfile
+from io import BytesIO
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+WP_NS = "http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing"
+PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+STYLES_XML = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:styles xmlns:w="{W_NS}">
+  <w:style w:type="paragraph" w:styleId="Normal"><w:name w:val="Normal"/></w:style>
+  <w:style w:type="paragraph" w:styleId="Heading1"><w:name w:val="heading 1"/><w:basedOn w:val="Normal"/></w:style>
+  <w:style w:type="paragraph" w:styleId="Heading2"><w:name w:val="heading 2"/><w:basedOn w:val="Normal"/></w:style>
+  <w:style w:type="paragraph" w:styleId="Chapter"><w:name w:val="Chapter"/><w:basedOn w:val="Heading1"/></w:style>
+  <w:style w:type="character" w:styleId="CodeChar"><w:name w:val="Code Char"/></w:style>
+  <w:style w:type="character" w:styleId="Strong"><w:name w:val="Strong"/><w:rPr><w:b/></w:rPr></w:style>
+  <w:style w:type="character" w:styleId="Quiet"><w:name w:val="Quiet"/><w:basedOn w:val="Strong"/><w:rPr><w:b w:val="0"/></w:rPr></w:style>
+</w:styles>"""
+
+NUMBERING_XML = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:numbering xmlns:w="{W_NS}">
+  <w:abstractNum w:abstractNumId="0"><w:lvl w:ilvl="0"><w:numFmt w:val="bullet"/></w:lvl></w:abstractNum>
+  <w:abstractNum w:abstractNumId="1"><w:lvl w:ilvl="0"><w:numFmt w:val="decimal"/></w:lvl></w:abstractNum>
+  <w:num w:numId="1"><w:abstractNumId w:val="0"/></w:num>
+  <w:num w:numId="2"><w:abstractNumId w:val="1"/></w:num>
+</w:numbering>"""
+
+FOOTNOTES_XML = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:footnotes xmlns:w="{W_NS}">
+  <w:footnote w:type="separator" w:id="-1"><w:p><w:r><w:separator/></w:r></w:p></w:footnote>
+  <w:footnote w:id="1"><w:p><w:r><w:t>Source: town ledger.</w:t></w:r></w:p></w:footnote>
+</w:footnotes>"""
+
+RELS_XML = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="{PKG_REL_NS}">
+  <Relationship Id="rId1" Type="image" Target="media/image1.png"/>
+  <Relationship Id="rId2" Type="hyperlink" Target="https://example.org/market" TargetMode="External"/>
+</Relationships>"""
+
+SAMPLE_BODY = f"""
+<w:p><w:pPr><w:pStyle w:val="Heading1"/></w:pPr><w:r><w:t>Main Street Plan</w:t></w:r></w:p>
+<w:p>
+  <w:r><w:t xml:space="preserve">Neighbors </w:t></w:r>
+  <w:r><w:rPr><w:b/></w:rPr><w:t>share</w:t></w:r>
+  <w:r><w:rPr><w:rStyle w:val="CodeChar"/></w:rPr><w:t>tools</w:t></w:r>
+  <w:hyperlink r:id="rId2"><w:r><w:t>market</w:t></w:r></w:hyperlink>
+  <w:r><w:footnoteReference w:id="1"/></w:r>
+</w:p>
+<w:p><w:pPr><w:numPr><w:ilvl w:val="0"/><w:numId w:val="1"/></w:numPr></w:pPr><w:r><w:t>first bullet</w:t></w:r></w:p>
+<w:p><w:pPr><w:numPr><w:ilvl w:val="0"/><w:numId w:val="1"/></w:numPr></w:pPr><w:r><w:t>second bullet</w:t></w:r></w:p>
+<w:p><w:pPr><w:numPr><w:ilvl w:val="0"/><w:numId w:val="2"/></w:numPr></w:pPr><w:r><w:t>step one</w:t></w:r></w:p>
+<w:p><w:pPr><w:pStyle w:val="Chapter"/></w:pPr><w:r><w:t>Budget</w:t></w:r></w:p>
+<w:tbl>
+  <w:tr><w:tc><w:p><w:r><w:t>Item</w:t></w:r></w:p></w:tc><w:tc><w:p><w:r><w:t>Cost</w:t></w:r></w:p></w:tc></w:tr>
+  <w:tr><w:tc><w:tcPr><w:gridSpan w:val="2"/></w:tcPr><w:p><w:r><w:t>Total</w:t></w:r></w:p></w:tc></w:tr>
+</w:tbl>
+<w:p><w:r><w:drawing><wp:inline><wp:docPr id="1" name="Picture 1" descr="Storefront"/>
+  <a:graphic><a:graphicData><a:blip r:embed="rId1"/></a:graphicData></a:graphic>
+</wp:inline></w:drawing></w:r></w:p>
+"""
+
+PNG_BYTES = b"\x89PNG\r\n\x1a\n" + b"\x00" * 64
+
+
+def document_xml(body: str) -> str:
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<w:document xmlns:w="{W_NS}" xmlns:r="{R_NS}" xmlns:a="{A_NS}" xmlns:wp="{WP_NS}">'
+        f"<w:body>{body}</w:body></w:document>"
+    )
+
+
+def build_docx(body: str = SAMPLE_BODY, *, media: dict[str, bytes] | None = None) -> bytes:
+    """Return DOCX bytes with the sample styles, numbering, footnotes and media."""
+    media = {"image1.png": PNG_BYTES} if media is None else media
+    buf = BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("word/document.xml", document_xml(body))
+        zf.writestr("word/styles.xml", STYLES_XML)
+        zf.writestr("word/numbering.xml", NUMBERING_XML)
+        zf.writestr("word/footnotes.xml", FOOTNOTES_XML)
+        zf.writestr("word/_rels/document.xml.rels", RELS_XML)
+        for name, data in media.items():
+            zf.writestr(f"word/media/{name}", data)
+    return buf.getvalue()
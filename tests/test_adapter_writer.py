@@ -0,0 +1,85 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from not_mainstreet import Orchestrator
+from not_mainstreet.adapters import ArtifactWriter, kantian_ivi
+from not_mainstreet.cdm import CDMRecord
+
+
+class ArtifactWriterTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.record = CDMRecord("doc-w", 1, {"metadata": {"title": "Wörter"}, "content": {"blocks": []}}, "h1")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_compact_encoding_round_trips(self) -> None:
+        path = kantian_ivi.publish_git(self.record, str(self.root / "docs"))
+        text = Path(path).read_text(encoding="utf-8")
+        self.assertNotIn("\n", text)
+        self.assertNotIn(": ", text)
+        self.assertIn("Wörter", text)
+        self.assertEqual(json.loads(text)["payload"], self.record.payload)
+
+        pretty = ArtifactWriter(indent=2)
+        pretty.write(self.root / "pretty.json", {"a": 1}, "h")
+        self.assertEqual((self.root / "pretty.json").read_text(), '{\n  "a": 1\n}')
+
+    def test_identical_hash_is_skipped_without_io(self) -> None:
+        writer = ArtifactWriter()
+        path = self.root / "docs" / "doc-w.json"
+        self.assertTrue(writer.write(path, {"v": 1}, "h1"))
+        with mock.patch("not_mainstreet.adapters._writer._open_temp") as open_temp:
+            self.assertFalse(writer.write(path, {"v": 1}, "h1"))
+        open_temp.assert_not_called()
+        self.assertTrue(writer.write(path, {"v": 2}, "h2"))
+        self.assertEqual(json.loads(path.read_text()), {"v": 2})
+        self.assertEqual((writer.writes, writer.skipped), (2, 1))
+
+    def test_deleted_or_replaced_artifact_is_rewritten(self) -> None:
+        writer = ArtifactWriter()
+        path = self.root / "doc.json"
+        writer.write(path, {"v": 1}, "h1")
+        (self.root / "plain.json").write_text("{}")
+        self.assertEqual(path.stat().st_mode & 0o777, (self.root / "plain.json").stat().st_mode & 0o777)
+        (self.root / "plain.json").unlink()
+        path.unlink()
+        self.assertTrue(writer.write(path, {"v": 1}, "h1"))
+        path.write_text('{"v": 0, "edited": true}')
+        self.assertTrue(writer.write(path, {"v": 1}, "h1"))
+        self.assertEqual(json.loads(path.read_text()), {"v": 1})
+        self.assertFalse(writer.write(path, {"v": 1}, "h1"))
+
+    def test_failed_write_leaves_previous_artifact_intact(self) -> None:
+        writer = ArtifactWriter()
+        path = self.root / "doc.json"
+        writer.write(path, {"v": 1}, "h1")
+        with mock.patch("not_mainstreet.adapters._writer.os.replace", side_effect=OSError("crash")):
+            with self.assertRaises(OSError):
+                writer.write(path, {"v": 2}, "h2")
+        self.assertEqual(json.loads(path.read_text()), {"v": 1})
+        self.assertEqual(os.listdir(self.root), ["doc.json"])
+        self.assertTrue(writer.write(path, {"v": 2}, "h2"))
+
+    def test_orchestrator_reprocess_does_not_rewrite(self) -> None:
+        cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        try:
+            orch = Orchestrator()
+            payload = {"metadata": {"title": "Same"}, "content": {"blocks": []}}
+            orch.process("doc-same", payload)
+            orch.process("doc-same", payload)
+            orch.close()
+        finally:
+            os.chdir(cwd)
+        self.assertEqual((orch.writer.writes, orch.writer.skipped), (2, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+
+from not_mainstreet import Orchestrator
+from not_mainstreet.api_stub import run_api_stub
+from not_mainstreet.api_transport import FeigenbuamApiPublisher, HTTPConnectionPool, KantianApiPublisher, retry_after_s
+from not_mainstreet.cdm import CDMRecord
+from not_mainstreet.errors import ContractError, TransportError, UnsupportedIntegrationMode, ValidationError
+
+
+class ApiModeTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server, self.state = run_api_stub()
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _orch(self, **kwargs) -> Orchestrator:
+        kwargs.setdefault("retry_backoff_s", 0)
+        return Orchestrator(mode="api", endpoints={"kantian_ivi": self.url, "feigenbuam": self.url}, **kwargs)
+
+    @staticmethod
+    def _docs(n: int, title: str = "Doc"):
+        return [(f"doc-{i}", {"metadata": {"title": f"{title} {i}", "tags": ["t"]}, "content": {"blocks": []}}) for i in range(n)]
+
+    def test_process_posts_then_puts_and_reuses_connections(self) -> None:
+        orch = self._orch()
+        first = orch.process("doc/a", {"metadata": {"title": "A"}, "content": {"blocks": []}})
+        second = orch.process("doc/a", {"metadata": {"title": "A2"}, "content": {"blocks": []}})
+        for i in range(10):
+            orch.process(f"doc-{i}", {"metadata": {"title": str(i)}, "content": {"blocks": []}})
+        orch.close()
+
+        self.assertTrue(first.complete and second.complete)
+        self.assertEqual(first.kantian_ivi_path, "/documents/doc%2Fa")
+        self.assertEqual(self.state.documents["doc/a"]["version"], 2)
+        self.assertEqual(self.state.index["doc/a-2"]["search"]["title"], "A2")
+        pools = orch.http_pools.values()
+        self.assertEqual(sum(p.requests_sent for p in pools), 24)
+        self.assertLessEqual(sum(p.connections_opened for p in pools), 4)
+        self.assertEqual(self.state.connections, sum(p.connections_opened for p in pools))
+
+    def test_process_many_bulk_upserts_in_chunks(self) -> None:
+        orch = self._orch()
+        orch.batch_publishers["feigenbuam"].__self__.bulk_size = 40
+        stats = orch.process_many(self._docs(100), batch_size=100)
+        orch.close()
+
+        self.assertEqual(stats.published, 100)
+        self.assertEqual(len(self.state.index), 100)
+        self.assertEqual(len(self.state.documents), 100)
+        self.assertEqual(orch.http_pools["feigenbuam"].requests_sent, 3)
+
+    def test_5xx_is_retried_and_4xx_is_terminal(self) -> None:
+        orch = self._orch()
+        self.state.fail_next(1, status=503)
+        retried = orch.process("doc-r", {"metadata": {"title": "R"}, "content": {"blocks": []}})
+        self.assertTrue(retried.complete)
+        self.assertEqual(sum(t.attempts for t in retried.targets.values()), 3)
+
+        self.state.fail_next(1, status=422)
+        rejected = orch.process("doc-x", {"metadata": {"title": "X"}, "content": {"blocks": []}})
+        orch.close()
+        failed = [t for t in rejected.targets.values() if t.state == "failed"]
+        self.assertEqual(len(failed), 1)
+        self.assertEqual(failed[0].attempts, 1)
+        self.assertIn("ContractError", failed[0].error)
+
+    def test_throttling_is_retried_and_replayed_create_succeeds(self) -> None:
+        orch = self._orch()
+        self.state.fail_next(1, status=429)
+        self.state.fail_next(1, status=408)
+        result = orch.process("doc-t", {"metadata": {"title": "T"}, "content": {"blocks": []}})
+        orch.close()
+        self.assertTrue(result.complete)
+        self.assertEqual(sum(t.attempts for t in result.targets.values()), 4)
+
+        self.assertEqual(retry_after_s("7"), 7.0)
+        self.assertEqual(retry_after_s("Thu, 01 Jan 1970 00:01:40 GMT", now=40.0), 60.0)
+        self.assertIsNone(retry_after_s("soon"))
+
+        # The create landed but its response was lost: the retry's 409 is a success.
+        pool = HTTPConnectionPool(self.url)
+        publisher = KantianApiPublisher(pool)
+        record = CDMRecord("doc-c", 1, {"metadata": {"title": "C"}}, "c" * 64)
+        publisher(record)
+        self.state.responses.clear()
+        self.assertEqual(publisher(record), "/documents/doc-c")
+        pool.close()
+
+    def test_idempotency_key_replays_bulk_response(self) -> None:
+        pool = HTTPConnectionPool(self.url)
+        publisher = FeigenbuamApiPublisher(pool)
+        record = CDMRecord("doc-i", 1, {"metadata": {"title": "I"}}, "h" * 64)
+        publisher.publish_many([record])
+        before = dict(self.state.index)
+        self.state.index.clear()
+        publisher.publish_many([record])  # same key: server answers from its idempotency cache
+        pool.close()
+        self.assertEqual(self.state.index, {})
+        self.assertEqual(len(before), 1)
+
+    def test_transport_failure_and_config_errors(self) -> None:
+        pool = HTTPConnectionPool("http://127.0.0.1:9", timeout=0.5)
+        with self.assertRaises(TransportError):
+            pool.request("GET", "/documents/x")
+        with self.assertRaises(ContractError):
+            HTTPConnectionPool(self.url).request("GET", "/documents/missing")
+        with self.assertRaises(ValidationError):
+            Orchestrator(mode="api", endpoints={"kantian_ivi": self.url})
+        with self.assertRaises(UnsupportedIntegrationMode):
+            Orchestrator(mode="carrier-pigeon").process("d", {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+import os
+import tempfile
+import time
+import unittest
+from io import BytesIO
+from pathlib import Path
+from unittest import mock
+
+from tests.docx_fixtures import build_docx
+
+from not_mainstreet import asset_gc
+from not_mainstreet.asset_gc import collect_garbage, live_asset_ids
+from not_mainstreet.assets import AssetRecord, AssetStore
+from not_mainstreet.cdm import CDMRegistry
+from not_mainstreet.docx_upload import ingest_docx_upload
+
+
+class AssetGarbageCollectionTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.store = AssetStore(root=str(Path(self.tmp.name) / "assets"))
+        self.registry = CDMRegistry()
+        self.old = time.time() - 3 * 86400
+
+    def _put_old(self, content: bytes) -> str:
+        digest = self.store.put(content)
+        os.utime(self.store.path_for(digest), (self.old, self.old))
+        return digest
+
+    def test_sweeps_only_unreferenced_objects_past_grace(self) -> None:
+        live_v1 = self._put_old(b"image in v1")
+        live_v2 = self._put_old(b"image in v2")
+        orphans = [self._put_old(f"orphan {i}".encode()) for i in range(5)]
+        fresh_orphan = self.store.put(b"uploaded moments ago")
+        retained_docx = self._put_old(b"raw docx upload")
+        self.store.record([AssetRecord(asset_id=orphans[0], mime="image/png", size_bytes=8, source_location="x")])
+
+        self.registry.register("doc", {"assets": [{"asset_id": live_v1}], "content": {"blocks": []}})
+        self.registry.register(
+            "doc",
+            {"assets": [], "content": {"blocks": [{"type": "image", "image": {"asset_id": live_v2}}]}},
+        )
+        self.assertEqual(live_asset_ids(self.registry), {live_v1, live_v2})
+
+        reports = []
+        cursor = None
+        while True:
+            report = collect_garbage(
+                self.store, self.registry, retain=[retained_docx], batch_size=1, resume_from=cursor
+            )
+            reports.append(report)
+            cursor = report.cursor
+            if report.complete:
+                break
+
+        self.assertGreater(len(reports), 1)
+        self.assertEqual(sum(r.scanned for r in reports), 9)
+        self.assertEqual(sum(r.deleted for r in reports), 5)
+        self.assertEqual(sum(r.reclaimed_bytes for r in reports), sum(len(f"orphan {i}") for i in range(5)))
+        for digest in orphans:
+            self.assertFalse(self.store.has(digest))
+        for digest in (live_v1, live_v2, fresh_orphan, retained_docx):
+            self.assertTrue(self.store.has(digest))
+        self.assertEqual(self.store.metadata(orphans[0]), [])
+
+    def test_reput_during_grace_protects_object(self) -> None:
+        digest = self._put_old(b"about to be re-referenced")
+        self.store.put(b"about to be re-referenced")  # dedup refreshes mtime
+        report = collect_garbage(self.store, self.registry)
+        self.assertTrue(report.complete)
+        self.assertEqual((report.deleted, report.retained_in_grace), (0, 1))
+        self.assertTrue(self.store.has(digest))
+
+    def test_two_stores_racing_gc_do_not_lose_objects(self) -> None:
+        uploader = AssetStore(root=str(self.store.root))
+        content = b"shared between two processes"
+        digest = uploader.put(content)
+        os.utime(self.store.path_for(digest), (self.old, self.old))
+
+        # The sweeper deletes the object while the uploader still believes it is stored.
+        self.assertEqual(collect_garbage(self.store, self.registry).deleted, 1)
+        self.assertEqual(uploader.put(content), digest)
+        self.assertEqual(self.store.path_for(digest).read_bytes(), content)
+        with uploader.spool() as spool:
+            spool.write(content)
+        os.unlink(self.store.path_for(digest))
+        uploader.adopt(spool.name, digest)
+        self.assertEqual(self.store.path_for(digest).read_bytes(), content)
+
+        # A re-put that lands between the sweeper's scan and its delete keeps the object.
+        os.utime(self.store.path_for(digest), (self.old, self.old))
+        real_rename = os.rename
+
+        def rename_after_touch(src: str, dst: str) -> None:
+            if dst.endswith(f"gc-{digest}"):
+                uploader.put(content)
+            real_rename(src, dst)
+
+        with mock.patch.object(asset_gc.os, "rename", rename_after_touch):
+            report = collect_garbage(self.store, self.registry)
+        self.assertEqual((report.deleted, report.retained_in_grace), (0, 1))
+        self.assertEqual(self.store.path_for(digest).read_bytes(), content)
+
+    def test_registered_upload_keeps_its_source_docx(self) -> None:
+        upload = ingest_docx_upload("plan.docx", BytesIO(build_docx()), self.store, document_id="plan")
+        record = self.registry.register("plan", upload.cdm)
+        for digest in [upload.asset_id, *(a["asset_id"] for a in upload.cdm["assets"])]:
+            os.utime(self.store.path_for(digest), (self.old, self.old))
+        self.assertIn(upload.asset_id, live_asset_ids(self.registry))
+        self.assertEqual(collect_garbage(self.store, self.registry).deleted, 0)
+        self.assertTrue(self.store.has(upload.asset_id))
+
+        again = ingest_docx_upload("plan.docx", BytesIO(build_docx()), self.store, document_id="plan")
+        self.assertIs(self.registry.register("plan", again.cdm), record)
+
+    def test_flat_layout_objects_are_swept(self) -> None:
+        live = self.store.put(b"legacy but referenced")
+        orphan = self.store.put(b"legacy orphan")
+        for digest in (live, orphan):
+            flat = self.store.root / digest
+            os.rename(self.store.path_for(digest), flat)
+            os.utime(flat, (self.old, self.old))
+        self.registry.register("doc", {"assets": [{"asset_id": live}], "content": {"blocks": []}})
+
+        report = collect_garbage(self.store, self.registry)
+        self.assertEqual((report.deleted, report.retained_live), (1, 1))
+        self.assertFalse((self.store.root / orphan).exists())
+        self.assertEqual(self.store.get(live), b"legacy but referenced")
+        self.assertTrue(os.path.exists(self.store.index_path))
+
+    def test_stale_spool_files_are_removed(self) -> None:
+        with self.store.spool() as spool:
+            spool.write(b"crashed writer")
+        os.utime(spool.name, (self.old, self.old))
+        report = collect_garbage(self.store, self.registry)
+        self.assertEqual(report.spool_files_removed, 1)
+        self.assertFalse(os.path.exists(spool.name))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import hashlib
+import mmap
+import tempfile
+import threading
+import unittest
+from io import BytesIO
+from pathlib import Path
+from unittest import mock
+
+from not_mainstreet.assets import AssetRecord, AssetStore
+
+
+class AssetStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.store = AssetStore(root=str(Path(self.tmp.name) / "assets"))
+
+    def test_put_stream_is_sharded_and_matches_put(self) -> None:
+        content = b"community map tile" * 1000
+        digest = self.store.put_stream(BytesIO(content), chunk_size=333)
+        self.assertEqual(digest, hashlib.sha256(content).hexdigest())
+        self.assertEqual(self.store.put(content), digest)
+        path = self.store.path_for(digest)
+        self.assertEqual(path, self.store.root / digest[:2] / digest[2:4] / digest)
+        self.assertEqual(path.read_bytes(), content)
+        self.assertEqual(list(self.store.spool_dir.iterdir()), [])
+
+    def test_get_returns_memory_mapped_view(self) -> None:
+        store = AssetStore(root=str(self.store.root), cache_item_bytes=0)
+        digest = store.put(b"abcdef")
+        view = store.get(digest)
+        self.assertIsInstance(view, mmap.mmap)
+        self.assertEqual(view[1:4], b"bcd")
+        self.assertEqual(self.store.get(self.store.put(b"")), b"")
+        with self.assertRaises(KeyError):
+            self.store.get("0" * 64)
+
+    def test_small_objects_are_served_from_byte_bounded_lru(self) -> None:
+        store = AssetStore(root=str(self.store.root), cache_bytes=10, cache_item_bytes=6)
+        a, b, c = store.put(b"aaaaa"), store.put(b"bbbbb"), store.put(b"cc")
+        self.assertEqual(store.get(a), b"aaaaa")
+        self.assertEqual(store.get(b), b"bbbbb")
+        with mock.patch.object(AssetStore, "_locate", side_effect=AssertionError("disk")):
+            self.assertEqual(store.get(a), b"aaaaa")
+            self.assertEqual(store.open_range(b, 1, 3), b"bb")
+        store.get(c)  # 12 bytes > 10: evicts the least recently used entry (a)
+        self.assertEqual(list(store._cache), [b, c])
+        self.assertIsInstance(store.get(store.put(b"x" * 100)), mmap.mmap)
+
+    def test_mime_caches_recorded_types_only(self) -> None:
+        digest = self.store.put(b"%PDF-1.7")
+        self.assertEqual(self.store.mime(digest), "application/octet-stream")
+        self.store.record([AssetRecord(digest, "application/pdf", 8, "upload:a.pdf")])
+        self.assertEqual(self.store.mime(digest), "application/pdf")
+        with mock.patch.object(AssetStore, "metadata", side_effect=AssertionError("index")):
+            self.assertEqual(self.store.mime(digest), "application/pdf")
+
+    def test_open_range_reads_partial_content(self) -> None:
+        store = AssetStore(root=str(self.store.root), cache_item_bytes=0)
+        digest = store.put(bytes(range(100)))
+        self.assertEqual(store.open_range(digest, 10, 13), bytes([10, 11, 12]))
+        self.assertEqual(store.open_range(digest, 98), bytes([98, 99]))
+        with self.assertRaises(ValueError):
+            store.open_range(digest, 5, 2)
+
+    def test_known_digests_skip_filesystem_checks(self) -> None:
+        digest = self.store.put(b"seen once")
+        with mock.patch.object(AssetStore, "_locate", side_effect=AssertionError("stat")):
+            self.assertTrue(self.store.has(digest))
+            self.assertEqual(self.store.put(b"seen once"), digest)
+
+    def test_legacy_flat_objects_remain_readable(self) -> None:
+        content = b"pre-sharding object"
+        digest = hashlib.sha256(content).hexdigest()
+        (self.store.root / digest).write_bytes(content)
+        fresh = AssetStore(root=str(self.store.root))
+        self.assertTrue(fresh.has(digest))
+        self.assertEqual(bytes(fresh.get(digest)), content)
+
+    def test_concurrent_writers_never_leave_torn_objects(self) -> None:
+        content = bytes(range(256)) * 4096
+        digests: list[str] = []
+
+        def writer() -> None:
+            store = AssetStore(root=str(self.store.root))
+            digests.append(store.put_stream(BytesIO(content), chunk_size=4096))
+
+        threads = [threading.Thread(target=writer) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(set(digests)), 1)
+        self.assertEqual(self.store.path_for(digests[0]).read_bytes(), content)
+        self.assertEqual(list(self.store.spool_dir.iterdir()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import os
+import signal
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from tests.docx_fixtures import build_docx
+
+from not_mainstreet import docx_batch
+from not_mainstreet.docx_batch import BatchIngestStats, ingest_docx_batch
+
+_real_ingest_one = docx_batch._ingest_one
+
+
+def _ingest_or_misbehave(path: str, typical_timeout_s: float, hard_timeout_s: float):
+    """Worker stand-in: ``crash-*`` kills its process, ``wedged-*`` ignores the alarm and hangs."""
+    name = Path(path).name
+    if name.startswith("crash-"):
+        os._exit(1)
+    if name.startswith("wedged-"):
+        signal.signal(signal.SIGALRM, signal.SIG_IGN)
+        time.sleep(60)
+    return _real_ingest_one(path, typical_timeout_s, hard_timeout_s)
+
+
+class DocxBatchIngestTests(unittest.TestCase):
+    def test_batch_reports_each_file_and_throughput(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for i in range(5):
+                path = Path(tmp) / f"doc-{i}.docx"
+                path.write_bytes(build_docx())
+                paths.append(path)
+            broken = Path(tmp) / "broken.docx"
+            broken.write_bytes(b"not a zip archive")
+            paths.append(broken)
+
+            stats = BatchIngestStats()
+            results = list(ingest_docx_batch(paths, workers=2, stats=stats))
+
+        self.assertEqual(len(results), 6)
+        by_path = {Path(r.path).name: r for r in results}
+        self.assertEqual(by_path["broken.docx"].status, "error")
+        self.assertIn("BadZipFile", by_path["broken.docx"].error)
+        good = [r for name, r in by_path.items() if name != "broken.docx"]
+        self.assertTrue(all(r.status == "ok" for r in good))
+        self.assertEqual(len({r.cdm_hash for r in good}), 5)  # document_id differs per file
+        self.assertEqual(len({r.checksum_sha256 for r in good}), 1)
+
+        self.assertEqual((stats.files, stats.succeeded, stats.failed), (6, 5, 1))
+        self.assertGreater(stats.files_per_s, 0)
+
+    def test_dead_and_wedged_workers_fail_only_their_own_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for name in ("crash-0", "wedged-0", *(f"doc-{i}" for i in range(6))):
+                path = Path(tmp) / f"{name}.docx"
+                path.write_bytes(build_docx())
+                paths.append(path)
+
+            stats = BatchIngestStats()
+            with mock.patch.object(docx_batch, "_ingest_one", _ingest_or_misbehave):
+                started = time.perf_counter()
+                results = list(ingest_docx_batch(paths, workers=2, hard_timeout_s=0.5, stats=stats))
+                elapsed = time.perf_counter() - started
+
+        by_path = {Path(r.path).stem: r for r in results}
+        self.assertEqual(len(results), 8)
+        self.assertEqual(by_path["crash-0"].status, "error")
+        self.assertIn("worker process died", by_path["crash-0"].error)
+        self.assertEqual(by_path["wedged-0"].status, "timeout")
+        self.assertTrue(all(by_path[f"doc-{i}"].status == "ok" for i in range(6)))
+        self.assertEqual((stats.succeeded, stats.failed), (6, 2))
+        self.assertLess(elapsed, 30)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import hashlib
+import os
+import tempfile
+import tracemalloc
+import unittest
+import zipfile
+from pathlib import Path
+
+from tests.docx_fixtures import build_docx
+
+from not_mainstreet import (
+    extract_docx_text,
+    extract_docx_text_path,
+    ingest_docx_path,
+    parse_docx,
+    parse_docx_path,
+)
+from not_mainstreet.docx_ingest import sha256_chunked
+
+
+class MappedDocxInputTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = Path(self.tmp.name) / "plan.docx"
+        self.blob = build_docx(media={"big.bin": os.urandom(8 * 1024 * 1024)})
+        self.path.write_bytes(self.blob)
+
+    def test_path_entry_points_match_blob_entry_points(self) -> None:
+        ingested = ingest_docx_path(self.path)
+        self.assertEqual(ingested.filename, "plan.docx")
+        self.assertEqual(ingested.checksum_sha256, hashlib.sha256(self.blob).hexdigest())
+        self.assertEqual(extract_docx_text_path(self.path), extract_docx_text(self.blob))
+        self.assertEqual(parse_docx_path(self.path, "plan"), parse_docx(self.blob, "plan"))
+
+    def test_chunked_checksum_is_chunk_size_independent(self) -> None:
+        expected = hashlib.sha256(self.blob).hexdigest()
+        for chunk in (4096, 10**6, len(self.blob) + 1):
+            self.assertEqual(sha256_chunked(self.blob, chunk), expected)
+
+    def test_checksum_does_not_load_file_onto_heap(self) -> None:
+        tracemalloc.start()
+        try:
+            ingest_docx_path(self.path)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertLess(peak, 1024 * 1024)
+
+    def test_empty_file_is_rejected_as_bad_zip(self) -> None:
+        empty = Path(self.tmp.name) / "empty.docx"
+        empty.write_bytes(b"")
+        with self.assertRaises(zipfile.BadZipFile):
+            extract_docx_text_path(empty)
+        self.assertEqual(ingest_docx_path(empty).checksum_sha256, hashlib.sha256(b"").hexdigest())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import tempfile
+import unittest
+import zipfile
+from io import BytesIO
+from pathlib import Path
+
+from tests.docx_fixtures import PNG_BYTES, build_docx
+
+from not_mainstreet import extract_docx_media, ingest_docx_upload
+from not_mainstreet.assets import AssetStore
+
+
+class DocxMediaExtractionTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.store = AssetStore(root=str(Path(self.tmp.name) / "assets"))
+
+    def test_media_is_deduplicated_within_and_across_documents(self) -> None:
+        blob = build_docx(media={"image1.png": PNG_BYTES, "copy.png": PNG_BYTES, "chart.emf": b"emf-bytes"})
+        with zipfile.ZipFile(BytesIO(blob)) as zf:
+            first = extract_docx_media(zf, self.store)
+        self.assertEqual((first.written, first.deduplicated), (2, 1))
+        self.assertEqual(len(first.assets), 3)
+
+        # A later version with unchanged media writes nothing.
+        with zipfile.ZipFile(BytesIO(build_docx(media={"image1.png": PNG_BYTES}))) as zf:
+            second = extract_docx_media(zf, self.store)
+        self.assertEqual((second.written, second.deduplicated), (0, 1))
+
+        png = first.assets[[a.source_location for a in first.assets].index("word/media/image1.png")]
+        self.assertEqual(png.mime, "image/png")
+        self.assertEqual(png.size_bytes, len(PNG_BYTES))
+        self.assertEqual(self.store.path_for(png.asset_id).read_bytes(), PNG_BYTES)
+        self.assertEqual(
+            [m.source_location for m in self.store.metadata(png.asset_id)],
+            ["word/media/copy.png", "word/media/image1.png"],
+        )
+
+    def test_oversized_parts_are_skipped(self) -> None:
+        with zipfile.ZipFile(BytesIO(build_docx(media={"huge.bin": b"x" * 2048}))) as zf:
+            out = extract_docx_media(zf, self.store, max_asset_bytes=1024)
+        self.assertEqual(out.assets, [])
+        self.assertIn("word/media/huge.bin", out.skipped)
+
+    def test_upload_binds_assets_into_cdm(self) -> None:
+        upload = ingest_docx_upload("plan.docx", BytesIO(build_docx()), self.store, document_id="plan")
+        image = next(b for b in upload.cdm["content"]["blocks"] if b["type"] == "image")
+        self.assertEqual(image["image"]["asset_id"], upload.cdm["assets"][0]["asset_id"])
+        self.assertEqual(upload.cdm["assets"][0]["source_location"], "word/media/image1.png")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+import zipfile
+from io import BytesIO
+
+from tests.docx_fixtures import build_docx, document_xml
+
+from not_mainstreet import CDMRegistry, canonicalize_cdm, parse_docx
+
+
+class DocxParserTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cdm = parse_docx(build_docx(), "doc-plan")
+        self.blocks = self.cdm["content"]["blocks"]
+
+    def test_blocks_cover_headings_lists_tables_images_and_footnotes(self) -> None:
+        kinds = [b["type"] for b in self.blocks]
+        self.assertEqual(
+            kinds,
+            ["heading", "paragraph", "list", "list", "heading", "table", "image", "footnote"],
+        )
+        self.assertEqual(self.cdm["metadata"]["title"], "Main Street Plan")
+        self.assertEqual(self.cdm["structure"]["toc"][1]["anchor"], "budget")
+
+    def test_heading_level_resolved_through_based_on_chain(self) -> None:
+        headings = [b for b in self.blocks if b["type"] == "heading"]
+        self.assertEqual([h["heading_level"] for h in headings], [1, 1])
+
+    def test_inline_runs_keep_semantics(self) -> None:
+        runs = self.blocks[1]["runs"]
+        self.assertEqual(runs[0], {"text": "Neighbors "})
+        self.assertEqual(runs[1], {"text": "share", "bold": True})
+        self.assertEqual(runs[2], {"text": "tools", "code": True})
+        self.assertEqual(runs[3], {"text": "market", "href": "https://example.org/market"})
+        self.assertEqual(runs[4], {"footnote_ref": "1"})
+
+    def test_lists_tables_and_footnotes(self) -> None:
+        bullets, steps = self.blocks[2], self.blocks[3]
+        self.assertEqual((bullets["list_type"], bullets["items"]), ("unordered", ["first bullet", "second bullet"]))
+        self.assertEqual((steps["list_type"], steps["items"]), ("ordered", ["step one"]))
+        self.assertEqual(self.blocks[5]["table"]["rows"], [["Item", "Cost"], ["Total", ""]])
+        self.assertEqual(self.blocks[6]["image"], {"source_location": "word/media/image1.png", "alt": "Storefront"})
+        self.assertEqual(self.blocks[7]["text"], "Source: town ledger.")
+        self.assertEqual(self.cdm["references"][0]["target"], self.blocks[7]["block_id"])
+
+    def test_explicit_off_in_child_style_is_not_inherited(self) -> None:
+        body = (
+            '<w:p><w:r><w:rPr><w:rStyle w:val="Quiet"/></w:rPr><w:t>calm</w:t></w:r>'
+            '<w:r><w:rPr><w:rStyle w:val="Strong"/></w:rPr><w:t>loud</w:t></w:r></w:p>'
+        )
+        runs = parse_docx(build_docx(body), "doc-quiet")["content"]["blocks"][0]["runs"]
+        self.assertEqual(runs, [{"text": "calm"}, {"text": "loud", "bold": True}])
+
+    def test_nested_table_rows_stay_in_their_cell(self) -> None:
+        body = (
+            "<w:tbl><w:tr>"
+            "<w:tc><w:p><w:r><w:t>outer</w:t></w:r></w:p></w:tc>"
+            "<w:tc><w:tbl>"
+            "<w:tr><w:tc><w:p><w:r><w:t>a</w:t></w:r></w:p></w:tc><w:tc><w:p><w:r><w:t>b</w:t></w:r></w:p></w:tc></w:tr>"
+            "<w:tr><w:tc><w:p><w:r><w:t>c</w:t></w:r></w:p></w:tc><w:tc><w:p><w:r><w:t>d</w:t></w:r></w:p></w:tc></w:tr>"
+            "</w:tbl><w:p/></w:tc>"
+            "</w:tr></w:tbl>"
+        )
+        table = parse_docx(build_docx(body), "doc-nested")["content"]["blocks"][0]["table"]
+        self.assertEqual(table["rows"], [["outer", "a\tb\nc\td\n"]])
+
+    def test_output_registers_and_is_deterministic(self) -> None:
+        again = parse_docx(build_docx(), "doc-plan")
+        self.assertEqual(canonicalize_cdm(self.cdm), canonicalize_cdm(again))
+
+        registry = CDMRegistry()
+        self.assertEqual(registry.register("doc-plan", self.cdm).version, 1)
+        self.assertEqual(registry.register("doc-plan", again).version, 1)
+
+    def test_missing_document_part_is_rejected(self) -> None:
+        buf = BytesIO()
+        with zipfile.ZipFile(buf, "w") as zf:
+            zf.writestr("word/styles.xml", "<x/>")
+        with self.assertRaises(ValueError):
+            parse_docx(buf.getvalue(), "broken")
+
+    def test_document_without_optional_parts(self) -> None:
+        buf = BytesIO()
+        with zipfile.ZipFile(buf, "w") as zf:
+            zf.writestr("word/document.xml", document_xml("<w:p><w:r><w:t>plain</w:t></w:r></w:p>"))
+        cdm = parse_docx(buf.getvalue(), "plain")
+        self.assertEqual(cdm["content"]["blocks"][0]["text"], "plain")
+        self.assertEqual(cdm["metadata"]["title"], "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import hashlib
+import tempfile
+import unittest
+import zipfile
+from io import BytesIO
+from pathlib import Path
+
+from tests.docx_fixtures import build_docx
+
+from not_mainstreet import extract_docx_text, ingest_docx_upload, parse_docx
+from not_mainstreet.assets import AssetStore
+from not_mainstreet.errors import ValidationError
+
+
+class _ReadOnlyStream:
+    """Socket-like stream exposing only ``read``."""
+
+    def __init__(self, data: bytes) -> None:
+        self._buf = BytesIO(data)
+
+    def read(self, size: int) -> bytes:
+        return self._buf.read(size)
+
+
+class DocxUploadPipelineTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.store = AssetStore(root=str(Path(self.tmp.name) / "assets"))
+        self.blob = build_docx()
+
+    def _objects(self) -> list[Path]:
+        return [p for p in self.store.root.rglob("*") if p.is_file() and len(p.name) == 64]
+
+    def test_single_pass_checksum_store_and_parse(self) -> None:
+        upload = ingest_docx_upload(
+            "plan.docx", BytesIO(self.blob), self.store, document_id="plan", chunk_size=1024, extract_media=False
+        )
+
+        checksum = hashlib.sha256(self.blob).hexdigest()
+        self.assertEqual(upload.ingested.checksum_sha256, checksum)
+        self.assertEqual(upload.asset_id, checksum)
+        self.assertEqual(upload.size_bytes, len(self.blob))
+        self.assertEqual(self.store.path_for(checksum).read_bytes(), self.blob)
+        self.assertEqual(upload.text, extract_docx_text(self.blob))
+        expected = parse_docx(self.blob, "plan")
+        expected["provenance"]["source_asset_id"] = checksum
+        self.assertEqual(upload.cdm, expected)
+        self.assertEqual(len(self._objects()), 1)
+
+    def test_read_only_streams_and_duplicate_uploads(self) -> None:
+        first = ingest_docx_upload("a.docx", _ReadOnlyStream(self.blob), self.store)
+        second = ingest_docx_upload("b.docx", _ReadOnlyStream(self.blob), self.store)
+        self.assertEqual(first.asset_id, second.asset_id)
+        self.assertIsNone(first.cdm)
+        self.assertEqual(second.media.written, 0)
+        self.assertEqual(len(self._objects()), 2)  # the DOCX plus its single image
+
+    def test_rejected_uploads_never_enter_store(self) -> None:
+        with self.assertRaises(zipfile.BadZipFile):
+            ingest_docx_upload("bad.docx", BytesIO(b"not a docx"), self.store)
+        with self.assertRaises(ValidationError):
+            ingest_docx_upload("big.docx", BytesIO(self.blob), self.store, max_bytes=100)
+        self.assertEqual(self._objects(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
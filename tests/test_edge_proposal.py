@@ -1,6 +1,13 @@
 import unittest
 
 from not_mainstreet import What, When, Where, Who, Why, build_edge_proposal
+from not_mainstreet.edge_proposal import (
+    INTERN_MAX_LEN,
+    RoutingClassifier,
+    evaluate_dual_gate,
+    five_w_from_dicts,
+    route_edge_class,
+)
 
 
 class EdgeProposalTests(unittest.TestCase):
@@ -42,6 +49,63 @@ class EdgeProposalTests(unittest.TestCase):
         self.assertEqual(evaln.gate_results.gate_outcome, "fail")
         self.assertEqual(proposal.status, "submitted")
 
+    def test_records_are_slotted_and_share_labels_and_signals(self) -> None:
+        def fields(category: str, description: str):
+            return five_w_from_dicts(
+                {"user_id": "", "roles": ["".join(["mem", "ber"])], "reputation_ref": "r"},
+                {"goal": "g", "constraints": [], "values": [], "urgency": "normal"},
+                {"category": category, "description": description, "budget": None, "requirements": []},
+                {"scope_level": "".join(["bl", "ock"]), "geo": "x", "service_area": "y", "constraints": []},
+                {"window": "this-week", "trigger_conditions": [], "deadline": "2026-03-01"},
+            )
+
+        long_text = INTERN_MAX_LEN + 1
+        first = fields("".join(["serv", "ice"]), "d" * long_text)
+        second = fields("".join(["se", "rvice"]), "d" * long_text)
+        for record in first:
+            self.assertFalse(hasattr(record, "__dict__"))
+        self.assertIs(first[2].category, second[2].category)
+        self.assertIs(first[3].scope_level, second[3].scope_level)
+        self.assertIs(first[0].roles[0], second[0].roles[0])
+        self.assertIsNot(first[2].description, second[2].description)  # long free text is not interned
+
+        gate_a, gate_b = evaluate_dual_gate(*first), evaluate_dual_gate(*second)
+        self.assertEqual(gate_a, gate_b)
+        self.assertIsNot(gate_a.missing_fields, gate_b.missing_fields)
+        self.assertIs(gate_a.missing_fields[0], gate_b.missing_fields[0])
+        with self.assertRaises(TypeError):
+            five_w_from_dicts({"user_id": "u", "roles": [], "reputation_ref": "r", "extra": 1}, {}, {}, {}, {})
+
+
+class RoutingTests(unittest.TestCase):
+    def _route(self, category: str, description: str = "", goal: str = ""):
+        return route_edge_class(
+            What(category=category, description=description, budget=None, requirements=[]),
+            Why(goal=goal, constraints=[], values=[], urgency="normal"),
+        )
+
+    def test_category_synonym_decides(self) -> None:
+        edge_class, confidence, alternatives, ambiguous = self._route(" Market ", "fix my bike")
+        self.assertEqual((edge_class, confidence, ambiguous), ("commerce_exchange", 0.92, False))
+        self.assertEqual([a.edge_class for a in alternatives], ["commerce_exchange", "service_request", "governance_petition"])
+
+    def test_keywords_in_description_and_goal(self) -> None:
+        self.assertEqual(self._route("", goal="Volunteering at the food bank")[:2], ("volunteer_task", 0.75))
+        self.assertEqual(self._route("other", "Bike repair clinic")[:2], ("service_request", 0.75))
+        edge_class, confidence, alternatives, ambiguous = self._route("", "council vote", "plan a potluck picnic")
+        self.assertEqual((edge_class, confidence, ambiguous), ("governance_petition", 0.475, True))
+        self.assertEqual([a.edge_class for a in alternatives][:2], ["governance_petition", "meetup_coordination"])
+
+    def test_no_evidence_falls_back_and_is_ambiguous(self) -> None:
+        edge_class, confidence, alternatives, ambiguous = self._route("gardening", "tomatoes", "grow things")
+        self.assertEqual((edge_class, confidence, ambiguous), ("service_request", 0.55, True))
+        self.assertEqual([a.confidence for a in alternatives], [0.55, 0.45, 0.2])
+
+    def test_custom_table(self) -> None:
+        router = RoutingClassifier({"a": ("alpha",), "b": ("beta",)}, {"b": {1.0: ("bee",)}})
+        self.assertEqual(router.route("ALPHA", "", "")[0], "a")
+        self.assertEqual(router.route("", "a bee", "")[:2], ("b", 0.75))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,115 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from not_mainstreet import Orchestrator, parse_docx
+from not_mainstreet.adapters import ArtifactWriter
+from not_mainstreet.adapters.feigenbuam import artifact, chunk_cdm, publish_git_many
+from not_mainstreet.cdm import CDMRecord, CDMRegistry
+from tests.docx_fixtures import build_docx
+
+
+def _heading(level: int, text: str) -> dict:
+    return {"type": "heading", "heading_level": level, "text": text, "anchor": text.lower().replace(" ", "-")}
+
+
+def _para(block_id: str, text: str) -> dict:
+    return {"block_id": block_id, "type": "paragraph", "text": text}
+
+
+def _payload(*blocks) -> dict:
+    return {"metadata": {"title": "Plan"}, "content": {"blocks": list(blocks)}}
+
+
+class ChunkerTests(unittest.TestCase):
+    def test_chunks_align_to_headings_and_carry_path(self) -> None:
+        chunks = chunk_cdm(parse_docx(build_docx(), "doc-c"))
+        self.assertEqual([c["heading_path"] for c in chunks], [["Main Street Plan"], ["Budget"]])
+        self.assertEqual(chunks[0]["anchor"], "main-street-plan")
+        self.assertEqual(chunks[0]["block_ids"], ["blk-0002", "blk-0003", "blk-0004"])
+        self.assertEqual(chunks[0]["links"], ["https://example.org/market"])
+        self.assertIn("Item | Cost", chunks[1]["text"])
+
+    def test_nested_headings_and_token_bound(self) -> None:
+        payload = _payload(
+            _heading(1, "Plan"),
+            _heading(2, "Costs"),
+            _para("p1", "word " * 10),
+            _para("p2", "more " * 25),
+            _heading(2, "Timeline"),
+            _para("p3", "soon"),
+        )
+        chunks = chunk_cdm(payload, max_tokens=12)
+        self.assertTrue(all(c["tokens"] <= 12 for c in chunks))
+        self.assertEqual(chunks[0]["heading_path"], ["Plan", "Costs"])
+        self.assertEqual(chunks[0]["block_ids"], ["p1"])
+        self.assertEqual(sum(c["tokens"] for c in chunks if c["heading_path"][-1] == "Costs"), 35)
+        self.assertEqual(chunks[-1]["heading_path"], ["Plan", "Timeline"])
+
+    def test_chunk_ids_are_stable_across_unrelated_edits(self) -> None:
+        v1 = chunk_cdm(_payload(_heading(1, "A"), _para("p1", "alpha"), _heading(1, "B"), _para("p2", "beta")))
+        v2 = chunk_cdm(_payload(_heading(1, "A"), _para("p1", "alpha"), _heading(1, "B"), _para("p2", "beta two")))
+        self.assertEqual(v1[0]["chunk_id"], v2[0]["chunk_id"])
+        self.assertNotEqual(v1[1]["chunk_id"], v2[1]["chunk_id"])
+
+        dup = chunk_cdm(_payload(_heading(1, "A"), _para("p1", "same"), _heading(1, "A"), _para("p2", "same")))
+        self.assertEqual(dup[1]["chunk_id"], dup[0]["chunk_id"] + "-2")
+
+    def test_artifact_emits_only_changed_chunks(self) -> None:
+        p1 = _payload(_heading(1, "A"), _para("p1", "alpha"), _heading(1, "B"), _para("p2", "beta"))
+        p2 = _payload(_heading(1, "A"), _para("p1", "alpha"), _heading(1, "B"), _para("p2", "beta two"))
+        r1, r2 = CDMRecord("d", 1, p1, "h1"), CDMRecord("d", 2, p2, "h2")
+
+        full = artifact(r1)["search"]
+        delta = artifact(r2, r1)["search"]
+        self.assertEqual(len(full["chunks"]), 2)
+        self.assertEqual([c["text"] for c in delta["chunks"]], ["beta two"])
+        self.assertEqual(delta["removed"], [full["manifest"][1]])
+        self.assertEqual(delta["manifest"][0], full["manifest"][0])
+        self.assertEqual(delta["base_version"], 1)
+
+    def test_delta_base_is_last_confirmed_version(self) -> None:
+        history, published = CDMRegistry(), {}
+        versions = [
+            history.register("d", _payload(_heading(1, "A"), _para("p1", text)))
+            for text in ("one", "two", "three")
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            writer = ArtifactWriter()
+            publish_git_many(versions[:1], tmp, writer=writer, history=history, published=published)
+            with mock.patch.object(writer, "write", side_effect=OSError("disk full")):
+                with self.assertRaises(OSError):
+                    publish_git_many(versions[1:2], tmp, writer=writer, history=history, published=published)
+            self.assertEqual(published, {"d": 1})
+            path = publish_git_many(versions[2:], tmp, writer=writer, history=history, published=published)[0]
+            search = json.loads(Path(path).read_text())["search"]
+            self.assertEqual(search["base_version"], 1)  # v2 never landed, so it cannot be the base
+            self.assertEqual(len(search["removed"]), 1)
+
+            unknown = publish_git_many(versions[2:], tmp, writer=ArtifactWriter(), history=history, published={})
+            self.assertNotIn("base_version", json.loads(Path(unknown[0]).read_text())["search"])
+
+
+class OrchestratorChunkTests(unittest.TestCase):
+    def test_second_version_artifact_is_incremental(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cwd = os.getcwd()
+            os.chdir(tmp)
+            try:
+                orch = Orchestrator()
+                orch.process("doc", _payload(_heading(1, "A"), _para("p1", "alpha"), _heading(1, "B"), _para("p2", "b")))
+                result = orch.process("doc", _payload(_heading(1, "A"), _para("p1", "alpha"), _heading(1, "B"), _para("p2", "c")))
+                orch.close()
+                search = json.loads(Path(result.feigenbuam_path).read_text())["search"]
+            finally:
+                os.chdir(cwd)
+        self.assertEqual(len(search["manifest"]), 2)
+        self.assertEqual([c["text"] for c in search["chunks"]], ["c"])
+        self.assertEqual(len(search["removed"]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import itertools
+import json
+import random
+import unittest
+
+from not_mainstreet.edge_proposal import What, When, Where, Who, Why, evaluate_dual_gate, route_edge_class
+from not_mainstreet.gate_batch import (
+    HAS_NUMPY,
+    GateColumns,
+    evaluate_dual_gate_batch,
+    gate_flags,
+    route_edge_class_batch,
+)
+from not_mainstreet.gate_policy import DEFAULT_POLICY_PATH, compile_gate_policy
+
+
+def _rows(n: int, seed: int = 7) -> list[tuple[Who, Why, What, Where, When]]:
+    rng = random.Random(seed)
+    categories = [
+        "service", " Repair ", "care", "COMMERCE", "market", "sale", "governance", "Petition", "policy",
+        "volunteer", "mutual_aid", "\tEvent\n", "meetup", "", "other", "gardening",
+    ]
+    goals = ["", "help neighbors", "Volunteer at the shelter", "find volunteers", "fix the road"]
+    descriptions = ["", "deliver food", "Sell jars at the market", "council vote on zoning", "potluck RSVP", "misc"]
+    rows = []
+    for i in range(n):
+        rows.append(
+            (
+                Who(rng.choice(["", f"u-{i}"]), rng.choice([[], ["member"], ["member", "BANNED"], ["banned"]]), "rep"),
+                Why(rng.choice(goals), [], rng.choice([[], ["care"], ["care", "trust"]]), "normal"),
+                What(rng.choice(categories), rng.choice(descriptions), rng.choice([None, -5, 0, 12.5]), []),
+                Where(rng.choice(["household", "block", "town", "region", "", "planet"]), "g", "sa", []),
+                When(rng.choice(["", "this-week"]), [], "2026-03-01"),
+            )
+        )
+    return rows
+
+
+class GateBatchEquivalenceTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.rows = _rows(3000)
+        self.columns = GateColumns.from_fields(self.rows)
+        self.expected_gates = [evaluate_dual_gate(*row) for row in self.rows]
+        self.expected_routes = [route_edge_class(row[2], row[1]) for row in self.rows]
+
+    def _assert_equivalent(self, use_numpy: bool) -> None:
+        self.assertEqual(evaluate_dual_gate_batch(self.columns, use_numpy=use_numpy), self.expected_gates)
+        self.assertEqual(route_edge_class_batch(self.columns, use_numpy=use_numpy), self.expected_routes)
+
+    def test_plain_lists_match_scalar_path(self) -> None:
+        self._assert_equivalent(use_numpy=False)
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy not installed")
+    def test_numpy_masks_match_scalar_path(self) -> None:
+        self._assert_equivalent(use_numpy=True)
+        self.assertEqual(
+            [int(f) for f in gate_flags(self.columns, use_numpy=True)],
+            list(gate_flags(self.columns, use_numpy=False)),
+        )
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy not installed")
+    def test_numpy_masks_follow_any_policy_document(self) -> None:
+        document = json.loads(DEFAULT_POLICY_PATH.read_text(encoding="utf-8"))
+        document["policy_version"] = "gate-policy/test"
+        tests = [
+            {"op": "not", "test": {"op": "in", "path": "what.category", "values": ["service", "sale"]}},
+            {"op": "any", "of": [{"op": "ne", "path": "where.scope_level", "value": "town"},
+                                 {"op": "ge", "path": "what.budget", "value": 12.5}]},
+            {"op": "all", "of": [{"op": "empty", "path": "who.roles"}, {"op": "eq", "path": "what.budget", "value": 0}]},
+            {"op": "has_item_ci", "path": "why.values", "value": "TRUST"},
+            {"op": "le", "path": "what.budget", "value": 0},
+            {"op": "empty", "path": "what.budget"},
+        ]
+        for i, test in enumerate(tests):
+            document["rules"].append({"id": f"extra-{i}", "code": "CONFLICT", "field": "f", "message": "m", "when": test})
+        policy = compile_gate_policy(document)
+        self.assertEqual(
+            [int(f) for f in gate_flags(self.columns, use_numpy=True, policy=policy)],
+            gate_flags(self.columns, use_numpy=False, policy=policy),
+        )
+        self.assertEqual(
+            evaluate_dual_gate_batch(self.columns, use_numpy=True, policy=policy),
+            [evaluate_dual_gate(*row, policy=policy) for row in self.rows],
+        )
+
+    def test_covers_every_outcome_and_rule(self) -> None:
+        outcomes = {gate.gate_outcome for gate in self.expected_gates}
+        self.assertEqual(outcomes, {"pass", "partial", "fail"})
+        flags = 0
+        for value in gate_flags(self.columns, use_numpy=False):
+            flags |= value
+        self.assertEqual(flags, (1 << 9) - 1)
+        self.assertEqual(len({route[0] for route in self.expected_routes}), 5)
+
+    def test_rows_do_not_share_mutable_lists(self) -> None:
+        gates = evaluate_dual_gate_batch(GateColumns.from_fields(_rows(2)[:1] * 2), use_numpy=False)
+        self.assertIsNot(gates[0].missing_fields, gates[1].missing_fields)
+
+    def test_from_payloads_and_empty_input(self) -> None:
+        payloads = [
+            {
+                "who": {"user_id": "u", "roles": [], "reputation_ref": "r"},
+                "why": {"goal": "g", "constraints": [], "values": ["care"], "urgency": "normal"},
+                "what": {"category": "sale", "description": "d", "budget": None, "requirements": []},
+                "where": {"scope_level": "town", "geo": "x", "service_area": "y", "constraints": []},
+                "when": {"window": "w", "trigger_conditions": [], "deadline": "2026-03-01"},
+            }
+        ]
+        for use_numpy in itertools.compress([False, True], [True, HAS_NUMPY]):
+            columns = GateColumns.from_payloads(payloads)
+            self.assertEqual(evaluate_dual_gate_batch(columns, use_numpy=use_numpy)[0].gate_outcome, "pass")
+            self.assertEqual(route_edge_class_batch(columns, use_numpy=use_numpy)[0][0], "commerce_exchange")
+            empty = GateColumns.from_fields([])
+            self.assertEqual(evaluate_dual_gate_batch(empty, use_numpy=use_numpy), [])
+            self.assertEqual(route_edge_class_batch(empty, use_numpy=use_numpy), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
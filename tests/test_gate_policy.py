@@ -0,0 +1,109 @@
+import copy
+import json
+import unittest
+
+from not_mainstreet.edge_proposal import What, When, Where, Who, Why, evaluate_dual_gate
+from not_mainstreet.errors import ValidationError
+from not_mainstreet.gate_batch import GateColumns, evaluate_dual_gate_batch
+from not_mainstreet.gate_policy import DEFAULT_POLICY_PATH, compile_gate_policy, default_gate_policy
+
+
+def _fields(**overrides):
+    fields = {
+        "who": Who(user_id="u-1", roles=["member"], reputation_ref="rep:1"),
+        "why": Why(goal="help neighbors", constraints=[], values=["care"], urgency="normal"),
+        "what": What(category="service", description="deliver food", budget=10, requirements=[]),
+        "where": Where(scope_level="block", geo="x", service_area="y", constraints=[]),
+        "when": When(window="this-week", trigger_conditions=[], deadline="2026-03-01"),
+    }
+    fields.update(overrides)
+    return fields
+
+
+class GatePolicyTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.document = json.loads(DEFAULT_POLICY_PATH.read_text(encoding="utf-8"))
+
+    def test_default_policy_records_version_and_signals(self) -> None:
+        gate = evaluate_dual_gate(
+            **_fields(
+                who=Who(user_id="u-1", roles=["Banned"], reputation_ref="r"),
+                what=What(category="governance", description="d", budget=-1, requirements=[]),
+                where=Where(scope_level="household", geo="x", service_area="y", constraints=[]),
+            )
+        )
+        self.assertEqual(gate.policy_version, "gate-policy/v1")
+        self.assertEqual(gate.gate_outcome, "fail")
+        self.assertEqual([s.field for s in gate.policy_blocks], ["who.roles"])
+        self.assertEqual([s.code for s in gate.conflicts], ["CONFLICT"])
+        self.assertEqual([s.message for s in gate.feasibility_blocks], ["Budget cannot be negative"])
+        self.assertEqual(evaluate_dual_gate(**_fields()).gate_outcome, "pass")
+
+    def test_new_version_changes_rules_without_code(self) -> None:
+        document = copy.deepcopy(self.document)
+        document["policy_version"] = "gate-policy/v2"
+        document["rules"].append(
+            {
+                "id": "what.budget.cap",
+                "code": "FEASIBILITY_BLOCK",
+                "field": "what.budget",
+                "message": "Budget above community cap",
+                "when": {"op": "any", "of": [{"op": "gt", "path": "what.budget", "value": 500}]},
+            }
+        )
+        v2 = compile_gate_policy(document)
+        costly = _fields(what=What(category="service", description="d", budget=900, requirements=[]))
+
+        self.assertEqual(evaluate_dual_gate(**costly).gate_outcome, "pass")
+        gate = evaluate_dual_gate(**costly, policy=v2)
+        self.assertEqual((gate.gate_outcome, gate.policy_version), ("partial", "gate-policy/v2"))
+        self.assertEqual(gate.feasibility_blocks[0].message, "Budget above community cap")
+        unset = _fields(what=What(category="service", description="d", budget=None, requirements=[]))
+        self.assertEqual(evaluate_dual_gate(**unset, policy=v2).gate_outcome, "pass")
+
+        columns = GateColumns.from_fields([tuple(costly.values()), tuple(unset.values())])
+        self.assertEqual(
+            evaluate_dual_gate_batch(columns, policy=v2),
+            [evaluate_dual_gate(**costly, policy=v2), evaluate_dual_gate(**unset, policy=v2)],
+        )
+
+    def test_same_version_with_other_rules_keeps_its_own_signals(self) -> None:
+        document = copy.deepcopy(self.document)
+        document["rules"][0] = dict(document["rules"][0], code="POLICY_BLOCK", message="CUSTOM")
+        custom = compile_gate_policy(document)
+        anonymous = _fields(who=Who(user_id="", roles=["member"], reputation_ref="r"))
+
+        self.assertEqual(evaluate_dual_gate(**anonymous).missing_fields[0].message, "WHO user identity is required")
+        gate = evaluate_dual_gate(**anonymous, policy=custom)
+        self.assertEqual(([s.message for s in gate.policy_blocks], gate.missing_fields), (["CUSTOM"], []))
+
+    def test_identical_resubmission_hits_decision_cache(self) -> None:
+        policy = compile_gate_policy(self.document)
+        first = evaluate_dual_gate(**_fields(), policy=policy)
+        second = evaluate_dual_gate(**_fields(), policy=policy)
+        self.assertEqual(first, second)
+        self.assertIsNot(first.missing_fields, second.missing_fields)
+        info = policy.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_malformed_policies_are_rejected(self) -> None:
+        bad_rules = [
+            {"code": "MISSING_FIELD", "when": {"op": "empty", "path": "who.__class__"}},
+            {"code": "MISSING_FIELD", "when": {"op": "empty", "path": "who.user_id); import os; ("}},
+            {"code": "MISSING_FIELD", "when": {"op": "matches", "path": "who.user_id"}},
+            {"code": "MISSING_FIELD", "when": {"op": "all", "of": []}},
+            {"code": "NOT_A_CODE", "when": {"op": "empty", "path": "who.user_id"}},
+        ]
+        for rule in bad_rules:
+            with self.subTest(rule=rule), self.assertRaises(ValidationError):
+                compile_gate_policy({"policy_version": "x", "rules": [rule]})
+        with self.assertRaises(ValidationError):
+            compile_gate_policy({"rules": self.document["rules"]})
+
+    def test_default_policy_is_compiled_once(self) -> None:
+        self.assertIs(default_gate_policy(), default_gate_policy())
+        self.assertIn("def _decide(", default_gate_policy().source)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+
+from not_mainstreet import Orchestrator
+from not_mainstreet.errors import GitPublishError
+from not_mainstreet.git_publisher import GitPublisher
+
+
+def _git(cwd, *args) -> str:
+    return subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True, check=True).stdout
+
+
+@unittest.skipUnless(shutil.which("git"), "git not installed")
+class GitPublisherTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        base = Path(self.tmp.name)
+        self.remote = base / "remote.git"
+        self.worktree = base / "work"
+        _git(base, "init", "-q", "--bare", "-b", "main", str(self.remote))
+        self.publisher = GitPublisher(self.worktree, remote="origin")
+        self.publisher.ensure_repository()
+        _git(self.worktree, "remote", "add", "origin", str(self.remote))
+        self.cwd = os.getcwd()
+        os.chdir(self.worktree)
+
+    def tearDown(self) -> None:
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    @staticmethod
+    def _docs(n: int, title: str = "Doc"):
+        return [(f"doc-{i}", {"metadata": {"title": f"{title} {i}"}, "content": {"blocks": []}}) for i in range(n)]
+
+    def test_one_commit_per_batch_pushed_to_bare_remote(self) -> None:
+        (self.worktree / "notes.txt").write_text("staged by hand, not for publishing")
+        _git(self.worktree, "add", "notes.txt")
+        orch = Orchestrator()
+        stats = orch.process_many(self._docs(25), batch_size=10, on_batch=self.publisher)
+        orch.process_many(self._docs(25), batch_size=10, on_batch=self.publisher)  # unchanged replay
+        orch.close()
+
+        self.assertEqual(stats.batches, 3)
+        self.assertEqual(len(self.publisher.commits), 3)
+        self.assertEqual(_git(self.remote, "rev-list", "--count", "main").strip(), "3")
+        self.assertEqual(_git(self.remote, "rev-parse", "main").strip(), self.publisher.commits[-1].sha)
+        files = _git(self.remote, "ls-tree", "-r", "--name-only", "main").split()
+        self.assertEqual(len(files), 50)
+        self.assertIn("content/docs/doc-0.json", files)
+        self.assertIn("index/documents/doc-24-1.json", files)
+        self.assertNotIn("notes.txt", files)
+        # The real index tracks the published files and keeps the hand-staged one.
+        self.assertEqual(_git(self.worktree, "status", "--porcelain").splitlines(), ["A  notes.txt"])
+
+        message = _git(self.remote, "log", "-1", "--format=%B", "main")
+        self.assertTrue(message.startswith("publish: 5 document(s), 10 artifact(s) [feigenbuam,kantian_ivi]"))
+        self.assertIn("doc-20 v1 ", message)
+
+    def test_message_is_deterministic_and_unchanged_tree_is_not_committed(self) -> None:
+        orch = Orchestrator()
+        records = []
+        orch.process_many(self._docs(3), on_batch=lambda r, p: records.append((r, p)))
+        orch.close()
+        batch, paths = records[0]
+        self.assertEqual(self.publisher.message(paths, batch), self.publisher.message(paths, list(reversed(batch))))
+
+        first = self.publisher.commit(paths, batch)
+        self.assertIsNotNone(first)
+        self.assertIsNone(self.publisher.commit(paths, batch))
+        self.assertIsNone(first.parent)
+
+    def test_requires_the_branch_to_be_checked_out(self) -> None:
+        _git(self.worktree, "checkout", "-q", "-b", "drafts")
+        (self.worktree / "a.json").write_text("{}")
+        with self.assertRaises(GitPublishError):
+            self.publisher.commit({"kantian_ivi": [str(self.worktree / "a.json")]})
+
+    def test_rejects_paths_outside_worktree(self) -> None:
+        outside = Path(self.tmp.name) / "elsewhere.json"
+        outside.write_text("{}")
+        with self.assertRaises(GitPublishError):
+            self.publisher.commit({"kantian_ivi": [str(outside)]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,4 @@
-import shutil
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -72,10 +72,12 @@ class EventSpineTests(unittest.TestCase):
 
 
     def test_spine_persists_events_when_inside_db_configured(self) -> None:
-        data_root = Path("data")
-        if data_root.exists():
-            shutil.rmtree(data_root)
-        cfg = EngineDatabases(inside_path="data/test_spine_inside.db", outside_path="data/test_spine_outside.db")
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        data_root = Path(tmp.name)
+        cfg = EngineDatabases(
+            inside_path=str(data_root / "spine_inside.db"), outside_path=str(data_root / "spine_outside.db")
+        )
         initialize_databases(cfg)
 
         spine = EventSpine(inside_db_path=cfg.inside_path)
@@ -1,6 +1,12 @@
+import itertools
+import json
+import random
+import tempfile
 import unittest
 
-from not_mainstreet import build_density_certificate, quantize_location
+from not_mainstreet import build_density_certificate, build_density_certificates, quantize_location
+from not_mainstreet.errors import ValidationError
+from not_mainstreet.location_privacy import HAS_NUMPY, DensityIndex, DensityIndexes
 
 
 class LocationPrivacyTests(unittest.TestCase):
@@ -40,5 +46,109 @@ class LocationPrivacyTests(unittest.TestCase):
         self.assertEqual(cert.population_floor, 1)
 
 
+class DensityCertificateBatchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = random.Random(11)
+        self.peers = [(37.77 + rng.uniform(0, 0.02), -122.42 + rng.uniform(0, 0.02)) for _ in range(400)]
+        # Cell edges: at the equator 0.5 degrees of longitude is exactly one 55660 m cell.
+        self.peers += [(0.0, 0.5), (0.0, -0.5), (0.0, 0.49999999999), (0.5, 0.0)]
+        self.subjects = self.peers[::7] + [(37.9, -122.1), (0.0, 0.5), (-0.0, 0.0)]
+
+    def _assert_matches_scalar(self, use_numpy: bool) -> None:
+        for cell_size_m in (55660.0, 500.0, 120.0):
+            expected = [
+                build_density_certificate(lat, lon, self.peers, min_k=3, cell_size_m=cell_size_m, epoch_salt="e-1")
+                for lat, lon in self.subjects
+            ]
+            batch = build_density_certificates(
+                self.subjects, self.peers, min_k=3, cell_size_m=cell_size_m, epoch_salt="e-1", use_numpy=use_numpy
+            )
+            self.assertEqual(batch, expected)
+
+    def test_plain_loop_matches_scalar(self) -> None:
+        self._assert_matches_scalar(use_numpy=False)
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy not installed")
+    def test_numpy_matches_scalar(self) -> None:
+        self._assert_matches_scalar(use_numpy=True)
+
+    def test_validation_and_empty_input(self) -> None:
+        for use_numpy in itertools.compress([False, True], [True, HAS_NUMPY]):
+            with self.assertRaises(ValueError):
+                build_density_certificates(
+                    [(0, 0)], [(0, 181)], min_k=1, cell_size_m=500, epoch_salt="e", use_numpy=use_numpy
+                )
+            with self.assertRaises(ValueError):
+                build_density_certificates([], [], min_k=1, cell_size_m=0, epoch_salt="e", use_numpy=use_numpy)
+            self.assertEqual(build_density_certificates([], self.peers, min_k=1, cell_size_m=500, epoch_salt="e"), [])
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class DensityIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = _Clock()
+        self.index = DensityIndex(cell_size_m=500, epoch_salt="e-1", window_s=60, clock=self.clock)
+        rng = random.Random(5)
+        self.peers = {f"m-{i}": (37.77 + rng.uniform(0, 0.01), -122.42 + rng.uniform(0, 0.01)) for i in range(60)}
+        for member_id, (lat, lon) in self.peers.items():
+            self.index.join(member_id, lat, lon)
+
+    def _assert_matches_scalar(self, index: DensityIndex, peers: dict) -> None:
+        for member_id, (lat, lon) in list(peers.items())[:15]:
+            others = [point for other, point in peers.items() if other != member_id]
+            expected = build_density_certificate(lat, lon, others, min_k=5, cell_size_m=500, epoch_salt="e-1")
+            self.assertEqual(index.certificate(lat, lon, min_k=5, member_id=member_id), expected)
+        everyone = list(peers.values())
+        expected = build_density_certificate(37.775, -122.415, everyone, min_k=5, cell_size_m=500, epoch_salt="e-1")
+        self.assertEqual(index.certificate(37.775, -122.415, min_k=5), expected)
+
+    def test_certificates_match_scalar_builder(self) -> None:
+        self._assert_matches_scalar(self.index, self.peers)
+
+    def test_join_move_leave_and_expiry(self) -> None:
+        self.index.join("m-0", 40.0, -70.0)  # moved: counted once, in the new cell only
+        self.assertEqual(self.index.count(40.0, -70.0), 1)
+        self.assertEqual(len(self.index), 60)
+        self.assertTrue(self.index.leave("m-1"))
+        self.assertFalse(self.index.leave("m-1"))
+
+        self.clock.now += 30
+        self.index.join("m-2", *self.peers["m-2"])  # refreshed
+        self.clock.now += 45
+        self.assertEqual(len(self.index), 1)
+        self.assertEqual(self.index.count(*self.peers["m-2"]), 1)
+        self.assertEqual(self.index.certificate(40.0, -70.0, min_k=2).population_floor, 1)
+
+    def test_snapshot_restores_counts(self) -> None:
+        self.index.leave("m-3")
+        del self.peers["m-3"]
+        with tempfile.TemporaryDirectory() as tmp:
+            indexes = DensityIndexes(tmp, window_s=60, clock=self.clock)
+            self.index.save(indexes.path(*self.index.key))
+            self.assertNotIn("e-1", indexes.path(500, "e-1").name)
+
+            restored = DensityIndexes(tmp, window_s=60, clock=self.clock).get(500, "e-1")
+            self._assert_matches_scalar(restored, self.peers)
+            self.assertEqual(restored.snapshot(), self.index.snapshot())
+            text = indexes.path(500, "e-1").read_text()
+            self.assertNotIn("e-1", text)
+            self.assertNotIn("cells", json.loads(text))
+            commitments = {member[1] for member in json.loads(text)["members"]}
+            self.assertIn(self.index.certificate(*self.peers["m-0"], min_k=5).cell_commitment, commitments)
+            with self.assertRaises(ValidationError):
+                DensityIndex.load(indexes.path(500, "e-1"), epoch_salt="e-2")
+            fresh = DensityIndexes(tmp)
+            self.assertEqual(len(fresh.get(500, "e-2")), 0)
+            self.assertEqual(fresh.get(500, "e-1").window_s, fresh.window_s)  # configured, not the saved 60s
+            self.assertEqual(fresh.save_all(), 2)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,153 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from not_mainstreet.database import EngineDatabases
+from not_mainstreet.edge_proposal import What, When, Where, Who, Why, build_edge_proposal, proposal_to_dict
+from not_mainstreet.matching import ProposalMatcher, window_interval
+from not_mainstreet.portal import submit_edge_intake
+
+# quantize_location at 500 m: 0.0045 degrees of latitude is one cell.
+BASE_LAT, BASE_LON = 37.7700, -122.4200
+
+
+def _proposal(proposal_id, *, user="u", lat_cells=0, window="2026-03-02/2026-03-04", category="repair", tenant="t",
+              geo=None, service_area="mission", goal="help neighbors"):
+    proposal, _ = build_edge_proposal(
+        proposal_id=proposal_id,
+        tenant_id=tenant,
+        community_id="c",
+        session_id="s",
+        who=Who(user_id=user, roles=["member"], reputation_ref="r"),
+        why=Why(goal=goal, constraints=[], values=["care"], urgency="normal"),
+        what=What(category=category, description="fix bikes", budget=None, requirements=[]),
+        where=Where(
+            scope_level="block",
+            geo=geo if geo is not None else f"{BASE_LAT + 0.0045 * lat_cells:.6f},{BASE_LON}",
+            service_area=service_area,
+            constraints=[],
+        ),
+        when=When(window=window, trigger_conditions=[], deadline="2026-03-10"),
+        thread_ref="th",
+    )
+    return proposal
+
+
+class ProposalMatcherTests(unittest.TestCase):
+    def test_ranks_by_locality_and_window_overlap(self) -> None:
+        matcher = ProposalMatcher()
+        for proposal in (
+            _proposal("near-full", user="a"),
+            _proposal("near-third", user="b", window="2026-03-04/2026-03-08"),
+            _proposal("one-ring", user="c", lat_cells=1),
+            _proposal("too-far", user="d", lat_cells=5),
+            _proposal("no-overlap", user="e", window="2026-04-01/2026-04-02"),
+            _proposal("other-class", user="f", category="sale"),
+            _proposal("other-tenant", user="g", tenant="t2"),
+            _proposal("same-user", user="q"),
+        ):
+            self.assertTrue(matcher.add(proposal))
+        query = _proposal("query", user="q")
+        matcher.add(query)
+
+        matches = matcher.match("query", k=5)
+        self.assertEqual([m.proposal_id for m in matches], ["near-full", "one-ring", "near-third"])
+        self.assertEqual((matches[0].score, matches[0].ring), (1.0, 0))
+        self.assertEqual((matches[1].score, matches[1].ring), (0.5, 1))
+        self.assertEqual(matches[2].overlap, 0.333333)
+        self.assertEqual([m.proposal_id for m in matcher.match(query, k=1)], ["near-full"])
+
+    def test_incremental_updates(self) -> None:
+        matcher = ProposalMatcher()
+        matcher.add(_proposal("query", user="q"))
+        self.assertEqual(matcher.match("query"), [])
+
+        matcher.add(_proposal("late", user="a"))
+        self.assertEqual([m.proposal_id for m in matcher.match("query")], ["late"])
+        self.assertEqual(matcher.match("query", k=0), [])
+        self.assertEqual(matcher.match("query", k=-1), [])
+        matcher.add(_proposal("late", user="a", window="2026-05-01"))  # re-indexed with a new window
+        self.assertEqual(matcher.match("query"), [])
+
+        closed = proposal_to_dict(_proposal("closed", user="b"))
+        closed["status"] = "matched"
+        self.assertFalse(matcher.add(closed))
+        self.assertTrue(matcher.remove("late"))
+        self.assertFalse(matcher.remove("late"))
+        self.assertEqual(len(matcher), 1)
+        with self.assertRaises(KeyError):
+            matcher.match("missing")
+
+    def test_service_area_and_label_windows(self) -> None:
+        matcher = ProposalMatcher()
+        for proposal_id, user, area, window in (
+            ("q", "q", "Mission", "this-week"),
+            ("same", "a", "mission ", "This-Week"),
+            ("other-label", "b", "mission", "next-week"),
+            ("other-area", "c", "soma", "this-week"),
+        ):
+            matcher.add(proposal_to_dict(_proposal(proposal_id, user=user, geo="g1", service_area=area, window=window)))
+        self.assertEqual([(m.proposal_id, m.score) for m in matcher.match("q")], [("same", 1.0)])
+
+    def test_label_matches_are_capped_at_k_in_id_order(self) -> None:
+        matcher = ProposalMatcher()
+        matcher.add(_proposal("q", user="q", window="this-week"))
+        for i in reversed(range(50)):
+            matcher.add(_proposal(f"p-{i:02d}", user=f"u{i}", window="this-week", lat_cells=i % 2))
+        matcher.add(_proposal("p-00b", user="q", window="this-week"))  # same user, never a counterpart
+        found = []
+        bucket = matcher._buckets[matcher._by_id["q"][0]]
+        matcher._collect(bucket, matcher._by_id["q"][1], 1.0, 0, 3, found)
+        self.assertEqual([proposal_id for _, proposal_id, _, _ in found], ["p-00", "p-02", "p-04"])
+        self.assertEqual([m.proposal_id for m in matcher.match("q", k=3)], ["p-00", "p-02", "p-04"])
+        self.assertTrue(matcher.remove("p-00"))
+        self.assertEqual([m.proposal_id for m in matcher.match("q", k=2)], ["p-02", "p-04"])
+
+    def test_long_window_does_not_widen_short_lookups(self) -> None:
+        matcher = ProposalMatcher()
+        matcher.add(_proposal("q", user="q", window="2026-06-01/2026-06-02"))
+        matcher.add(_proposal("year", user="a", window="2026-01-01/2026-12-31"))
+        matcher.add(_proposal("short", user="b", window="2026-06-02"))
+        bucket = matcher._buckets[matcher._by_id["q"][0]]
+        self.assertEqual([e.proposal_id for e in bucket.long.entries], ["year"])
+        self.assertLessEqual(bucket.short.max_span, 2 * 86_400)
+        self.assertEqual({m.proposal_id for m in matcher.match("q")}, {"year", "short"})
+        matcher.remove("year")
+        self.assertEqual(bucket.long.max_span, 0.0)
+
+    def test_window_interval(self) -> None:
+        self.assertEqual(window_interval("2026-03-01")[1] - window_interval("2026-03-01")[0], 86_400)
+        start, end = window_interval("2026-03-01T10:00:00Z/2026-03-01T12:00:00+00:00")
+        self.assertEqual(end - start, 7200)
+        self.assertIsNone(window_interval("this-week"))
+        self.assertIsNone(window_interval("2026-03-05/2026-03-01"))
+
+    def test_from_database_indexes_gated_intake(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cfg = EngineDatabases(
+                inside_path=str(Path(tmp) / "inside.db"),
+                outside_path=str(Path(tmp) / "outside.db"),
+                search_path=str(Path(tmp) / "search.db"),
+            )
+            for proposal_id, user, values in (("p1", "a", ["care"]), ("p2", "b", ["care"]), ("p3", "c", [])):
+                submit_edge_intake(
+                    proposal_id=proposal_id,
+                    tenant_id="t",
+                    community_id="c",
+                    session_id="s",
+                    who={"user_id": user, "roles": ["member"], "reputation_ref": "r"},
+                    why={"goal": "g", "constraints": [], "values": values, "urgency": "normal"},
+                    what={"category": "repair", "description": "d", "budget": None, "requirements": []},
+                    where={"scope_level": "block", "geo": "37.77,-122.42", "service_area": "m", "constraints": []},
+                    when={"window": "2026-03-02", "trigger_conditions": [], "deadline": "2026-03-10"},
+                    thread_ref="th",
+                    cfg=cfg,
+                )
+            matcher = ProposalMatcher.from_database(cfg)
+        self.assertEqual(len(matcher), 2)
+        self.assertNotIn("p3", matcher)
+        self.assertEqual([m.proposal_id for m in matcher.match("p1")], ["p2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
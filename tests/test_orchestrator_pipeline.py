@@ -1,5 +1,7 @@
 import json
-import shutil
+import os
+import tempfile
+import time
 import unittest
 from pathlib import Path
 
@@ -8,11 +10,17 @@ from not_mainstreet.assets import AssetStore
 from not_mainstreet.docx_ingest import ingest_docx
 
 
-class OrchestratorPipelineTests(unittest.TestCase):
+class TempCwdTestCase(unittest.TestCase):
+    """Runs each test in a fresh temp directory, where the relative artifact roots land."""
+
     def setUp(self) -> None:
-        for path in [Path("content"), Path("index"), Path("assets")]:
-            if path.exists():
-                shutil.rmtree(path)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(tmp.name)
+
+
+class OrchestratorPipelineTests(TempCwdTestCase):
 
     def test_idempotent_reprocess_does_not_churn_version(self) -> None:
         orch = Orchestrator(mode="git")
@@ -51,7 +59,108 @@ class OrchestratorPipelineTests(unittest.TestCase):
         self.assertEqual(index_doc["document_id"], "doc-3")
 
 
-class IngestAndAssetTests(unittest.TestCase):
+class FanOutTests(TempCwdTestCase):
+    payload = {"metadata": {"title": "Fan-out"}, "content": {"blocks": []}}
+
+    def test_targets_publish_concurrently(self) -> None:
+        def slow(name: str):
+            def publish(record):
+                time.sleep(0.2)
+                return f"{name}/{record.document_id}"
+            return publish
+
+        orch = Orchestrator(publishers={"kantian_ivi": slow("k"), "feigenbuam": slow("f")})
+        started = time.perf_counter()
+        result = orch.process("doc-par", self.payload)
+        elapsed = time.perf_counter() - started
+        orch.close()
+
+        self.assertLess(elapsed, 0.35)
+        self.assertTrue(result.complete)
+        self.assertEqual(result.kantian_ivi_path, "k/doc-par")
+        self.assertGreaterEqual(result.targets["feigenbuam"].latency_ms, 200)
+
+    def test_failing_target_does_not_block_other_and_retries_independently(self) -> None:
+        calls = {"flaky": 0}
+
+        def broken(record):
+            raise OSError("disk full")
+
+        def flaky(record):
+            calls["flaky"] += 1
+            if calls["flaky"] == 1:
+                raise ConnectionError("transient")
+            return "index/ok.json"
+
+        orch = Orchestrator(publishers={"kantian_ivi": broken, "feigenbuam": flaky}, retry_backoff_s=0)
+        result = orch.process("doc-partial", self.payload)
+        orch.close()
+
+        kantian, feig = result.targets["kantian_ivi"], result.targets["feigenbuam"]
+        self.assertEqual((kantian.state, kantian.attempts), ("failed", 3))
+        self.assertIn("disk full", kantian.error)
+        self.assertEqual((feig.state, feig.attempts, feig.path), ("success", 2, "index/ok.json"))
+        self.assertIsNone(result.kantian_ivi_path)
+        self.assertFalse(result.complete)
+
+
+class ProcessManyTests(TempCwdTestCase):
+    @staticmethod
+    def _docs(n: int, title: str = "Doc"):
+        return [(f"doc-{i}", {"metadata": {"title": f"{title} {i}"}, "content": {"blocks": []}}) for i in range(n)]
+
+    def test_batches_write_artifacts_and_skip_unchanged(self) -> None:
+        orch = Orchestrator()
+        batches = []
+        first = orch.process_many(self._docs(25), batch_size=10, on_batch=lambda r, p: batches.append((r, p)))
+        replay = orch.process_many(self._docs(25), batch_size=10, on_batch=lambda r, p: batches.append((r, p)))
+        orch.close()
+
+        self.assertEqual((first.documents, first.published, first.unchanged, first.batches), (25, 25, 0, 3))
+        self.assertEqual((replay.documents, replay.published, replay.unchanged, replay.batches), (25, 0, 25, 0))
+        self.assertEqual([len(records) for records, _ in batches], [10, 10, 5])
+        paths = batches[0][1]
+        self.assertEqual(len(paths["kantian_ivi"]), 10)
+        self.assertEqual(json.loads(Path(paths["feigenbuam"][0]).read_text())["search"]["title"], "Doc 0")
+
+    def test_matches_single_document_processing(self) -> None:
+        docs = self._docs(5) + [("doc-1", {"metadata": {"title": "Changed"}, "content": {"blocks": []}})]
+        batched, single = Orchestrator(), Orchestrator()
+        batched.process_many(docs, batch_size=2, hash_workers=2)
+        for document_id, payload in docs:
+            single.process(document_id, payload)
+        batched.close()
+        single.close()
+
+        for document_id, _ in docs:
+            a, b = batched.registry.latest(document_id), single.registry.latest(document_id)
+            self.assertEqual((a.version, a.cdm_hash), (b.version, b.cdm_hash))
+        self.assertEqual(batched.registry.latest("doc-1").version, 2)
+
+    def test_failed_batch_is_republished_on_replay(self) -> None:
+        calls = {"n": 0}
+
+        def flaky_many(records):
+            calls["n"] += 1
+            if calls["n"] <= 3:
+                raise OSError("index unavailable")
+            return [r.document_id for r in records]
+
+        orch = Orchestrator(
+            batch_publishers={"kantian_ivi": lambda rs: [r.document_id for r in rs], "feigenbuam": flaky_many},
+            retry_backoff_s=0,
+        )
+        failed = orch.process_many(self._docs(4))
+        retried = orch.process_many(self._docs(4))
+        again = orch.process_many(self._docs(4))
+        orch.close()
+
+        self.assertEqual((failed.failed, failed.target_failures), (4, {"feigenbuam": 4}))
+        self.assertEqual((retried.published, retried.unchanged), (4, 0))
+        self.assertEqual((again.published, again.unchanged), (0, 4))
+
+
+class IngestAndAssetTests(TempCwdTestCase):
     def test_docx_ingest_and_asset_store(self) -> None:
         sample = b"fake docx bytes"
         ingested = ingest_docx("MainStreet_Updated.docx", sample)
@@ -62,7 +171,8 @@ class IngestAndAssetTests(unittest.TestCase):
         a1 = store.put(sample)
         a2 = store.put(sample)
         self.assertEqual(a1, a2)
-        self.assertTrue(Path("assets", a1).exists())
+        self.assertTrue(store.path_for(a1).exists())
+        self.assertEqual(store.path_for(a1).relative_to(store.root).parts[:2], (a1[:2], a1[2:4]))
 
 
 if __name__ == "__main__":
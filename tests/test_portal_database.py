@@ -1,28 +1,33 @@
 import json
-import shutil
+import tempfile
 import unittest
 from pathlib import Path
 
 from not_mainstreet.database import EngineDatabases, initialize_databases, run_query
+from not_mainstreet.errors import ConcurrencyConflict, ValidationError
 from not_mainstreet.portal import (
     Submission,
     list_edge_intake,
+    list_proposals_by_status,
     list_unprocessed,
+    proposal_history,
     render_portal_html,
     submit_edge_intake,
     submit_to_portal,
     sync_submission_to_engine,
+    transition_proposal_status,
 )
+from not_mainstreet.search import SearchIndex
 
 
 class PortalDatabaseTests(unittest.TestCase):
     def setUp(self) -> None:
-        self.data_root = Path("data")
-        if self.data_root.exists():
-            shutil.rmtree(self.data_root)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
         self.cfg = EngineDatabases(
-            inside_path="data/test_inside_ivi.db",
-            outside_path="data/test_outside_portal.db",
+            inside_path=str(Path(self.tmp.name) / "inside_ivi.db"),
+            outside_path=str(Path(self.tmp.name) / "outside_portal.db"),
+            search_path=str(Path(self.tmp.name) / "search.db"),
         )
         initialize_databases(self.cfg)
 
@@ -78,6 +83,78 @@ class PortalDatabaseTests(unittest.TestCase):
         rows = run_query(self.cfg.outside_path, "SELECT COUNT(*) AS c FROM edge_proposals")
         self.assertEqual(rows[0]["c"], 1)
 
+    def test_resubmission_and_transitions_are_versioned_and_logged(self) -> None:
+        first = submit_edge_intake(**self._intake_payload(), expected_version=0, cfg=self.cfg)
+        self.assertEqual(first["proposal"]["proposal_version"], 1)
+        with self.assertRaises(ConcurrencyConflict):
+            submit_edge_intake(**self._intake_payload(), expected_version=0, cfg=self.cfg)
+
+        payload = self._intake_payload()
+        payload["what"] = dict(payload["what"], description="deliver food and medicine")
+        second = submit_edge_intake(**payload, expected_version=1, cfg=self.cfg)
+        self.assertEqual(second["proposal"]["proposal_version"], 2)
+
+        moved = transition_proposal_status("prop-1", "matched", self.cfg, expected_version=2)
+        self.assertEqual((moved["status"], moved["proposal_version"]), ("matched", 3))
+        with self.assertRaises(ConcurrencyConflict):
+            transition_proposal_status("prop-1", "scheduled", self.cfg, expected_version=2)
+        with self.assertRaises(ValidationError):
+            transition_proposal_status("prop-1", "gated", self.cfg)
+        with self.assertRaises(ValidationError):
+            submit_edge_intake(**payload, cfg=self.cfg)  # matched proposals are no longer resubmittable
+
+        history = proposal_history("prop-1", self.cfg)
+        self.assertEqual(
+            [(h["proposal_version"], h["event_type"], h["from_status"], h["to_status"]) for h in history],
+            [(1, "submitted", None, "gated"), (2, "resubmitted", "gated", "gated"), (3, "status_changed", "gated", "matched")],
+        )
+        self.assertEqual(history[1]["payload"]["what"]["description"], "deliver food and medicine")
+        self.assertIsNone(history[2]["payload"])
+
+        row = list_edge_intake(self.cfg, tenant_id="tenant-a", status="matched")[0]
+        self.assertEqual((row["proposal_version"], row["payload"]["status"]), (3, "matched"))
+        self.assertEqual(row["created_at"], first["proposal"]["created_at"])
+
+    def test_resubmission_keeps_key_and_tenant(self) -> None:
+        payload = self._intake_payload()
+        payload["idempotency_key"] = "idem-1"
+        submit_edge_intake(**payload, cfg=self.cfg)
+        resubmit = self._intake_payload()
+        resubmit["what"] = dict(resubmit["what"], description="deliver food and medicine")
+        submit_edge_intake(**resubmit, cfg=self.cfg)  # no key: the stored one is kept
+        self.assertTrue(submit_edge_intake(**payload, cfg=self.cfg)["idempotent_replay"])
+
+        other = dict(resubmit, tenant_id="tenant-b")
+        with self.assertRaises(ValidationError):
+            submit_edge_intake(**other, cfg=self.cfg)
+        rows = run_query(self.cfg.outside_path, "SELECT tenant_id, proposal_version FROM edge_proposals")
+        self.assertEqual([(r["tenant_id"], r["proposal_version"]) for r in rows], [("tenant-a", 2)])
+
+    def test_transition_reindexes_search(self) -> None:
+        search = SearchIndex(self.cfg.search_path)
+        submit_edge_intake(**self._intake_payload(), cfg=self.cfg, search=search)
+        transition_proposal_status("prop-1", "matched", self.cfg, search=search)
+        hit = search.search("deliver food", kind="proposal")[0]
+        self.assertEqual((hit.version, hit.meta["status"]), (2, "matched"))
+
+    def test_status_listing_uses_covering_index(self) -> None:
+        for i in range(3):
+            payload = self._intake_payload()
+            payload["proposal_id"] = f"prop-{i}"
+            submit_edge_intake(**payload, cfg=self.cfg)
+        transition_proposal_status("prop-1", "matched", self.cfg)
+
+        listed = list_proposals_by_status("tenant-a", "gated", self.cfg)
+        self.assertEqual(sorted(r["proposal_id"] for r in listed), ["prop-0", "prop-2"])
+        self.assertEqual(set(listed[0]), {"proposal_id", "proposal_version", "updated_at"})
+        plan = run_query(
+            self.cfg.outside_path,
+            "EXPLAIN QUERY PLAN SELECT proposal_id, proposal_version, updated_at FROM edge_proposals "
+            "WHERE tenant_id = ? AND status = ? ORDER BY updated_at DESC LIMIT 50",
+            ("tenant-a", "gated"),
+        )
+        self.assertIn("COVERING INDEX idx_edge_proposals_tenant_status", plan[0]["detail"])
+
     def test_render_portal_html(self) -> None:
         submit_to_portal(Submission("u3", "Bridge request", "Need coordination"), self.cfg)
         page = render_portal_html(self.cfg)
@@ -1,10 +1,13 @@
 import json
-import shutil
+import mmap
+import tempfile
 import threading
 import unittest
 from http.client import HTTPConnection
 from pathlib import Path
+from unittest import mock
 
+from not_mainstreet.assets import AssetStore
 from not_mainstreet.database import EngineDatabases
 from not_mainstreet.portal_server import PortalServerConfig, run_portal_server
 
@@ -12,15 +15,18 @@ from not_mainstreet.portal_server import PortalServerConfig, run_portal_server
 class PortalServerTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls) -> None:
-        if Path("data").exists():
-            shutil.rmtree("data")
+        cls.tmp = tempfile.TemporaryDirectory()
+        root = Path(cls.tmp.name)
+        cls.assets_root = str(root / "assets")
         cfg = PortalServerConfig(
             host="127.0.0.1",
             port=8766,
             databases=EngineDatabases(
-                inside_path="data/test_inside_http.db",
-                outside_path="data/test_outside_http.db",
+                inside_path=str(root / "inside_http.db"),
+                outside_path=str(root / "outside_http.db"),
+                search_path=str(root / "search.db"),
             ),
+            assets_root=cls.assets_root,
         )
         cls.server = run_portal_server(cfg)
         cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
@@ -30,11 +36,12 @@ class PortalServerTests(unittest.TestCase):
     def tearDownClass(cls) -> None:
         cls.server.shutdown()
         cls.server.server_close()
+        cls.tmp.cleanup()
 
-    def _request(self, method: str, path: str, payload: dict | None = None):
+    def _request(self, method: str, path: str, payload: dict | None = None, headers: dict | None = None):
         conn = HTTPConnection("127.0.0.1", 8766, timeout=5)
         body = None
-        headers = {}
+        headers = dict(headers or {})
         if payload is not None:
             body = json.dumps(payload)
             headers["Content-Type"] = "application/json"
@@ -42,6 +49,7 @@ class PortalServerTests(unittest.TestCase):
         resp = conn.getresponse()
         raw = resp.read()
         conn.close()
+        self.last_headers = dict(resp.getheaders())
         return resp.status, raw
 
     def test_submit_list_and_sync_via_http(self) -> None:
@@ -126,6 +134,97 @@ class PortalServerTests(unittest.TestCase):
         self.assertEqual(listed["offset"], 0)
         self.assertTrue(any(p["proposal_id"] == "prop-http-1" for p in listed["proposals"]))
 
+    def test_search_endpoint_finds_intake_proposals(self) -> None:
+        payload = self._intake_payload()
+        payload.update(proposal_id="prop-search-1", idempotency_key="idem-search-1")
+        payload["what"] = dict(payload["what"], description="repair community bicycles")
+        self._request("POST", "/api/intake", payload)
+
+        status, raw = self._request("GET", "/api/search?q=bicycles&kind=proposal")
+        self.assertEqual(status, 200)
+        hits = json.loads(raw.decode("utf-8"))["hits"]
+        self.assertEqual([h["ref_id"] for h in hits], ["prop-search-1"])
+        self.assertEqual(hits[0]["snippet"], "repair community [bicycles]")
+
+        status, _ = self._request("GET", "/api/search")
+        self.assertEqual(status, 400)
+        for requested, served in (("0", 1), ("-5", 1), ("1000", 100)):
+            status, raw = self._request("GET", f"/api/search?q=bicycles&limit={requested}")
+            self.assertEqual((status, json.loads(raw.decode("utf-8"))["limit"]), (200, served))
+        status, _ = self._request("GET", "/api/search?q=bicycles&limit=ten")
+        self.assertEqual(status, 400)
+
+    def test_matches_endpoint_pairs_new_intake(self) -> None:
+        for proposal_id, user_id in (("prop-match-1", "u-match-1"), ("prop-match-2", "u-match-2")):
+            payload = self._intake_payload()
+            payload.update(proposal_id=proposal_id, tenant_id="tenant-match", idempotency_key=f"idem-{proposal_id}")
+            payload["who"] = dict(payload["who"], user_id=user_id)
+            self._request("POST", "/api/intake", payload)
+
+        status, raw = self._request("GET", "/api/matches?proposal_id=prop-match-1&k=5")
+        self.assertEqual(status, 200)
+        body = json.loads(raw.decode("utf-8"))
+        self.assertEqual([(m["proposal_id"], m["score"]) for m in body["matches"]], [("prop-match-2", 1.0)])
+
+        status, _ = self._request("GET", "/api/matches?proposal_id=missing")
+        self.assertEqual(status, 404)
+        for k in ("0", "-3", "101", "five"):
+            status, _ = self._request("GET", f"/api/matches?proposal_id=prop-match-1&k={k}")
+            self.assertEqual(status, 400, k)
+        status, _ = self._request("GET", "/api/matches")
+        self.assertEqual(status, 400)
+
+    def test_status_transition_endpoint(self) -> None:
+        payload = self._intake_payload()
+        payload.update(proposal_id="prop-status-1", tenant_id="tenant-status", idempotency_key="idem-status-1")
+        self._request("POST", "/api/intake", payload)
+
+        status, raw = self._request(
+            "POST", "/api/intake/status", {"proposal_id": "prop-status-1", "status": "matched", "expected_version": 1}
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(raw.decode("utf-8"))["proposal"]["proposal_version"], 2)
+        status, _ = self._request(
+            "POST", "/api/intake/status", {"proposal_id": "prop-status-1", "status": "scheduled", "expected_version": 1}
+        )
+        self.assertEqual(status, 409)
+        status, _ = self._request("POST", "/api/intake/status", {"proposal_id": "prop-status-1", "status": "gated"})
+        self.assertEqual(status, 400)
+
+    def test_asset_route_serves_immutable_content(self) -> None:
+        digest = AssetStore(self.assets_root).put(b"0123456789")
+
+        status, raw = self._request("GET", f"/assets/{digest}")
+        self.assertEqual((status, raw), (200, b"0123456789"))
+        self.assertEqual(self.last_headers["ETag"], f'"{digest}"')
+        self.assertIn("immutable", self.last_headers["Cache-Control"])
+
+        status, raw = self._request("GET", f"/assets/{digest}", headers={"If-None-Match": f'"{digest}"'})
+        self.assertEqual((status, raw), (304, b""))
+
+        status, raw = self._request("GET", f"/assets/{digest}", headers={"Range": "bytes=2-4"})
+        self.assertEqual((status, raw), (206, b"234"))
+        self.assertEqual(self.last_headers["Content-Range"], "bytes 2-4/10")
+
+        status, _ = self._request("GET", f"/assets/{'f' * 64}")
+        self.assertEqual(status, 404)
+
+    def test_asset_route_closes_mapped_bodies(self) -> None:
+        content = bytes(range(256)) * 2048  # 512 KiB: above the store's in-memory cache item size
+        digest = AssetStore(self.assets_root).put(content)
+        served = []
+        get = AssetStore.get
+
+        def tracking_get(store, asset_id):
+            served.append(get(store, asset_id))
+            return served[-1]
+
+        with mock.patch.object(AssetStore, "get", tracking_get):
+            status, raw = self._request("GET", f"/assets/{digest}")
+        self.assertEqual((status, raw), (200, content))
+        self.assertIsInstance(served[0], mmap.mmap)
+        self.assertTrue(served[0].closed)
+
     def test_root_html(self) -> None:
         status, raw = self._request("GET", "/")
         self.assertEqual(status, 200)
@@ -0,0 +1,189 @@
+import random
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from not_mainstreet import Orchestrator
+from not_mainstreet.cdm import CDMRecord
+from not_mainstreet.errors import ConcurrencyConflict
+from not_mainstreet.publish_queue import PublishQueue, PublishWorkerPool
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _record(document_id: str, version: int = 1) -> CDMRecord:
+    return CDMRecord(document_id, version, {"metadata": {"title": document_id}}, f"hash-{document_id}-{version}")
+
+
+class PublishQueueTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = str(Path(self.tmp.name) / "queue.db")
+        self.clock = FakeClock()
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def _queue(self, **kwargs) -> PublishQueue:
+        kwargs.setdefault("rng", random.Random(7))
+        return PublishQueue(self.path, clock=self.clock, **kwargs)
+
+    def test_enqueue_is_idempotent_per_target_and_version(self) -> None:
+        queue = self._queue()
+        self.assertEqual(len(queue.enqueue(_record("a"), ["k", "f"])), 2)
+        self.assertEqual(queue.enqueue(_record("a"), ["k", "f"]), [])
+        self.assertEqual(len(queue.enqueue(_record("a", 2), ["k"])), 1)
+        self.assertEqual(queue.counts(), {"pending": 3})
+
+    def test_failure_backs_off_with_jitter_then_dies(self) -> None:
+        queue = self._queue(max_attempts=3, backoff_base_s=1.0, jitter=0.5)
+        queue.enqueue(_record("a"), ["k"])
+
+        job = queue.claim()
+        self.assertEqual((job.attempts, job.state), (1, "in_flight"))
+        self.assertEqual(queue.fail(job, "ConnectionError: reset"), "pending")
+        delay = queue.jobs("k", "a")[0].next_attempt_at - self.clock.now
+        self.assertTrue(1.0 <= delay <= 1.5, delay)
+        self.assertIsNone(queue.claim())
+
+        self.clock.now += 2
+        job = queue.claim()
+        self.assertEqual(queue.fail(job, "again"), "pending")
+        delay = queue.jobs("k", "a")[0].next_attempt_at - self.clock.now
+        self.assertTrue(2.0 <= delay <= 3.0, delay)
+
+        self.clock.now += 10
+        self.assertEqual(queue.fail(queue.claim(), "final"), "dead")
+        self.assertEqual(queue.jobs("k", "a")[0].last_error, "final")
+        self.assertEqual(queue.cursor("k").last_job_id, 1)
+
+    def test_expired_lease_returns_job_and_cursor_marks_settled_prefix(self) -> None:
+        queue = self._queue(lease_s=60)
+        for doc in ("a", "b", "c"):
+            queue.enqueue(_record(doc), ["k"])
+        first, second = queue.claim(), queue.claim()
+        queue.ack(second)
+        self.assertIsNone(queue.cursor("k"))  # job 1 still in flight
+
+        # Another process opening the queue must not steal a job that is still leased.
+        restarted = self._queue(lease_s=60)
+        self.assertEqual(restarted.counts("k"), {"in_flight": 1, "pending": 1, "done": 1})
+        self.assertEqual(restarted.recover(), 0)
+        self.assertEqual(restarted.claim().document_id, "c")
+
+        self.clock.now += 61  # simulated crash: job 1 was never acknowledged
+        job = restarted.claim()
+        self.assertEqual(job.job_id, first.job_id)
+        with self.assertRaises(ConcurrencyConflict):
+            queue.fail(first, "late worker")  # its lease is gone; it must not reset the job
+        restarted.ack(job)
+        with self.assertRaises(ConcurrencyConflict):
+            queue.ack(first)
+        cursor = restarted.cursor("k")
+        self.assertEqual((cursor.last_job_id, cursor.document_id), (2, "b"))
+
+    def test_versions_of_a_document_publish_in_order(self) -> None:
+        queue = self._queue(backoff_base_s=1.0, jitter=0)
+        queue.enqueue(_record("a", 1), ["k"])
+        queue.enqueue(_record("a", 2), ["k"])
+        queue.enqueue(_record("b", 1), ["k"])
+
+        v1 = queue.claim()
+        self.assertEqual((v1.document_id, v1.version), ("a", 1))
+        other = queue.claim()
+        self.assertEqual(other.document_id, "b")  # a@2 waits while a@1 is in flight
+        self.assertIsNone(queue.claim())
+        queue.ack(other)
+        queue.fail(v1, "down")
+        self.assertIsNone(queue.claim())  # ...and while a@1 backs off
+
+        self.clock.now += 1
+        queue.ack(queue.claim())
+        v2 = queue.claim()
+        self.assertEqual(v2.version, 2)
+        queue.ack(v2)
+
+        queue.enqueue(_record("c", 2), ["k"])
+        queue.ack(queue.claim())
+        queue.enqueue(_record("c", 1), ["k"])  # arrives after c@2 was published
+        self.assertIsNone(queue.claim())
+        self.assertEqual(queue.jobs("k", "c")[1].state, "superseded")
+        self.assertEqual(queue.cursor("k").last_job_id, 5)
+
+    def test_replay_lane_shares_claims_with_ingest(self) -> None:
+        queue = self._queue(max_attempts=1, replay_every=3)
+        for i in range(3):
+            queue.enqueue(_record(f"old-{i}"), ["k"])
+            queue.fail(queue.claim(), "down")
+        self.assertEqual(queue.replay("k"), 3)
+        self.assertEqual(queue.replay("k"), 0)  # already pending on the replay lane
+        for i in range(6):
+            queue.enqueue(_record(f"new-{i}"), ["k"])
+
+        lanes = [queue.claim().lane for _ in range(6)]
+        self.assertEqual(lanes.count("replay"), 2)
+        self.assertEqual(lanes[:3], ["ingest", "ingest", "replay"])
+
+
+class WorkerPoolTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = str(Path(self.tmp.name) / "queue.db")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_orchestrator_enqueue_and_threaded_workers(self) -> None:
+        published = []
+        lock = threading.Lock()
+
+        def publisher(name):
+            def publish(record):
+                with lock:
+                    published.append((name, record.document_id, record.version))
+                return f"{name}/{record.document_id}"
+            return publish
+
+        orch = Orchestrator(
+            publishers={"kantian_ivi": publisher("k"), "feigenbuam": publisher("f")},
+            queue=PublishQueue(self.path),
+        )
+        for i in range(20):
+            orch.enqueue(f"doc-{i}", {"metadata": {"title": str(i)}})
+        pool = orch.workers(workers=3, poll_interval_s=0.01)
+        pool.start()
+        try:
+            for _ in range(200):
+                if orch.queue.counts().get("done") == 40:
+                    break
+                threading.Event().wait(0.02)
+        finally:
+            pool.stop()
+            orch.close()
+
+        self.assertEqual(orch.queue.counts(), {"done": 40})
+        self.assertEqual(len(set(published)), 40)
+        self.assertEqual(orch.queue.cursor("feigenbuam").last_job_id, 40)
+
+    def test_drain_records_failures_without_blocking_other_target(self) -> None:
+        def broken(record):
+            raise OSError("disk full")
+
+        queue = PublishQueue(self.path, max_attempts=1)
+        queue.enqueue(_record("a"), ["k", "f"])
+        pool = PublishWorkerPool(queue, {"k": broken, "f": lambda r: "ok"})
+        self.assertEqual(pool.drain(), 2)
+        self.assertEqual(queue.counts("k"), {"dead": 1})
+        self.assertEqual(queue.counts("f"), {"done": 1})
+        self.assertIn("disk full", queue.jobs("k", "a")[0].last_error)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from not_mainstreet import Orchestrator
+from not_mainstreet.cdm import CDMRecord
+from not_mainstreet.database import EngineDatabases
+from not_mainstreet.portal import submit_edge_intake
+from not_mainstreet.search import SearchIndex, match_expression
+
+
+def _payload(title: str, *sections: tuple[str, str]) -> dict:
+    blocks = []
+    for heading, text in sections:
+        blocks.append({"type": "heading", "heading_level": 1, "text": heading, "anchor": heading.lower()})
+        blocks.append({"block_id": f"b-{len(blocks)}", "type": "paragraph", "text": text})
+    return {"metadata": {"title": title}, "content": {"blocks": blocks}}
+
+
+class SearchIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.index = SearchIndex(str(Path(self.tmp.name) / "search.db"))
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_bm25_ranks_title_and_frequency(self) -> None:
+        self.index.index_record(CDMRecord("d1", 1, _payload("Plan", ("Bakery", "flour and ovens")), "h1"))
+        self.index.index_record(CDMRecord("d2", 1, _payload("Plan", ("Misc", "a bakery nearby, bread and more")), "h2"))
+        self.index.index_record(CDMRecord("d3", 1, _payload("Plan", ("Parks", "trees")), "h3"))
+
+        hits = self.index.search("bakery")
+        self.assertEqual([h.ref_id for h in hits], ["d1", "d2"])
+        self.assertGreater(hits[0].score, hits[1].score)
+        self.assertEqual(hits[0].meta["anchor"], "bakery")
+        self.assertIn("[bakery]", hits[1].snippet)
+        self.assertEqual(self.index.search("bakery bread")[0].ref_id, "d2")
+        self.assertEqual([h.ref_id for h in self.index.search("bak*")], ["d1", "d2"])
+        self.assertEqual(self.index.search('"); DROP TABLE'), [])
+
+    def test_new_version_touches_only_changed_chunks(self) -> None:
+        v1 = _payload("Plan", ("Costs", "ten dollars"), ("Timeline", "next week"))
+        v2 = _payload("Plan", ("Costs", "ten dollars"), ("Timeline", "next month"))
+        self.assertEqual(self.index.index_record(CDMRecord("d", 1, v1, "h1")), (2, 0))
+        self.assertEqual(self.index.index_record(CDMRecord("d", 2, v2, "h2")), (1, 1))
+        self.assertEqual(self.index.count("chunk"), 2)
+        self.assertEqual(self.index.search("week"), [])
+        self.assertEqual(self.index.search("month")[0].version, 2)
+        self.assertEqual(self.index.search("dollars")[0].version, 2)
+
+    def test_title_edit_retitles_unchanged_chunks(self) -> None:
+        sections = (("Costs", "ten dollars"), ("Timeline", "next week"))
+        self.index.index_record(CDMRecord("d", 1, _payload("Plan", *sections), "h1"))
+        self.assertEqual(self.index.index_record(CDMRecord("d", 2, _payload("Budget", *sections), "h2")), (2, 2))
+        self.assertEqual(self.index.search("dollars")[0].title, "Budget / Costs")
+        self.assertEqual(self.index.search("plan"), [])
+
+    def test_indexing_failure_does_not_fail_registration(self) -> None:
+        def broken(record):
+            raise OSError("disk full")
+
+        orch = Orchestrator(publishers={"kantian_ivi": lambda r: "k", "feigenbuam": lambda r: "f"}, search=self.index)
+        orch.registry.subscribe(broken)
+        result = orch.process("doc-b", _payload("Orchard", ("Harvest", "apples in autumn")))
+        orch.close()
+        self.assertEqual(orch.registry.latest("doc-b").version, 1)
+        self.assertEqual([(r.document_id, type(e)) for r, e in orch.registry.listener_errors], [("doc-b", OSError)])
+        self.assertEqual(self.index.search("apples")[0].ref_id, "doc-b")
+        self.assertTrue(result.complete)
+
+    def test_orchestrator_and_intake_update_index(self) -> None:
+        orch = Orchestrator(publishers={"kantian_ivi": lambda r: "k", "feigenbuam": lambda r: "f"}, search=self.index)
+        orch.process("doc-o", _payload("Orchard", ("Harvest", "apples in autumn")))
+        orch.close()
+        self.assertEqual(self.index.search("apples")[0].ref_id, "doc-o")
+
+        cfg = EngineDatabases(
+            inside_path=str(Path(self.tmp.name) / "inside.db"),
+            outside_path=str(Path(self.tmp.name) / "outside.db"),
+            search_path=self.index.path,
+        )
+        submit_edge_intake(
+            proposal_id="prop-s",
+            tenant_id="tenant-s",
+            community_id="c",
+            session_id="s",
+            who={"user_id": "u", "roles": ["member"], "reputation_ref": "rep:1"},
+            why={"goal": "keep seniors warm", "constraints": [], "values": ["care"], "urgency": "normal"},
+            what={"category": "service", "description": "winter blanket drive", "budget": 5.0, "requirements": []},
+            where={"scope_level": "block", "geo": "g1", "service_area": "s1", "constraints": []},
+            when={"window": "week-1", "trigger_conditions": [], "deadline": "2026-03-01"},
+            thread_ref="t",
+            cfg=cfg,
+        )
+        hits = self.index.search("blanket", kind="proposal", tenant_id="tenant-s")
+        self.assertEqual([h.ref_id for h in hits], ["prop-s"])
+        self.assertEqual(self.index.search("seniors")[0].title, "winter blanket drive")
+        self.assertEqual(self.index.search("blanket", tenant_id="other"), [])
+
+    def test_near_universal_terms_still_have_to_match(self) -> None:
+        records = [CDMRecord(f"d{i}", 1, _payload("T", ("S", f"street note {i}")), f"h{i}") for i in range(8)]
+        records.append(CDMRecord("odd", 1, _payload("T", ("S", "lantern")), "ho"))
+        records.append(CDMRecord("lit", 1, _payload("T", ("S", "street lantern")), "hl"))
+        self.index.index_records(records)
+
+        self.assertEqual([h.ref_id for h in self.index.search("street lantern")], ["lit"])
+        self.assertEqual([h.ref_id for h in self.index.search("lantern street")], ["lit"])
+        self.assertEqual(len(self.index.search("lantern")), 2)
+        self.assertEqual(len(self.index.search("street", limit=20)), 9)
+        self.assertEqual(len(self.index.search("street note", limit=20)), 8)
+        self.assertEqual(self.index.search("street nowhere"), [])
+
+    def test_match_expression_quotes_terms(self) -> None:
+        self.assertEqual(match_expression('food "bank" co-op*'), '"food" "bank" "co" "op"*')
+        self.assertEqual(match_expression("  ()  "), "")
+
+    def test_query_latency_on_larger_index(self) -> None:
+        words = [f"w{i}" for i in range(500)]
+        records = [
+            CDMRecord(f"d{i}", 1, _payload("T", ("S", " ".join(words[(i * 7 + j) % 500] for j in range(30)))), f"h{i}")
+            for i in range(2000)
+        ]
+        self.index.index_records(records)
+        started = time.perf_counter()
+        hits = self.index.search("w42 w43", limit=10)
+        self.assertLess(time.perf_counter() - started, 0.05)
+        self.assertEqual(len(hits), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import json
+import unittest
+from dataclasses import asdict, dataclass, field
+
+from not_mainstreet.edge_proposal import (
+    What,
+    When,
+    Where,
+    Who,
+    Why,
+    build_edge_proposal,
+    evaluation_to_dict,
+    proposal_to_dict,
+)
+from not_mainstreet.serialization import compile_to_dict, dumps, dumps_bytes
+
+
+def _build(values, budget):
+    return build_edge_proposal(
+        proposal_id="p-ser",
+        tenant_id="t",
+        community_id="c",
+        session_id="s",
+        who=Who(user_id="u", roles=["member"], reputation_ref="r"),
+        why=Why(goal="help neighbors", constraints=[], values=values, urgency="normal"),
+        what=What(category="repair", description="fix bikes — café", budget=budget, requirements=["tools"]),
+        where=Where(scope_level="block", geo="37.77,-122.42", service_area="mission", constraints=[]),
+        when=When(window="2026-03-02", trigger_conditions=[], deadline="2026-03-10"),
+        thread_ref="th",
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class _Slotted:
+    name: str
+    tags: list[str]
+    extra: dict[str, list[int]] = field(default_factory=dict)
+
+
+class SerializationTests(unittest.TestCase):
+    def test_matches_asdict_and_json_dumps(self) -> None:
+        for values, budget in ((["care"], 12), ([], -5.0), (["care"], None), (["care"], float("nan"))):
+            proposal, evaluation = _build(values, budget)
+            payload = proposal_to_dict(proposal)
+            self.assertEqual(dumps(payload), json.dumps(asdict(proposal)))
+            self.assertEqual(dumps(evaluation_to_dict(evaluation)), json.dumps(asdict(evaluation)))
+            self.assertEqual(dumps_bytes(payload), json.dumps(asdict(proposal)).encode("utf-8"))
+
+    def test_output_does_not_alias_the_record(self) -> None:
+        proposal, evaluation = _build([], None)
+        payload = proposal_to_dict(proposal)
+        payload["who"]["roles"].append("admin")
+        payload["gate_results"]["policy_blocks"][0]["code"] = "changed"
+        self.assertEqual(proposal.who.roles, ["member"])
+        self.assertEqual(proposal.gate_results.policy_blocks[0].code, "POLICY_BLOCK")
+        self.assertIsNot(evaluation_to_dict(evaluation)["next_actions"], evaluation.next_actions)
+
+    def test_slotted_dataclass_and_fallback_deepcopy(self) -> None:
+        to_dict = compile_to_dict(_Slotted)
+        record = _Slotted("n", ["a"], {"k": [1]})
+        self.assertEqual(to_dict(record), {"name": "n", "tags": ["a"], "extra": {"k": [1]}})
+        self.assertIsNot(to_dict(record)["extra"]["k"], record.extra["k"])
+        with self.assertRaises(TypeError):
+            compile_to_dict(dict)
+
+
+if __name__ == "__main__":
+    unittest.main()